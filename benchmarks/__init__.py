@@ -0,0 +1,4 @@
+"""
+性能基准包
+包含各数据结构实现之间的内存与吞吐量对比脚本
+"""
\ No newline at end of file
@@ -0,0 +1,66 @@
+"""
+查找树存储布局对比：链式节点（AVLTree）与并行数组（ArenaTree）
+
+运行方式: python -m benchmarks.arena_tree [键个数]
+（例如 10000000 可以观察千万级键的内存占用，链式节点只在较小规模下对比）
+"""
+import random
+import sys
+import time
+import tracemalloc
+
+from model.avl_tree import AVLTree
+from model.arena_tree import ArenaTree
+
+LINKED_LIMIT = 2000000  # 链式节点的对比规模上限，避免内存不足
+
+
+def measure_bulk_load(factory, values):
+    """测量批量构建的内存（字节）和耗时（秒）；计时单独进行，不受 tracemalloc 影响"""
+    tree = factory()
+    start = time.perf_counter()
+    tree.bulk_load(values)
+    elapsed = time.perf_counter() - start
+    del tree
+
+    tracemalloc.start()
+    tree = factory()
+    tree.bulk_load(values)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return tree, current, elapsed
+
+
+def measure_updates(tree, operations, key_range):
+    """测量随机插入、查找、删除的耗时（秒）"""
+    rng = random.Random(42)
+    keys = [rng.randrange(key_range) for _ in range(operations)]
+    start = time.perf_counter()
+    for key in keys:
+        tree.insert(key)
+    for key in keys:
+        tree.search(key)
+    for key in keys:
+        tree.delete(key)
+    return time.perf_counter() - start
+
+
+def run(count=1000000, operations=100000):
+    # 键取较大整数，避免小整数缓存掩盖键对象本身的开销
+    values = range(10 ** 9, 10 ** 9 + count)
+
+    layouts = [("数组化AVL", ArenaTree)]
+    if count <= LINKED_LIMIT:
+        layouts.insert(0, ("链式AVL", AVLTree))
+
+    print(f"键个数: {count}, 随机插入+查找+删除: 各 {operations} 次")
+    print(f"{'布局':<12}{'内存(MB)':>12}{'字节/键':>10}{'批量构建(s)':>14}{'随机更新(s)':>14}")
+    for name, factory in layouts:
+        tree, memory, build_time = measure_bulk_load(factory, values)
+        update_time = measure_updates(tree, operations, 10 ** 9 + count)
+        print(f"{name:<12}{memory / 2 ** 20:>12.1f}{memory / count:>10.1f}"
+              f"{build_time:>14.2f}{update_time:>14.2f}")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
\ No newline at end of file
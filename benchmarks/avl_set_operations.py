@@ -0,0 +1,70 @@
+"""
+AVL树集合运算对比：基于 split/join 的并、交、差与逐个 insert/search/delete
+
+运行方式: python -m benchmarks.avl_set_operations [大树键个数]
+"""
+import random
+import sys
+import time
+
+from model.avl_tree import AVLTree
+
+
+def build(keys):
+    tree = AVLTree()
+    tree.bulk_load(keys)
+    return tree
+
+
+def union_by_insert(big, small_keys):
+    for key in small_keys:
+        if big.search(key) is None:
+            big.insert(key)
+
+
+def intersection_by_search(big, small_keys):
+    result = AVLTree()
+    result.bulk_load(key for key in small_keys if big.search(key) is not None)
+    return result
+
+
+def difference_by_delete(big, small_keys):
+    for key in small_keys:
+        while big.search(key) is not None:
+            big.delete(key)
+
+
+def timed(operation, big_keys, small_keys):
+    """建树不计时，只测量运算本身"""
+    big, small = build(big_keys), build(small_keys)
+    start = time.perf_counter()
+    operation(big, small, small_keys)
+    return time.perf_counter() - start
+
+
+OPERATIONS = [
+    ("并(join)", lambda big, small, keys: big.union(small)),
+    ("并(insert)", lambda big, small, keys: union_by_insert(big, keys)),
+    ("交(join)", lambda big, small, keys: big.intersection(small)),
+    ("交(search)", lambda big, small, keys: intersection_by_search(big, keys)),
+    ("差(join)", lambda big, small, keys: big.difference(small)),
+    ("差(delete)", lambda big, small, keys: difference_by_delete(big, keys)),
+]
+
+
+def run(count=200000):
+    rng = random.Random(42)
+    big_keys = list(range(0, 2 * count, 2))  # 偶数
+    print(f"大树键个数 n = {count}，单位: 秒")
+    print(f"{'小树 m':>10}" + "".join(f"{name:>12}" for name, _ in OPERATIONS))
+
+    m = 10
+    while m <= count:
+        small_keys = rng.sample(range(2 * count), m)  # 约一半与大树重合
+        times = [timed(operation, big_keys, small_keys) for _, operation in OPERATIONS]
+        print(f"{m:>10}" + "".join(f"{t:>12.4f}" for t in times))
+        m *= 10
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
\ No newline at end of file
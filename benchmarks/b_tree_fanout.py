@@ -0,0 +1,73 @@
+"""
+扇出对比：不同最小度数的 B树/B+树与 AVL 树在树高、查找和区间扫描上的差异，
+以及页式 B+树文件的流式构建与按页查找
+
+运行方式: python -m benchmarks.b_tree_fanout [键个数]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+from model.avl_tree import AVLTree
+from model.b_tree import BTree
+from model.b_plus_tree import BPlusTree
+from model.b_plus_page_file import BPlusPageFile
+
+
+def time_searches(tree, probes):
+    start = time.perf_counter()
+    for key in probes:
+        tree.search(key)
+    return time.perf_counter() - start
+
+
+def time_scans(tree, ranges):
+    start = time.perf_counter()
+    total = 0
+    for lo, hi in ranges:
+        for _ in tree.iter_range(lo, hi):
+            total += 1
+    return time.perf_counter() - start
+
+
+def run(count=200000):
+    rng = random.Random(42)
+    keys = rng.sample(range(count * 10), count)
+    probes = [rng.choice(keys) for _ in range(100000)]
+    ranges = [(lo, lo + 5000) for lo in (rng.randrange(count * 10) for _ in range(200))]
+
+    print(f"键数: {count}  查找次数: {len(probes)}  区间扫描: {len(ranges)} 次（每次宽度 5000）")
+    print(f"{'结构':<14}{'树高':>6}{'装载(s)':>10}{'查找(s)':>10}{'扫描(s)':>10}")
+    candidates = [("AVL", AVLTree)]
+    for t in (2, 16, 64):
+        candidates.append((f"B树 t={t}", lambda t=t: BTree(t)))
+        candidates.append((f"B+树 t={t}", lambda t=t: BPlusTree(t)))
+
+    for label, factory in candidates:
+        tree = factory()
+        start = time.perf_counter()
+        tree.bulk_load(keys)
+        load = time.perf_counter() - start
+        search = time_searches(tree, probes)
+        scan = time_scans(tree, ranges)
+        height = tree.get_height(tree.root) if isinstance(tree, AVLTree) else tree.get_height()
+        print(f"{label:<14}{height:>6}{load:>10.2f}{search:>10.2f}{scan:>10.2f}")
+
+    # 页文件：键流式写出，查找只读取根到叶子的一条路径
+    path = os.path.join(tempfile.gettempdir(), "b_tree_fanout.bpt")
+    start = time.perf_counter()
+    BPlusPageFile.build(path, range(0, count * 10, 10))
+    build = time.perf_counter() - start
+    with BPlusPageFile(path) as page_file:
+        search = time_searches(page_file, probes)
+        scan = time_scans(page_file, ranges)
+        print(f"{'B+树页文件':<14}{page_file.get_height():>6}{build:>10.2f}{search:>10.2f}{scan:>10.2f}")
+        print(f"页大小 {page_file.page_size} 字节，t = {page_file.min_degree}，"
+              f"文件 {os.path.getsize(path) / 1024 / 1024:.1f} MB")
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
\ No newline at end of file
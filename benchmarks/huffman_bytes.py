@@ -0,0 +1,48 @@
+"""
+哈夫曼编码输出形式：'0'/'1' 字符串与按位打包字节串在耗时和体积上的对比
+
+运行方式: python -m benchmarks.huffman_bytes [字符数]
+"""
+import random
+import sys
+import time
+
+from model.huffman_tree import HuffmanTree
+
+
+def sample_text(count, rng):
+    """按英文字母大致频率生成文本，字母越靠前出现得越多"""
+    alphabet = " etaoinshrdlucmfwypvbgkjqxz\n"
+    weights = range(len(alphabet), 0, -1)
+    return "".join(rng.choices(alphabet, weights=weights, k=count))
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def run(count=5_000_000):
+    text = sample_text(count, random.Random(42))
+    original = len(text.encode('utf-8'))
+    tree = HuffmanTree()
+    _, build_time = timed(tree.build_from_text, text)
+    print(f"字符数: {count}  原文: {original} 字节  建树: {build_time:.2f}s")
+
+    bits, encode_time = timed(tree.encode, text)
+    decoded, decode_time = timed(tree.decode, bits)
+    assert decoded == text
+    print(f"{'输出形式':<12}{'体积(字节)':>14}{'压缩率':>10}{'编码(s)':>10}{'解码(s)':>10}")
+    print(f"{'0/1 字符串':<12}{len(bits):>14}{len(bits) / original:>10.2%}"
+          f"{encode_time:>10.2f}{decode_time:>10.2f}")
+
+    (packed, padding), encode_time = timed(tree.encode_bytes, text)
+    decoded, decode_time = timed(tree.decode_bytes, packed, padding)
+    assert decoded == text
+    print(f"{'按位打包':<12}{len(packed):>14}{len(packed) / original:>10.2%}"
+          f"{encode_time:>10.2f}{decode_time:>10.2f}")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000)
\ No newline at end of file
@@ -0,0 +1,58 @@
+"""
+哈夫曼解码吞吐：沿树逐位解码与多位查表解码（不同表宽）在同一打包输入上的对比
+
+除 256 个字符的字节流外，还对 1000、3000 个字符的大字母表各测一次，
+码长超过表宽时的子表构建时间也计入对比。
+
+运行方式: python -m benchmarks.huffman_decode [字符数]
+"""
+import random
+import sys
+import time
+
+from model.huffman_tree import HuffmanTree
+
+
+def sample_text(count, rng, symbols=256):
+    """按 Zipf 分布抽样；256 个字符时码长分布接近真实的字节流，更多时从汉字中取字符"""
+    base = 0 if symbols <= 256 else 0x4E00
+    alphabet = [chr(base + i) for i in range(symbols)]
+    weights = [1 / (rank + 1) ** 1.2 for rank in range(symbols)]
+    return "".join(rng.choices(alphabet, weights=weights, k=count))
+
+
+def run(count=2_000_000):
+    for symbols in (256, 1000, 3000):
+        run_alphabet(count, symbols)
+        print()
+
+
+def run_alphabet(count, symbols):
+    text = sample_text(count, random.Random(42), symbols)
+    tree = HuffmanTree()
+    tree.build_from_text(text)
+    packed, padding = tree.encode_bytes(text)
+    longest = max(len(code) for code in tree.codes.values())
+    print(f"字符数: {count}  字母表: {len(tree.codes)}  打包后: {len(packed)} 字节  最长码长: {longest}")
+    print(f"{'解码方式':<16}{'建表(s)':>10}{'解码(s)':>10}{'字符/秒':>14}")
+
+    start = time.perf_counter()
+    assert tree.decode_bytes(packed, padding, table=False) == text
+    elapsed = time.perf_counter() - start
+    print(f"{'逐位':<16}{'-':>10}{elapsed:>10.2f}{count / elapsed:>14,.0f}")
+
+    for table_bits in (8, 10, 12):
+        tree.DECODE_TABLE_BITS = table_bits
+        tree._decoder = None
+        start = time.perf_counter()
+        tree._get_decoder()
+        build_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        assert tree.decode_bytes(packed, padding) == text
+        elapsed = time.perf_counter() - start
+        print(f"{f'查表 {table_bits} 位':<16}{build_time:>10.3f}{elapsed:>10.2f}{count / elapsed:>14,.0f}")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000)
\ No newline at end of file
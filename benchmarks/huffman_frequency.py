@@ -0,0 +1,49 @@
+"""
+哈夫曼建树的频率统计：逐字符 dict.get 循环与 frequency 模块（NumPy bincount 或 Counter）的耗时对比
+
+运行方式: python -m benchmarks.huffman_frequency [字节数]
+"""
+import random
+import sys
+import time
+from collections import Counter
+
+from model import frequency
+
+
+def loop_count(text):
+    """原先 build_from_text 中的计数方式"""
+    result = {}
+    for char in text:
+        result[char] = result.get(char, 0) + 1
+    return result
+
+
+def timed(func, arg):
+    start = time.perf_counter()
+    result = func(arg)
+    return result, time.perf_counter() - start
+
+
+def run(count=10_000_000):
+    rng = random.Random(42)
+    data = bytes(rng.choices(range(128), weights=[1 / (i + 1) for i in range(128)], k=count))
+    text = data.decode('ascii')
+    backend = "NumPy bincount" if frequency.np is not None else "Counter（未安装 NumPy）"
+    print(f"字节数: {count}  计数后端: {backend}")
+
+    expected, baseline = timed(loop_count, text)
+    print(f"{'方式':<24}{'耗时(s)':>10}{'加速比':>10}")
+    print(f"{'逐字符 dict.get':<24}{baseline:>10.2f}{1:>10.1f}x")
+    for label, func, arg in (("Counter(str)", Counter, text),
+                             ("count_text", frequency.count_text, text),
+                             ("count_bytes", frequency.count_bytes, data)):
+        result, elapsed = timed(func, arg)
+        if func is frequency.count_bytes:
+            result = {chr(byte): n for byte, n in result.items()}
+        assert dict(result) == expected
+        print(f"{label:<24}{elapsed:>10.2f}{baseline / elapsed:>10.1f}x")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000)
\ No newline at end of file
@@ -0,0 +1,63 @@
+"""
+链表存储布局对比：节点链表（每个元素一个 Node 对象）与分块链表
+
+运行方式: python -m benchmarks.linked_list_layout [元素个数]
+"""
+import random
+import sys
+import time
+import tracemalloc
+
+from model.linked_list import LinkedList
+from model.unrolled_linked_list import UnrolledLinkedList
+
+
+def measure_memory(factory, values):
+    """测量构建链表所占用的内存（字节）"""
+    tracemalloc.start()
+    linked_list = factory()
+    linked_list.extend(values)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return linked_list, current
+
+
+def measure_throughput(linked_list, operations):
+    """测量遍历与按位置插入/删除的耗时（秒）"""
+    start = time.perf_counter()
+    linked_list.to_list()
+    traverse_time = time.perf_counter() - start
+
+    rng = random.Random(42)
+    start = time.perf_counter()
+    for _ in range(operations):
+        position = rng.randrange(linked_list.size)
+        linked_list.insert_at_position(position, position)
+        linked_list.delete_at_position(position)
+    update_time = time.perf_counter() - start
+
+    return traverse_time, update_time
+
+
+def run(count=1000000, operations=200):
+    # 使用大整数，避免小整数缓存掩盖元素本身的开销
+    values = list(range(10 ** 6, 10 ** 6 + count))
+
+    layouts = [
+        ("节点链表", LinkedList),
+        ("节点链表+跳表索引", lambda: LinkedList(indexed=True)),
+        ("分块链表(64)", UnrolledLinkedList),
+        ("分块链表(256)", lambda: UnrolledLinkedList(256)),
+    ]
+
+    print(f"元素个数: {count}, 随机按位置插入+删除: {operations} 次")
+    print(f"{'布局':<16}{'内存(MB)':>12}{'字节/元素':>12}{'遍历(s)':>12}{'按位置更新(s)':>16}")
+    for name, factory in layouts:
+        linked_list, memory = measure_memory(factory, values)
+        traverse_time, update_time = measure_throughput(linked_list, operations)
+        print(f"{name:<16}{memory / 2 ** 20:>12.1f}{memory / count:>12.1f}"
+              f"{traverse_time:>12.3f}{update_time:>16.3f}")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
\ No newline at end of file
@@ -0,0 +1,53 @@
+"""
+重复键负载：大量重复插入时，逐个建节点与计数节点（multiset）在节点数、树高和耗时上的差异
+
+运行方式: python -m benchmarks.multiset_duplicates [插入次数]
+"""
+import random
+import sys
+import time
+
+from model.avl_tree import AVLTree
+from model.binary_search_tree import BinarySearchTree
+
+
+def tree_stats(tree):
+    """返回 (节点数, 树高)，显式栈遍历避免递归过深"""
+    nodes = height = 0
+    stack = [(tree.root, 1)] if tree.root is not None else []
+    while stack:
+        node, depth = stack.pop()
+        nodes += 1
+        height = max(height, depth)
+        for child in (node.left, node.right):
+            if child is not None:
+                stack.append((child, depth + 1))
+    return nodes, height
+
+
+def run(count=20000, distinct=100):
+    rng = random.Random(42)
+    values = [rng.randrange(distinct) for _ in range(count)]
+    print(f"插入次数: {count}  不同键: {distinct}")
+    print(f"{'结构':<22}{'节点数':>8}{'树高':>8}{'插入(s)':>10}{'查找+删除(s)':>14}")
+    for label, factory in (("二叉搜索树", BinarySearchTree),
+                           ("二叉搜索树 multiset", lambda: BinarySearchTree(multiset=True)),
+                           ("AVL", AVLTree),
+                           ("AVL multiset", lambda: AVLTree(multiset=True))):
+        tree = factory()
+        start = time.perf_counter()
+        for value in values:
+            tree.insert(value)
+        insert_time = time.perf_counter() - start
+        nodes, height = tree_stats(tree)
+
+        start = time.perf_counter()
+        for value in values:
+            tree.search(value)
+            tree.delete(value)
+        remove_time = time.perf_counter() - start
+        print(f"{label:<22}{nodes:>8}{height:>8}{insert_time:>10.2f}{remove_time:>14.2f}")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
\ No newline at end of file
@@ -0,0 +1,61 @@
+"""
+再平衡开销对比：在相同的插入/删除序列上比较 AVL 树与红黑树的旋转、改色次数和耗时
+
+运行方式: python -m benchmarks.rebalancing_cost [操作次数]
+"""
+import random
+import sys
+import time
+
+from model.avl_tree import AVLTree
+from model.red_black_tree import RedBlackTree
+
+
+def make_streams(count):
+    """生成几种典型的操作序列：(名称, [(操作, 键), ...])"""
+    rng = random.Random(42)
+    random_keys = [rng.randrange(count * 10) for _ in range(count)]
+
+    mixed = []
+    live = []
+    for _ in range(count):
+        if live and rng.random() < 0.4:
+            mixed.append(('delete', live.pop(rng.randrange(len(live)))))
+        else:
+            key = rng.randrange(count * 10)
+            live.append(key)
+            mixed.append(('insert', key))
+
+    return [
+        ("顺序插入", [('insert', key) for key in range(count)]),
+        ("随机插入", [('insert', key) for key in random_keys]),
+        ("随机插入后全部删除", [('insert', key) for key in random_keys] +
+         [('delete', key) for key in random_keys]),
+        ("随机插入/删除混合", mixed),
+    ]
+
+
+def replay(tree, stream):
+    """在树上重放操作序列，返回耗时（秒）"""
+    start = time.perf_counter()
+    for operation, key in stream:
+        if operation == 'insert':
+            tree.insert(key)
+        else:
+            tree.delete(key)
+    return time.perf_counter() - start
+
+
+def run(count=100000):
+    print(f"每个序列的基础操作数: {count}")
+    print(f"{'序列':<14}{'结构':<8}{'旋转':>10}{'改色':>10}{'耗时(s)':>10}")
+    for name, stream in make_streams(count):
+        for label, factory in (("AVL", AVLTree), ("红黑树", RedBlackTree)):
+            tree = factory()
+            elapsed = replay(tree, stream)
+            recolors = getattr(tree, 'recolors', '-')
+            print(f"{name:<14}{label:<8}{tree.rotations:>10}{recolors:>10}{elapsed:>10.2f}")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
\ No newline at end of file
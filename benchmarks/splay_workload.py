@@ -0,0 +1,65 @@
+"""
+偏斜访问负载：在 Zipf 分布与均匀分布的查找序列上比较伸展树、AVL 树和二叉搜索树
+
+运行方式: python -m benchmarks.splay_workload [查找次数]
+"""
+import bisect
+import itertools
+import random
+import sys
+import time
+
+from model.avl_tree import AVLTree
+from model.binary_search_tree import BinarySearchTree
+from model.splay_tree import SplayTree
+
+
+def zipf_stream(keys, count, exponent, rng):
+    """按 Zipf 分布（第 i 热的键概率正比于 1/i^exponent）抽取查找序列"""
+    ranked = keys[:]
+    rng.shuffle(ranked)  # 热点键随机分布在键空间中
+    weights = [1.0 / (rank ** exponent) for rank in range(1, len(ranked) + 1)]
+    cumulative = list(itertools.accumulate(weights))
+    total = cumulative[-1]
+    return [ranked[bisect.bisect_left(cumulative, rng.random() * total)] for _ in range(count)]
+
+
+def make_streams(keys, count):
+    """生成查找序列：(名称, [键, ...])"""
+    rng = random.Random(42)
+    return [
+        ("均匀分布", [rng.choice(keys) for _ in range(count)]),
+        ("Zipf s=1.0", zipf_stream(keys, count, 1.0, rng)),
+        ("Zipf s=1.5", zipf_stream(keys, count, 1.5, rng)),
+    ]
+
+
+def build(factory, keys):
+    tree = factory()
+    for key in keys:
+        tree.insert(key)
+    if hasattr(tree, 'reset_counters'):
+        tree.reset_counters()
+    return tree
+
+
+def run(count=200000):
+    rng = random.Random(7)
+    keys = rng.sample(range(count * 10), min(count, 100000))
+    print(f"键数: {len(keys)}  每个序列查找次数: {count}")
+    print(f"{'序列':<12}{'结构':<10}{'耗时(s)':>10}{'每次(us)':>10}{'旋转':>12}")
+    for name, stream in make_streams(keys, count):
+        for label, factory in (("伸展树", SplayTree), ("AVL", AVLTree),
+                               ("二叉搜索树", BinarySearchTree)):
+            tree = build(factory, keys)
+            search = tree.search
+            start = time.perf_counter()
+            for key in stream:
+                search(key)
+            elapsed = time.perf_counter() - start
+            rotations = getattr(tree, 'rotations', '-')
+            print(f"{name:<12}{label:<10}{elapsed:>10.2f}{elapsed / count * 1e6:>10.2f}{rotations:>12}")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
\ No newline at end of file
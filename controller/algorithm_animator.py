@@ -190,7 +190,7 @@ class AlgorithmAnimator(QObject):
             if node is None:
                 return
 
-            node_id = node.data['id']
+            node_id = node.uid
             path.append(node_id)
 
             # 高亮当前访问的节点
@@ -198,10 +198,10 @@ class AlgorithmAnimator(QObject):
                 'type': 'highlight',
                 'node_ids': [node_id],
                 'color': QColor(255, 200, 100),  # 橙色
-                'description': f'访问节点 {node.data["value"]}'
+                'description': f'访问节点 {node.key}'
             })
 
-            if value == node.data['value']:
+            if value == node.key:
                 # 找到目标
                 steps.append({
                     'type': 'highlight',
@@ -210,16 +210,16 @@ class AlgorithmAnimator(QObject):
                     'description': f'找到目标值 {value}'
                 })
                 return True
-            elif value < node.data['value']:
+            elif value < node.key:
                 steps.append({
                     'type': 'message',
-                    'description': f'{value} < {node.data["value"]}, 转向左子树'
+                    'description': f'{value} < {node.key}, 转向左子树'
                 })
                 return search_steps(node.left, value, path)
             else:
                 steps.append({
                     'type': 'message',
-                    'description': f'{value} > {node.data["value"]}, 转向右子树'
+                    'description': f'{value} > {node.key}, 转向右子树'
                 })
                 return search_steps(node.right, value, path)
 
@@ -1,6 +1,9 @@
+from bisect import bisect_left, bisect_right
 from PyQt5.QtCore import QObject, QTimer, pyqtSignal
 from PyQt5.QtWidgets import QMessageBox
 from PyQt5.QtGui import QColor
+from model.unrolled_linked_list import UnrolledLinkedList
+from model.b_plus_tree import BPlusTree
 
 
 class UnifiedAnimationController(QObject):
@@ -77,6 +80,12 @@ class UnifiedAnimationController(QObject):
             steps = self._generate_bst_steps(operation_type, operation_data)
         elif operation_type.startswith('avl_'):
             steps = self._generate_avl_steps(operation_type, operation_data)
+        elif operation_type.startswith('rb_'):
+            steps = self._generate_rb_steps(operation_type, operation_data)
+        elif operation_type.startswith('splay_'):
+            steps = self._generate_splay_steps(operation_type, operation_data)
+        elif operation_type.startswith('btree_'):
+            steps = self._generate_btree_steps(operation_type, operation_data)
         elif operation_type.startswith('huffman_'):
             steps = self._generate_huffman_steps(operation_type, operation_data)
         
@@ -86,6 +95,9 @@ class UnifiedAnimationController(QObject):
         """生成链表操作的动画步骤"""
         steps = []
         ll = self.main_window.linked_list
+
+        if isinstance(ll, UnrolledLinkedList):
+            return self._generate_unrolled_list_steps(ll, operation_type, data)
         
         if operation_type == 'linked_list_insert_beginning':
             value = data.get('value')
@@ -121,32 +133,14 @@ class UnifiedAnimationController(QObject):
             
         elif operation_type == 'linked_list_insert_end':
             value = data.get('value')
-            # 步骤1：遍历到末尾
-            if ll.head:
-                current = ll.head
-                path = []
-                while current:
-                    path.append(id(current))
-                    if current.next:
-                        current = current.next
-                    else:
-                        break
-                if len(path) > 1:
-                    # 高亮路径中的节点（除了最后一个）
-                    steps.append({
-                        'type': 'highlight',
-                        'nodes': path[:-1],
-                        'color': QColor(200, 200, 255),
-                        'description': f'遍历链表到末尾'
-                    })
-                # 高亮最后一个节点
-                if path:
-                    steps.append({
-                        'type': 'highlight',
-                        'nodes': [path[-1]],
-                        'color': QColor(255, 200, 100),
-                        'description': f'到达链表末尾'
-                    })
+            # 步骤1：通过尾指针直接定位末尾
+            if ll.tail:
+                steps.append({
+                    'type': 'highlight',
+                    'nodes': [id(ll.tail)],
+                    'color': QColor(255, 200, 100),
+                    'description': f'通过尾指针定位链表末尾: {ll.tail.data}'
+                })
             # 步骤2：执行插入
             steps.append({
                 'type': 'execute',
@@ -246,6 +240,88 @@ class UnifiedAnimationController(QObject):
         
         return steps
     
+    def _generate_unrolled_list_steps(self, ll, operation_type, data):
+        """生成分块链表操作的动画步骤：逐块跳跃定位目标块"""
+        steps = []
+        actions = {
+            'linked_list_insert_beginning': 'insert_beginning',
+            'linked_list_insert_end': 'insert_end',
+            'linked_list_insert_position': 'insert_position',
+            'linked_list_delete_position': 'delete_position',
+            'linked_list_clear': 'clear',
+        }
+        action = actions.get(operation_type)
+        if action is None:
+            return steps
+
+        if action == 'clear':
+            steps.append({
+                'type': 'execute',
+                'action': 'clear',
+                'data': {},
+                'description': '清空分块链表'
+            })
+            return steps
+
+        is_insert = action != 'delete_position'
+        if action == 'insert_beginning':
+            position = 0
+        elif action == 'insert_end':
+            position = ll.size
+        else:
+            position = data.get('position')
+
+        # 逐块跳跃，记录经过的数据块
+        if ll.head is not None:
+            if is_insert and position == ll.size:
+                path = [ll.tail]
+                offset = len(ll.tail.items)
+                description = '通过尾块指针定位最后一个数据块'
+            else:
+                path = []
+                chunk = ll.head
+                offset = position
+                while offset >= len(chunk.items) and chunk.next is not None:
+                    path.append(chunk)
+                    offset -= len(chunk.items)
+                    chunk = chunk.next
+                path.append(chunk)
+                description = f'跳过 {len(path) - 1} 个数据块，位置 {position} 位于块内偏移 {offset}'
+
+            if len(path) > 1:
+                steps.append({
+                    'type': 'highlight',
+                    'nodes': [id(c) for c in path[:-1]],
+                    'color': QColor(200, 200, 255),
+                    'description': f'按块跳跃到位置 {position}'
+                })
+            target = path[-1]
+            if is_insert and len(target.items) >= ll.chunk_capacity:
+                description += '，数据块已满，插入时将对半拆分'
+            steps.append({
+                'type': 'highlight',
+                'nodes': [id(target)],
+                'color': QColor(255, 200, 100) if is_insert else QColor(255, 150, 150),
+                'description': description
+            })
+
+        if is_insert:
+            value = data.get('value')
+            steps.append({
+                'type': 'execute',
+                'action': action,
+                'data': {'value': value, 'position': position},
+                'description': f'在位置 {position} 插入元素: {value}'
+            })
+        else:
+            steps.append({
+                'type': 'execute',
+                'action': action,
+                'data': {'position': position},
+                'description': f'删除位置 {position} 的元素'
+            })
+        return steps
+
     def _generate_stack_steps(self, operation_type, data):
         """生成栈操作的动画步骤"""
         steps = []
@@ -268,6 +344,14 @@ class UnifiedAnimationController(QObject):
                     'color': QColor(200, 200, 255),
                     'description': f'当前栈顶: {stack.peek()}'
                 })
+            # 栈满且可扩容时，提示即将倍增
+            if stack.is_full() and stack.growable:
+                steps.append({
+                    'type': 'highlight',
+                    'nodes': ['stack_top'],
+                    'color': QColor(255, 150, 150),
+                    'description': f'栈已满，容量将从 {stack.capacity} 扩容到 {max(stack.capacity, 1) * 2}'
+                })
             # 步骤3：执行入栈
             steps.append({
                 'type': 'execute',
@@ -332,6 +416,15 @@ class UnifiedAnimationController(QObject):
                     'color': QColor(200, 200, 255),
                     'description': f'当前队尾位置'
                 })
+            # 队满且可扩容时，提示即将倍增并摆正环形缓冲区
+            if queue.is_full() and queue.growable:
+                steps.append({
+                    'type': 'highlight',
+                    'nodes': ['queue_front', 'queue_rear'],
+                    'color': QColor(255, 150, 150),
+                    'description': f'队列已满，容量将从 {queue.capacity} 扩容到 {max(queue.capacity, 1) * 2}，'
+                                   f'元素按队头到队尾顺序复制到新数组开头'
+                })
             # 步骤3：执行入队
             steps.append({
                 'type': 'execute',
@@ -456,29 +549,15 @@ class UnifiedAnimationController(QObject):
         current_node_values = []  # 存储访问的节点值，用于描述
         
         def traverse(node, target_value):
-            """遍历查找路径"""
-            if node is None:
-                return False
-            
-            node_id = node.data.get('id') if isinstance(node.data, dict) else None
-            node_value = node.data.get('value') if isinstance(node.data, dict) else node.data
-            
-            if node_id:
-                path.append(node_id)
-                current_node_values.append(node_value)
-            
-            if target_value == node_value:
-                return True
-            elif target_value < node_value:
-                if node.left:
-                    return traverse(node.left, target_value)
-                else:
-                    return False  # 找到插入位置（左子树为空）
-            else:
-                if node.right:
-                    return traverse(node.right, target_value)
-                else:
-                    return False  # 找到插入位置（右子树为空）
+            """沿查找路径逐层下降（迭代实现），返回是否找到目标值"""
+            while node is not None:
+                path.append(node.uid)
+                current_node_values.append(node.key)
+                if target_value == node.key:
+                    return True
+                # 子树为空时停在此处，即插入位置
+                node = node.left if target_value < node.key else node.right
+            return False
         
         if bst.root:
             found = traverse(bst.root, value)
@@ -508,6 +587,13 @@ class UnifiedAnimationController(QObject):
                             'color': QColor(255, 100, 100),
                             'description': f'未找到值: {value}'
                         })
+                    elif found and getattr(bst, 'multiset', False):
+                        steps.append({
+                            'type': 'highlight',
+                            'nodes': [node_id],
+                            'color': QColor(200, 200, 255),
+                            'description': f'键 {value} 已存在，计数加一（不新建节点）'
+                        })
                     else:
                         # 插入操作：显示找到插入位置
                         steps.append({
@@ -566,9 +652,290 @@ class UnifiedAnimationController(QObject):
                 'data': {},
                 'description': '清空AVL树'
             })
+            
+        elif operation_type == 'avl_rank':
+            value = data.get('value')
+            rank_steps, count = self._generate_avl_rank_path(avl, value, inclusive=False)
+            steps.extend(rank_steps)
+            steps.append({
+                'type': 'highlight',
+                'nodes': [],
+                'color': QColor(100, 255, 100),
+                'description': f'rank({value}) = {count}，共有 {count} 个键小于 {value}'
+            })
+            
+        elif operation_type == 'avl_count':
+            lo, hi = data.get('lo'), data.get('hi')
+            # 区间计数 = 不大于 hi 的个数 - 小于 lo 的个数，两次下降
+            hi_steps, hi_count = self._generate_avl_rank_path(avl, hi, inclusive=True)
+            lo_steps, lo_count = self._generate_avl_rank_path(avl, lo, inclusive=False)
+            steps.extend(hi_steps)
+            steps.extend(lo_steps)
+            steps.append({
+                'type': 'highlight',
+                'nodes': [],
+                'color': QColor(100, 255, 100),
+                'description': f'区间 [{lo}, {hi}] 内共有 {max(hi_count - lo_count, 0)} 个键'
+            })
+            
+        elif operation_type in ('avl_select', 'avl_median'):
+            if operation_type == 'avl_median':
+                k = (avl.size() - 1) // 2
+                label = '中位数'
+            else:
+                k = data.get('k')
+                label = f'第 {k} 小的键'
+            steps.extend(self._generate_avl_select_path(avl, k, label))
+        
+        return steps
+    
+    def _generate_rb_steps(self, operation_type, data):
+        """生成红黑树操作的动画步骤（查找路径与AVL树相同）"""
+        steps = []
+        rb_tree = self.main_window.rb_tree
+        
+        if operation_type == 'rb_insert':
+            value = data.get('value')
+            steps.extend(self._generate_avl_search_path(rb_tree, value, is_insert=True))
+            steps.append({
+                'type': 'execute',
+                'action': 'insert',
+                'data': {'value': value},
+                'description': f'插入节点: {value}（可能需要改色和旋转）'
+            })
+            
+        elif operation_type == 'rb_search':
+            value = data.get('value')
+            steps.extend(self._generate_avl_search_path(rb_tree, value, is_insert=False))
+            
+        elif operation_type == 'rb_delete':
+            value = data.get('value')
+            steps.extend(self._generate_avl_search_path(rb_tree, value, is_insert=False))
+            steps.append({
+                'type': 'execute',
+                'action': 'delete',
+                'data': {'value': value},
+                'description': f'删除节点: {value}（可能需要改色和旋转）'
+            })
+            
+        elif operation_type == 'rb_clear':
+            steps.append({
+                'type': 'execute',
+                'action': 'clear',
+                'data': {},
+                'description': '清空红黑树'
+            })
+        
+        return steps
+    
+    def _generate_splay_steps(self, operation_type, data):
+        """生成伸展树操作的动画步骤：先演示查找路径，再执行伸展"""
+        steps = []
+        splay_tree = self.main_window.splay_tree
+        
+        if operation_type == 'splay_insert':
+            value = data.get('value')
+            steps.extend(self._generate_avl_search_path(splay_tree, value, is_insert=True))
+            steps.append({
+                'type': 'execute',
+                'action': 'insert',
+                'data': {'value': value},
+                'description': f'伸展后插入: {value} 成为新的根'
+            })
+            
+        elif operation_type == 'splay_search':
+            value = data.get('value')
+            steps.extend(self._generate_avl_search_path(splay_tree, value, is_insert=False))
+            if splay_tree.root is not None:
+                steps.append({
+                    'type': 'execute',
+                    'action': 'splay',
+                    'data': {'value': value},
+                    'description': f'自顶向下伸展: 把路径上最后访问的节点移到根'
+                })
+            
+        elif operation_type == 'splay_delete':
+            value = data.get('value')
+            steps.extend(self._generate_avl_search_path(splay_tree, value, is_insert=False))
+            steps.append({
+                'type': 'execute',
+                'action': 'delete',
+                'data': {'value': value},
+                'description': f'伸展到根后删除: {value}，左子树最大节点成为新根'
+            })
+            
+        elif operation_type == 'splay_clear':
+            steps.append({
+                'type': 'execute',
+                'action': 'clear',
+                'data': {},
+                'description': '清空伸展树'
+            })
+        
+        return steps
+    
+    def _generate_btree_steps(self, operation_type, data):
+        """生成B树/B+树操作的动画步骤"""
+        steps = []
+        b_tree = self.main_window.b_tree
+        
+        if operation_type == 'btree_insert':
+            value = data.get('value')
+            steps.extend(self._generate_btree_search_path(b_tree, value, is_insert=True))
+            if b_tree.search(value) is None:
+                steps.append({
+                    'type': 'execute',
+                    'action': 'insert',
+                    'data': {'value': value},
+                    'description': f'插入键: {value}（下降途中已满的节点会被拆分）'
+                })
+            
+        elif operation_type == 'btree_search':
+            value = data.get('value')
+            steps.extend(self._generate_btree_search_path(b_tree, value, is_insert=False))
+            
+        elif operation_type == 'btree_delete':
+            value = data.get('value')
+            steps.extend(self._generate_btree_search_path(b_tree, value, is_insert=False))
+            steps.append({
+                'type': 'execute',
+                'action': 'delete',
+                'data': {'value': value},
+                'description': f'删除键: {value}（过瘦的节点向兄弟借键或与兄弟合并）'
+            })
+            
+        elif operation_type == 'btree_clear':
+            steps.append({
+                'type': 'execute',
+                'action': 'clear',
+                'data': {},
+                'description': '清空B树'
+            })
         
         return steps
     
+    def _generate_btree_search_path(self, b_tree, value, is_insert=False):
+        """生成B树查找路径的动画步骤：每层在节点内二分定位分支"""
+        steps = []
+        if b_tree.root is None:
+            steps.append({
+                'type': 'highlight',
+                'nodes': [],
+                'color': QColor(200, 200, 255),
+                'description': f'树为空，{value} 将作为根节点插入'
+            })
+            return steps
+        
+        plus = isinstance(b_tree, BPlusTree)
+        node = b_tree.root
+        while True:
+            keys_text = ' | '.join(map(str, node.keys))
+            i = bisect_left(node.keys, value)
+            found = i < len(node.keys) and node.keys[i] == value
+            if found and (node.leaf or not plus):
+                color = QColor(200, 200, 255) if is_insert else QColor(100, 255, 100)
+                description = f'键 {value} 已存在，不再插入' if is_insert else f'找到目标值: {value}'
+                steps.append({'type': 'highlight', 'nodes': [node.uid], 'color': color,
+                              'description': description})
+                break
+            if node.leaf:
+                if is_insert:
+                    steps.append({
+                        'type': 'highlight',
+                        'nodes': [node.uid],
+                        'color': QColor(200, 200, 255),
+                        'description': f'找到插入位置: 叶子 [{keys_text}] 的第 {i + 1} 个位置'
+                    })
+                else:
+                    steps.append({
+                        'type': 'highlight',
+                        'nodes': [node.uid],
+                        'color': QColor(255, 100, 100),
+                        'description': f'未找到值: {value}'
+                    })
+                break
+            # B+树中等于分隔键的值在右侧子树
+            branch = bisect_right(node.keys, value) if plus else i
+            steps.append({
+                'type': 'highlight',
+                'nodes': [node.uid],
+                'color': QColor(255, 200, 100),
+                'description': f'访问节点 [{keys_text}]，{value} 进入第 {branch + 1} 个孩子'
+            })
+            node = node.children[branch]
+        
+        return steps
+    
+    def _generate_avl_rank_path(self, avl, value, inclusive):
+        """生成按子树大小累计排名的下降路径，返回 (步骤列表, 计数)"""
+        steps = []
+        count = 0
+        relation = '<=' if inclusive else '<'
+        current = avl.root
+        while current is not None:
+            left_size = avl.get_size(current.left)
+            if current.key < value or (inclusive and current.key == value):
+                count += left_size + current.count
+                steps.append({
+                    'type': 'highlight',
+                    'nodes': [current.uid],
+                    'color': QColor(255, 200, 100),
+                    'description': f'节点 {current.key} {relation} {value}：计入左子树 {left_size} 个和本节点 {current.count} 个，'
+                                   f'累计 {count}，转向右子树'
+                })
+                current = current.right
+            else:
+                steps.append({
+                    'type': 'highlight',
+                    'nodes': [current.uid],
+                    'color': QColor(200, 200, 255),
+                    'description': f'节点 {current.key} 不满足 {relation} {value}，转向左子树'
+                })
+                current = current.left
+        return steps, count
+    
+    def _generate_avl_select_path(self, avl, k, label):
+        """生成按子树大小查找第 k 小键的下降路径"""
+        steps = []
+        if not 0 <= k < avl.size():
+            steps.append({
+                'type': 'highlight',
+                'nodes': [],
+                'color': QColor(255, 100, 100),
+                'description': f'序号 {k} 超出范围（共 {avl.size()} 个键）'
+            })
+            return steps
+        
+        current = avl.root
+        while True:
+            left_size = avl.get_size(current.left)
+            if k < left_size:
+                steps.append({
+                    'type': 'highlight',
+                    'nodes': [current.uid],
+                    'color': QColor(255, 200, 100),
+                    'description': f'节点 {current.key}：左子树有 {left_size} 个键 > {k}，转向左子树'
+                })
+                current = current.left
+            elif k < left_size + current.count:
+                steps.append({
+                    'type': 'highlight',
+                    'nodes': [current.uid],
+                    'color': QColor(100, 255, 100),
+                    'description': f'节点 {current.key}：第 {k} 小落在本节点的 {current.count} 个键中，{label}为 {current.key}'
+                })
+                return steps
+            else:
+                steps.append({
+                    'type': 'highlight',
+                    'nodes': [current.uid],
+                    'color': QColor(255, 200, 100),
+                    'description': f'节点 {current.key}：跳过左子树 {left_size} 个和本节点 {current.count} 个，'
+                                   f'在右子树中找第 {k - left_size - current.count} 小'
+                })
+                k -= left_size + current.count
+                current = current.right
+    
     def _generate_avl_search_path(self, avl, value, is_insert=False):
         """生成AVL查找路径的动画步骤"""
         steps = []
@@ -576,29 +943,15 @@ class UnifiedAnimationController(QObject):
         current_node_values = []
         
         def traverse(node, target_value):
-            """遍历查找路径"""
-            if node is None:
-                return False
-            
-            node_id = node.data.get('id') if isinstance(node.data, dict) else None
-            node_value = node.data.get('value') if isinstance(node.data, dict) else node.data
-            
-            if node_id:
-                path.append(node_id)
-                current_node_values.append(node_value)
-            
-            if target_value == node_value:
-                return True
-            elif target_value < node_value:
-                if node.left:
-                    return traverse(node.left, target_value)
-                else:
-                    return False
-            else:
-                if node.right:
-                    return traverse(node.right, target_value)
-                else:
-                    return False
+            """沿查找路径逐层下降（迭代实现），返回是否找到目标值"""
+            while node is not None:
+                path.append(node.uid)
+                current_node_values.append(node.key)
+                if target_value == node.key:
+                    return True
+                # 子树为空时停在此处，即插入位置
+                node = node.left if target_value < node.key else node.right
+            return False
         
         if avl.root:
             found = traverse(avl.root, value)
@@ -625,6 +978,13 @@ class UnifiedAnimationController(QObject):
                             'color': QColor(255, 100, 100),
                             'description': f'未找到值: {value}'
                         })
+                    elif found and getattr(avl, 'multiset', False):
+                        steps.append({
+                            'type': 'highlight',
+                            'nodes': [node_id],
+                            'color': QColor(200, 200, 255),
+                            'description': f'键 {value} 已存在，计数加一（不新建节点、不旋转）'
+                        })
                     else:
                         steps.append({
                             'type': 'highlight',
@@ -819,14 +1179,14 @@ class UnifiedAnimationController(QObject):
             elif action == 'pop':
                 self.main_window.stack.pop()
             elif action == 'clear' and self.main_window.current_ds == "栈":
-                self.main_window.stack = self.main_window.stack.__class__(10)
+                self.main_window.stack = self.main_window.create_stack()
                 
             elif action == 'enqueue':
                 self.main_window.queue.enqueue(data['value'])
             elif action == 'dequeue':
                 self.main_window.queue.dequeue()
             elif action == 'clear' and self.main_window.current_ds == "队列":
-                self.main_window.queue = self.main_window.queue.__class__(10)
+                self.main_window.queue = self.main_window.create_queue()
                 
             elif action == 'insert_level_order':
                 self.main_window.binary_tree.insert_level_order(data['value'])
@@ -838,33 +1198,51 @@ class UnifiedAnimationController(QObject):
                     self.main_window.bst.insert(data['value'])
                     # 插入后高亮新节点
                     inserted_node = self.main_window.bst.search(data['value'])
-                    if inserted_node and isinstance(inserted_node.data, dict):
-                        node_id = inserted_node.data.get('id')
-                        if node_id:
-                            # 延迟高亮新节点（在下一个步骤中）
-                            QTimer.singleShot(100, lambda: self.highlight_requested.emit(
-                                [node_id], QColor(100, 255, 100), f'新节点 {data["value"]} 已插入'
-                            ))
+                    if inserted_node:
+                        node_id = inserted_node.uid
+                        # 延迟高亮新节点（在下一个步骤中）
+                        QTimer.singleShot(100, lambda: self.highlight_requested.emit(
+                            [node_id], QColor(100, 255, 100), f'新节点 {data["value"]} 已插入'
+                        ))
                 elif self.main_window.current_ds == "AVL树":
                     self.main_window.avl_tree.insert(data['value'])
                     # 插入后高亮新节点
                     inserted_node = self.main_window.avl_tree.search(data['value'])
-                    if inserted_node and isinstance(inserted_node.data, dict):
-                        node_id = inserted_node.data.get('id')
-                        if node_id:
-                            QTimer.singleShot(100, lambda: self.highlight_requested.emit(
-                                [node_id], QColor(100, 255, 100), f'新节点 {data["value"]} 已插入'
-                            ))
+                    if inserted_node:
+                        node_id = inserted_node.uid
+                        QTimer.singleShot(100, lambda: self.highlight_requested.emit(
+                            [node_id], QColor(100, 255, 100), f'新节点 {data["value"]} 已插入'
+                        ))
+                elif self.main_window.current_ds == "红黑树":
+                    self.main_window.rb_tree.insert(data['value'])
+                elif self.main_window.current_ds == "伸展树":
+                    self.main_window.splay_tree.insert(data['value'])
+                elif self.main_window.current_ds == "B树":
+                    self.main_window.b_tree.insert(data['value'])
+            elif action == 'splay':
+                self.main_window.splay_tree.search(data['value'])
             elif action == 'delete':
                 if self.main_window.current_ds == "二叉搜索树":
                     self.main_window.bst.delete(data['value'])
                 elif self.main_window.current_ds == "AVL树":
                     self.main_window.avl_tree.delete(data['value'])
+                elif self.main_window.current_ds == "红黑树":
+                    self.main_window.rb_tree.delete(data['value'])
+                elif self.main_window.current_ds == "伸展树":
+                    self.main_window.splay_tree.delete(data['value'])
+                elif self.main_window.current_ds == "B树":
+                    self.main_window.b_tree.delete(data['value'])
             elif action == 'clear':
                 if self.main_window.current_ds == "二叉搜索树":
                     self.main_window.bst.clear()
                 elif self.main_window.current_ds == "AVL树":
                     self.main_window.avl_tree.clear()
+                elif self.main_window.current_ds == "红黑树":
+                    self.main_window.rb_tree.clear()
+                elif self.main_window.current_ds == "伸展树":
+                    self.main_window.splay_tree.clear()
+                elif self.main_window.current_ds == "B树":
+                    self.main_window.b_tree.clear()
                     
             elif action == 'build_from_text':
                 self.main_window.huffman_tree.build_from_text(data['text'])
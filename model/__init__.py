@@ -1,13 +1,28 @@
 from .node import Node
+from .skip_list_index import SkipListIndex
 from .linked_list import LinkedList
+from .unrolled_linked_list import UnrolledLinkedList
 from .stack import Stack
 from .queue import Queue
 from .binary_tree_node import BinaryTreeNode
 from .binary_tree import BinaryTree
+from .search_tree_node import SearchTreeNode
 from .binary_search_tree import BinarySearchTree
 from .huffman_tree import HuffmanTree
+from .huffman_file import HuffmanFile
 from .avl_node import AVLNode
 from .avl_tree import AVLTree
+from .arena_tree import ArenaTree
+from .rb_node import RBNode
+from .red_black_tree import RedBlackTree
+from .splay_node import SplayNode
+from .splay_tree import SplayTree
+from .b_tree_node import BTreeNode
+from .b_tree import BTree
+from .b_plus_tree import BPlusTree
+from .b_plus_page_file import BPlusPageFile
 
-__all__ = ['Node', 'LinkedList', 'Stack', 'Queue', 'BinaryTreeNode',
-           'BinaryTree', 'BinarySearchTree', 'HuffmanTree', 'AVLNode', 'AVLTree']
\ No newline at end of file
+__all__ = ['Node', 'SkipListIndex', 'LinkedList', 'UnrolledLinkedList', 'Stack', 'Queue',
+           'BinaryTreeNode', 'BinaryTree', 'SearchTreeNode', 'BinarySearchTree', 'HuffmanTree', 'HuffmanFile', 'AVLNode', 'AVLTree',
+           'ArenaTree', 'RBNode', 'RedBlackTree', 'SplayNode', 'SplayTree',
+           'BTreeNode', 'BTree', 'BPlusTree', 'BPlusPageFile']
\ No newline at end of file
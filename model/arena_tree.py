@@ -0,0 +1,298 @@
+from array import array
+from . import typed_storage
+
+
+class ArenaTree:
+    """数组化（结构体数组）查找树
+
+    节点用整数下标表示，键、左右孩子、父节点和高度分别存放在并行数组中，
+    没有任何节点对象。下标 0 是哨兵空节点（高度恒为 0），省去对空孩子的特判。
+    balanced 为 True 时按 AVL 规则自平衡，否则为普通二叉搜索树。
+    """
+
+    NIL = 0  # 哨兵空节点下标
+    INDEX_TYPECODE = 'i'  # 孩子/父节点下标使用 32 位整数
+
+    def __init__(self, balanced=True, typecode='q'):
+        self.balanced = balanced
+        self.typecode = typecode  # 键的存储类型，为 None 时用列表存储任意可比较对象
+        self.clear()
+
+    def clear(self):
+        """清空树，只保留哨兵槽位"""
+        self.keys = typed_storage.allocate(1, self.typecode)
+        self.left = array(self.INDEX_TYPECODE, [self.NIL])
+        self.right = array(self.INDEX_TYPECODE, [self.NIL])
+        self.parent = array(self.INDEX_TYPECODE, [self.NIL])
+        self.height = array('b', [0])  # 仅平衡模式下维护
+        self.root = self.NIL
+        self.free = self.NIL  # 空闲槽位链表头，借用 left 数组串联
+        self.count = 0
+
+    def is_empty(self):
+        return self.root == self.NIL
+
+    def size(self):
+        return self.count
+
+    def _allocate(self, key):
+        """分配一个槽位：优先复用已删除的槽位，否则在数组末尾追加"""
+        slot = self.free
+        if slot != self.NIL:
+            self.free = self.left[slot]
+            self.keys[slot] = key
+            self.left[slot] = self.NIL
+            self.height[slot] = 1
+        else:
+            slot = len(self.height)
+            self.keys.append(key)
+            self.left.append(self.NIL)
+            self.right.append(self.NIL)
+            self.parent.append(self.NIL)
+            self.height.append(1)
+        self.count += 1
+        return slot
+
+    def _release(self, slot):
+        """回收槽位到空闲链表"""
+        self.keys[slot] = typed_storage.blank_value(self.typecode)
+        self.right[slot] = self.parent[slot] = self.NIL
+        self.height[slot] = 0
+        self.left[slot] = self.free
+        self.free = slot
+        self.count -= 1
+
+    def get_balance(self, slot):
+        """获取节点的平衡因子"""
+        return self.height[self.left[slot]] - self.height[self.right[slot]]
+
+    def update_height(self, slot):
+        height = self.height
+        height[slot] = 1 + max(height[self.left[slot]], height[self.right[slot]])
+
+    def rotate_right(self, y):
+        """右旋转，返回新的子树根"""
+        left, right, parent = self.left, self.right, self.parent
+        x = left[y]
+        t2 = right[x]
+
+        right[x] = y
+        left[y] = t2
+        if t2 != self.NIL:
+            parent[t2] = y
+        parent[x] = parent[y]
+        parent[y] = x
+
+        self.update_height(y)
+        self.update_height(x)
+        return x
+
+    def rotate_left(self, x):
+        """左旋转，返回新的子树根"""
+        left, right, parent = self.left, self.right, self.parent
+        y = right[x]
+        t2 = left[y]
+
+        left[y] = x
+        right[x] = t2
+        if t2 != self.NIL:
+            parent[t2] = x
+        parent[y] = parent[x]
+        parent[x] = y
+
+        self.update_height(x)
+        self.update_height(y)
+        return y
+
+    def _replace_child(self, parent, old, new):
+        """用 new 替换 parent 下的子树 old"""
+        if parent == self.NIL:
+            self.root = new
+        elif self.left[parent] == old:
+            self.left[parent] = new
+        else:
+            self.right[parent] = new
+
+    def _rebalance(self, slot):
+        """对失衡节点执行旋转，返回旋转后子树的根"""
+        balance = self.get_balance(slot)
+        parent = self.parent[slot]
+
+        if balance > 1:
+            if self.get_balance(self.left[slot]) < 0:
+                self.left[slot] = self.rotate_left(self.left[slot])
+            new_root = self.rotate_right(slot)
+        elif balance < -1:
+            if self.get_balance(self.right[slot]) > 0:
+                self.right[slot] = self.rotate_right(self.right[slot])
+            new_root = self.rotate_left(slot)
+        else:
+            return slot
+
+        self._replace_child(parent, slot, new_root)
+        return new_root
+
+    def _retrace(self, slot):
+        """沿父指针回溯更新高度并恢复平衡，子树高度不变时提前结束"""
+        while slot != self.NIL:
+            old_height = self.height[slot]
+            self.update_height(slot)
+            slot = self._rebalance(slot)
+            if self.height[slot] == old_height:
+                break
+            slot = self.parent[slot]
+
+    def insert(self, data):
+        """插入键（重复值插入右子树）"""
+        slot = self._allocate(data)
+        if self.root == self.NIL:
+            self.root = slot
+            return True
+
+        keys, left, right = self.keys, self.left, self.right
+        current = self.root
+        while True:
+            if data < keys[current]:
+                if left[current] == self.NIL:
+                    left[current] = slot
+                    break
+                current = left[current]
+            else:
+                if right[current] == self.NIL:
+                    right[current] = slot
+                    break
+                current = right[current]
+        self.parent[slot] = current
+
+        if self.balanced:
+            self._retrace(current)
+        return True
+
+    def search(self, data):
+        """搜索键，返回节点下标，未找到返回 None"""
+        keys, left, right = self.keys, self.left, self.right
+        current = self.root
+        while current != self.NIL:
+            value = keys[current]
+            if data == value:
+                return current
+            current = left[current] if data < value else right[current]
+        return None
+
+    def delete(self, data):
+        """删除键"""
+        slot = self.search(data)
+        if slot is None:
+            return
+
+        left, right = self.left, self.right
+        if left[slot] != self.NIL and right[slot] != self.NIL:
+            # 有两个子节点，用右子树的最小节点替换后删除该最小节点
+            successor = self._find_min(right[slot])
+            self.keys[slot] = self.keys[successor]
+            slot = successor
+
+        child = left[slot] if left[slot] != self.NIL else right[slot]
+        parent = self.parent[slot]
+        if child != self.NIL:
+            self.parent[child] = parent
+        self._replace_child(parent, slot, child)
+        self._release(slot)
+
+        if self.balanced:
+            self._retrace(parent)
+
+    def _find_min(self, slot):
+        """找到子树中的最小节点"""
+        while self.left[slot] != self.NIL:
+            slot = self.left[slot]
+        return slot
+
+    def bulk_load(self, values):
+        """由一批键构建平衡树（清空原有内容），数组按中序一次性分配"""
+        keys = sorted(values)
+        count = len(keys)
+        self.clear()
+        if count == 0:
+            return
+
+        # 中序第 i 个键放在槽位 i + 1，四个下标数组整段分配
+        self.keys.extend(keys)
+        left = array(self.INDEX_TYPECODE, bytes(4 * (count + 1)))
+        right = array(self.INDEX_TYPECODE, bytes(4 * (count + 1)))
+        parent = array(self.INDEX_TYPECODE, bytes(4 * (count + 1)))
+        height = array('b', bytes(count + 1))
+
+        stack = [(1, count + 1, self.NIL, False)]
+        while stack:
+            lo, hi, up, is_left = stack.pop()
+            mid = (lo + hi) // 2
+            height[mid] = (hi - lo).bit_length()
+            parent[mid] = up
+            if up == self.NIL:
+                self.root = mid
+            elif is_left:
+                left[up] = mid
+            else:
+                right[up] = mid
+
+            if mid > lo:
+                stack.append((lo, mid, mid, True))
+            if hi > mid + 1:
+                stack.append((mid + 1, hi, mid, False))
+
+        self.left, self.right, self.parent, self.height = left, right, parent, height
+        self.count = count
+
+    def get_height(self):
+        """树高（平衡模式下直接读取根的高度，否则逐层遍历）"""
+        if self.balanced:
+            return self.height[self.root]
+
+        levels = 0
+        level = [self.root] if self.root != self.NIL else []
+        while level:
+            levels += 1
+            level = [child for slot in level
+                     for child in (self.left[slot], self.right[slot]) if child != self.NIL]
+        return levels
+
+    def memory_usage(self):
+        """并行数组占用的字节数（列表存储键时不含键对象本身）"""
+        total = 0
+        for data in (self.left, self.right, self.parent, self.height):
+            total += data.itemsize * len(data)
+        if isinstance(self.keys, array):
+            total += self.keys.itemsize * len(self.keys)
+        else:
+            total += 8 * len(self.keys)
+        return total
+
+    def get_tree_structure(self):
+        """获取树结构信息，用于可视化"""
+        if self.root == self.NIL:
+            return None
+
+        def build_structure(slot):
+            structure = {
+                'data': self.keys[slot],
+                'id': f"arena_{slot}",
+                'left': None,
+                'right': None
+            }
+            if self.balanced:
+                balance = self.get_balance(slot)
+                structure['data'] = f"{self.keys[slot]}({balance})"  # 显示值和平衡因子
+                structure['balance'] = balance
+            return structure
+
+        # 非平衡模式下按序插入会退化成长链，用显式栈自上而下填充孩子
+        structure = build_structure(self.root)
+        stack = [(self.root, structure)]
+        while stack:
+            slot, parent_structure = stack.pop()
+            for side, child in (('left', self.left[slot]), ('right', self.right[slot])):
+                if child != self.NIL:
+                    parent_structure[side] = build_structure(child)
+                    stack.append((child, parent_structure[side]))
+        return structure
\ No newline at end of file
@@ -1,9 +1,20 @@
-from .binary_tree_node import BinaryTreeNode
+from .search_tree_node import SearchTreeNode
 
 
-class AVLNode(BinaryTreeNode):
-    """AVL树节点，扩展二叉树节点"""
+class AVLNode(SearchTreeNode):
+    """AVL树节点，在查找树节点上增加高度、平衡因子和子树大小"""
 
-    def __init__(self, data):
-        super().__init__(data)
-        self.height = 1  # 节点高度，用于平衡因子计算
\ No newline at end of file
+    __slots__ = ('height', 'balance', 'size')
+
+    ID_PREFIX = "avl"
+
+    def __init__(self, key, node_id):
+        super().__init__(key, node_id)
+        self.height = 1  # 节点高度，用于平衡因子计算
+        self.balance = 0  # 平衡因子（左子树高度 - 右子树高度）
+        self.size = 1  # 以该节点为根的子树中的键数（含重复次数），用于顺序统计
+
+    @property
+    def data(self):
+        """兼容旧接口的数据字典（只读快照，修改不会写回节点）"""
+        return {'value': self.key, 'id': self.uid, 'count': self.count, 'balance': self.balance}
\ No newline at end of file
@@ -1,16 +1,31 @@
+from itertools import accumulate, repeat
+from operator import attrgetter
 from .avl_node import AVLNode
 
 
 class AVLTree:
-    """AVL树（平衡二叉搜索树）实现"""
+    """AVL树（平衡二叉搜索树）实现
 
-    def __init__(self):
+    multiset 为 True 时重复插入只增加节点计数，树高只取决于不同键的个数；
+    子树大小按计数累加，顺序统计和区间计数都把重复键计算在内。
+    键数和树高直接取根节点的 size、height；最小/最大键另行缓存，
+    整体重组（拆分、连接、集合运算）后置为失效，下次读取时重新查找。
+    """
+
+    def __init__(self, multiset=False):
         self.root = None
         self.node_counter = 0
+        self.rotations = 0  # 累计旋转次数，用于与红黑树比较再平衡开销
+        self.multiset = multiset
+        self._min = self._max = None  # 最小/最大键缓存，None 表示失效
 
     def is_empty(self):
         return self.root is None
 
+    def reset_counters(self):
+        """重置再平衡计数器"""
+        self.rotations = 0
+
     def get_height(self, node):
         """获取节点高度"""
         if node is None:
@@ -23,10 +38,27 @@ class AVLTree:
             return 0
         return self.get_height(node.left) - self.get_height(node.right)
 
+    def get_size(self, node):
+        """获取子树节点数"""
+        if node is None:
+            return 0
+        return node.size
+
+    def size(self):
+        return self.get_size(self.root)
+
     def update_height(self, node):
-        """更新节点高度"""
+        """更新节点高度和子树大小，并同步用于显示的平衡因子"""
         if node is not None:
             node.height = 1 + max(self.get_height(node.left), self.get_height(node.right))
+            node.balance = self.get_balance(node)
+            node.size = node.count + self.get_size(node.left) + self.get_size(node.right)
+
+    def _adjust_sizes(self, node, delta):
+        """计数变化后沿父指针修正祖先的子树大小，树形不变"""
+        while node is not None:
+            node.size += delta
+            node = node.parent
 
     def rotate_right(self, y):
         """右旋转"""
@@ -36,6 +68,7 @@ class AVLTree:
         # 执行旋转
         x.right = y
         y.left = T2
+        self.rotations += 1
 
         # 更新父指针
         if T2 is not None:
@@ -57,6 +90,7 @@ class AVLTree:
         # 执行旋转
         y.left = x
         x.right = T2
+        self.rotations += 1
 
         # 更新父指针
         if T2 is not None:
@@ -71,137 +105,565 @@ class AVLTree:
         return y
 
     def insert(self, data):
-        """插入节点"""
+        """插入节点（迭代实现，沿 parent 指针向上回溯调整平衡）"""
+        # 1. 执行正常的BST插入
+        if self.root is None:
+            self.node_counter += 1
+            self.root = AVLNode(data, self.node_counter)
+            self._min = self._max = data
+            return True
+
+        if self._min is not None and data < self._min:
+            self._min = data
+        if self._max is not None and data > self._max:
+            self._max = data
+        current = self.root
+        while True:
+            if data < current.key:
+                if current.left is None:
+                    break
+                current = current.left
+            elif self.multiset and data == current.key:
+                # 已有的键只计数：不分配节点、不旋转，只修正路径上的子树大小
+                current.count += 1
+                self._adjust_sizes(current, 1)
+                return True
+            else:
+                # 重复值，插入到右子树（AVL允许重复值）
+                if current.right is None:
+                    break
+                current = current.right
+
         self.node_counter += 1
-        node_data = {
-            'value': data,
-            'id': f"avl_{self.node_counter}",  # 唯一标识符
-            'balance': 0  # 平衡因子
-        }
+        new_node = AVLNode(data, self.node_counter)
+        if data < current.key:
+            current.left = new_node
+        else:
+            current.right = new_node
+        new_node.parent = current
 
-        self.root = self._insert_recursive(self.root, node_data)
+        # 2. 自底向上更新高度并恢复平衡
+        self._retrace(current)
         return True
 
-    def _insert_recursive(self, node, data):
-        """递归插入辅助方法"""
-        # 1. 执行正常的BST插入
-        if node is None:
-            return AVLNode(data)
-
-        if data['value'] < node.data['value']:
-            node.left = self._insert_recursive(node.left, data)
-            node.left.parent = node
-        elif data['value'] > node.data['value']:
-            node.right = self._insert_recursive(node.right, data)
-            node.right.parent = node
+    def _replace_child(self, parent, old, new):
+        """用 new 替换 parent 下的子树 old"""
+        if parent is None:
+            self.root = new
+        elif parent.left is old:
+            parent.left = new
         else:
-            # 重复值，插入到右子树（AVL允许重复值）
-            node.right = self._insert_recursive(node.right, data)
-            node.right.parent = node
-
-        # 2. 更新节点高度
-        self.update_height(node)
+            parent.right = new
 
-        # 3. 获取平衡因子
+    def _rebalance(self, node):
+        """对失衡节点执行旋转，返回旋转后子树的根"""
         balance = self.get_balance(node)
-        node.data['balance'] = balance  # 存储平衡因子用于显示
-
-        # 4. 如果不平衡，则有4种情况
-
-        # 左左情况（右旋转）
-        if balance > 1 and data['value'] < node.left.data['value']:
-            return self.rotate_right(node)
+        parent = node.parent
+
+        if balance > 1:
+            # 左右情况先对左子节点左旋，再统一按左左情况右旋
+            if self.get_balance(node.left) < 0:
+                node.left = self.rotate_left(node.left)
+            new_root = self.rotate_right(node)
+        elif balance < -1:
+            # 右左情况先对右子节点右旋，再统一按右右情况左旋
+            if self.get_balance(node.right) > 0:
+                node.right = self.rotate_right(node.right)
+            new_root = self.rotate_left(node)
+        else:
+            return node
 
-        # 右右情况（左旋转）
-        if balance < -1 and data['value'] > node.right.data['value']:
-            return self.rotate_left(node)
+        self._replace_child(parent, node, new_root)
+        return new_root
 
-        # 左右情况（先左旋后右旋）
-        if balance > 1 and data['value'] > node.left.data['value']:
-            node.left = self.rotate_left(node.left)
-            return self.rotate_right(node)
+    def _retrace(self, node):
+        """从 node 开始沿 parent 指针回溯：更新高度，失衡则旋转
 
-        # 右左情况（先右旋后左旋）
-        if balance < -1 and data['value'] < node.right.data['value']:
-            node.right = self.rotate_right(node.right)
-            return self.rotate_left(node)
+        子树高度不变后不再需要旋转，但祖先的子树大小仍要更新到根。
+        """
+        while node is not None:
+            old_height = node.height
+            self.update_height(node)
+            node = self._rebalance(node)
+            height_unchanged = node.height == old_height
+            node = node.parent
+            if height_unchanged:
+                break
 
-        return node
+        while node is not None:
+            node.size = node.count + self.get_size(node.left) + self.get_size(node.right)
+            node = node.parent
 
     def search(self, data):
         """搜索节点"""
-        return self._search_recursive(self.root, data)
-
-    def _search_recursive(self, node, data):
-        """递归搜索辅助方法"""
-        if node is None:
-            return None
-
-        if data == node.data['value']:
-            return node
-        elif data < node.data['value']:
-            return self._search_recursive(node.left, data)
-        else:
-            return self._search_recursive(node.right, data)
+        current = self.root
+        while current is not None:
+            value = current.key
+            if data == value:
+                return current
+            current = current.left if data < value else current.right
+        return None
 
     def delete(self, data):
         """删除节点"""
-        self.root = self._delete_recursive(self.root, data)
-
-    def _delete_recursive(self, node, data):
-        """递归删除辅助方法"""
         # 1. 执行标准的BST删除
+        node = self.search(data)
         if node is None:
-            return node
+            return
+
+        if node.count > 1:
+            node.count -= 1
+            self._adjust_sizes(node, -1)
+            return
+
+        if data == self._min:
+            self._min = None
+        if data == self._max:
+            self._max = None
+
+        if node.left is not None and node.right is not None:
+            # 有两个子节点，用右子树的最小节点替换后删除该最小节点
+            successor = self._find_min(node.right)
+            node.key, node.id, node.count = successor.key, successor.id, successor.count
+            node = successor
+
+        self._remove(node)
+
+    def _remove(self, node):
+        """摘除至多只有一个子节点的节点，并自底向上恢复平衡"""
+        child = node.left if node.left is not None else node.right
+        parent = node.parent
+        if child is not None:
+            child.parent = parent
+        self._replace_child(parent, node, child)
+        node.parent = node.left = node.right = None
+
+        # 自底向上更新高度并恢复平衡
+        self._retrace(parent)
+
+    def delete_range(self, lo, hi):
+        """删除闭区间 [lo, hi] 内的所有键，返回删除个数
+
+        按区间两端拆分（split）出中间一段直接丢弃，再把两侧连接（join）回去，
+        共 O(log n) 次指针调整，与删除个数无关。
+        """
+        if self.root is None or hi < lo:
+            return 0
 
-        if data < node.data['value']:
-            node.left = self._delete_recursive(node.left, data)
-        elif data > node.data['value']:
-            node.right = self._delete_recursive(node.right, data)
+        left, rest = self._split(self.root, lo, inclusive=False)
+        middle, right = self._split(rest, hi, inclusive=True)
+        self.root = self._join_two(left, right)
+        if middle is not None:
+            self._min = self._max = None
+        return self.get_size(middle)
+
+    def _join(self, left, mid, right):
+        """以节点 mid 连接两棵AVL树（left 的键 <= mid.key <= right 的键），返回新树的根
+
+        沿较高一棵树的边界下降到高度相差不超过 1 的位置挂接，再向上回溯恢复平衡，
+        耗时 O(两树高度差 + 1)。回溯时借用 self.root 记录工作树的根，调用方负责最终设置 self.root。
+        """
+        left_height = self.get_height(left)
+        right_height = self.get_height(right)
+
+        parent = None
+        if left_height > right_height + 1:
+            # 沿左树的右边界下降，mid 挂在 parent 的右侧
+            top, attach_right = left, True
+            while self.get_height(left) > right_height + 1:
+                parent, left = left, left.right
+        elif right_height > left_height + 1:
+            # 沿右树的左边界下降，mid 挂在 parent 的左侧
+            top, attach_right = right, False
+            while self.get_height(right) > left_height + 1:
+                parent, right = right, right.left
+
+        mid.left, mid.right, mid.parent = left, right, parent
+        if left is not None:
+            left.parent = mid
+        if right is not None:
+            right.parent = mid
+        self.update_height(mid)
+
+        if parent is None:
+            self.root = mid
+            return mid
+
+        if attach_right:
+            parent.right = mid
         else:
-            # 找到要删除的节点
-            if node.left is None:
-                return node.right
-            elif node.right is None:
-                return node.left
+            parent.left = mid
+        self.root = top
+        self._retrace(parent)
+        return self.root
+
+    def _join_two(self, left, right):
+        """连接两棵AVL树（left 的键 <= right 的键），取右树最小节点作为连接点"""
+        if left is None:
+            return right
+        if right is None:
+            return left
+
+        self.root = right
+        mid = self._find_min(right)
+        self._remove(mid)
+        return self._join(left, mid, self.root)
+
+    def _split(self, root, key, inclusive):
+        """把AVL树拆成两棵：左边的键小于 key（inclusive 时小于等于），其余在右边
+
+        沿查找路径自底向上把路径两侧的子树逐个 join，总耗时 O(log n)。
+        """
+        path = []
+        current = root
+        while current is not None:
+            path.append(current)
+            goes_left = current.key < key or (inclusive and current.key == key)
+            current = current.right if goes_left else current.left
+
+        left = right = None
+        for node in reversed(path):
+            if node.key < key or (inclusive and node.key == key):
+                subtree = node.left
+                if subtree is not None:
+                    subtree.parent = None
+                left = self._join(subtree, node, left)
             else:
-                # 有两个子节点，找到右子树的最小节点
-                temp = self._find_min(node.right)
-                node.data = temp.data
-                node.right = self._delete_recursive(node.right, temp.data['value'])
-
-        # 如果树只有一个节点，直接返回
-        if node is None:
-            return node
+                subtree = node.right
+                if subtree is not None:
+                    subtree.parent = None
+                right = self._join(right, node, subtree)
+        return left, right
+
+    def split(self, key):
+        """按 key 拆分为两棵新树 (键 < key, 键 >= key)，O(log n)；拆分后本树为空"""
+        root, self.root = self.root, None
+        left, right = self._split(root, key, inclusive=False)
+        trees = []
+        for part in (left, right):
+            tree = AVLTree(self.multiset)
+            tree.root = part
+            tree.node_counter = self.node_counter  # 两棵树的节点编号来自同一编号空间，不会冲突
+            trees.append(tree)
+        return trees[0], trees[1]
+
+    def join(self, other):
+        """把键都不小于本树的 other 连接到本树右侧，O(log n)；other 的节点被移入本树，调用后为空"""
+        if self.root is not None and other.root is not None and other.min() < self.max():
+            raise ValueError("连接要求 other 的键都不小于本树的键")
+
+        if self.multiset and self.root is not None and other.root is not None and other.min() == self.max():
+            # 多重集中两棵树边界上的相同键合并为一个节点
+            first = other._find_min(other.root)
+            other._remove(first)
+            last = self.root
+            while last.right is not None:
+                last = last.right
+            last.count += first.count
+            self._adjust_sizes(last, first.count)
+
+        self._adopt_ids(other)
+        root, other.root = other.root, None
+        self.root = self._join_two(self.root, root)
+        self._min = self._max = None
+
+    def union(self, other):
+        """并集：把 other 中本树没有的键并入本树，O(m log(n/m + 1))
+
+        以本树的根拆分 other，两侧递归求并后再 join。相同的键只保留本树的节点；
+        other 的节点被拆用，调用后为空树。
+        """
+        self._adopt_ids(other)
+        root, other.root = other.root, None
+        self.root = self._union(self.root, root)
+        self._min = self._max = None
+
+    def intersection(self, other):
+        """交集：只保留 other 中也存在的键（每个键保留一份），O(m log(n/m + 1))；调用后 other 为空树"""
+        root, other.root = other.root, None
+        self.root = self._intersection(self.root, root)
+        self._min = self._max = None
+
+    def difference(self, other):
+        """差集：删除所有在 other 中出现的键，O(m log(n/m + 1))；调用后 other 为空树"""
+        root, other.root = other.root, None
+        self.root = self._difference(self.root, root)
+        self._min = self._max = None
+
+    def _adopt_ids(self, other):
+        """合并两棵树的节点编号空间：把较小一棵树的编号整体平移到另一棵之后，避免可视化标识冲突"""
+        if self.get_size(self.root) <= other.get_size(other.root):
+            small, offset = self.root, other.node_counter
+        else:
+            small, offset = other.root, self.node_counter
+
+        stack = [small] if small is not None else []
+        while stack:
+            node = stack.pop()
+            node.id += offset
+            if node.left is not None:
+                stack.append(node.left)
+            if node.right is not None:
+                stack.append(node.right)
+        self.node_counter += other.node_counter
+
+    def _split3(self, root, key):
+        """三路拆分：返回键 < key、== key、> key 的三棵树"""
+        left, rest = self._split(root, key, inclusive=False)
+        middle, right = self._split(rest, key, inclusive=True)
+        return left, middle, right
+
+    def _detach_children(self, node):
+        """断开节点与左右子树的连接，返回 (左子树, 右子树)"""
+        left, right = node.left, node.right
+        if left is not None:
+            left.parent = None
+        if right is not None:
+            right.parent = None
+        node.left = node.right = node.parent = None
+        return left, right
+
+    def _union(self, a, b):
+        if a is None:
+            return b
+        if b is None:
+            return a
+
+        a_left, a_right = self._detach_children(a)
+        b_left, b_middle, b_right = self._split3(b, a.key)  # 与 a 相同的键丢弃
+        if self.multiset and b_middle is not None:
+            a.count += b_middle.size  # 多重集并集累加次数
+        left = self._union(a_left, b_left)
+        right = self._union(a_right, b_right)
+        return self._join(left, a, right)
+
+    def _intersection(self, a, b):
+        if a is None or b is None:
+            return None
 
-        # 2. 更新节点高度
-        self.update_height(node)
+        a_left, a_right = self._detach_children(a)
+        b_left, b_middle, b_right = self._split3(b, a.key)
+        left = self._intersection(a_left, b_left)
+        right = self._intersection(a_right, b_right)
+        if b_middle is not None:
+            if self.multiset:
+                a.count = min(a.count, b_middle.size)
+            return self._join(left, a, right)
+        return self._join_two(left, right)
+
+    def _difference(self, a, b):
+        if a is None or b is None:
+            return a
+
+        b_left, b_right = self._detach_children(b)
+        a_left, a_middle, a_right = self._split3(a, b.key)  # a 中等于 b.key 的键全部删除
+        left = self._difference(a_left, b_left)
+        right = self._difference(a_right, b_right)
+        if self.multiset and a_middle is not None and a_middle.count > b.count:
+            # 多重集差集只减去 b 中的次数；分出的中段只有这一个节点
+            a_middle.count -= b.count
+            return self._join(left, a_middle, right)
+        return self._join_two(left, right)
+
+    def bulk_load(self, values):
+        """批量装载：与已有节点合并后一次排序，按中位数构建高度平衡的AVL树
+
+        Timsort 对已排序输入（以及"已有节点 + 新值"两段有序序列）为线性时间，
+        高度和平衡因子由子树大小直接算出，不需要任何旋转。
+        """
+        start = self.node_counter + 1
+        new_nodes = [AVLNode(value, node_id) for node_id, value in enumerate(values, start)]
+        self.node_counter += len(new_nodes)
+        new_nodes.sort(key=attrgetter('key'))
+
+        nodes = self._inorder_nodes()
+        if nodes:
+            nodes.extend(new_nodes)
+            nodes.sort(key=attrgetter('key'))  # 稳定排序：重复值中已有节点在前
+        else:
+            nodes = new_nodes
+
+        if self.multiset:
+            nodes = self._merge_duplicates(nodes)
+        self.root = self._build_balanced(nodes)
+        self._min = nodes[0].key if nodes else None
+        self._max = nodes[-1].key if nodes else None
+
+    @staticmethod
+    def _merge_duplicates(nodes):
+        """有序节点序列中相同的键合并到第一个节点上，累加计数"""
+        merged = []
+        for node in nodes:
+            if merged and merged[-1].key == node.key:
+                merged[-1].count += node.count
+            else:
+                merged.append(node)
+        return merged
+
+    def _inorder_nodes(self):
+        """按中序收集所有节点（迭代实现）"""
+        result = []
+        stack = []
+        current = self.root
+        while stack or current is not None:
+            while current is not None:
+                stack.append(current)
+                current = current.left
+            current = stack.pop()
+            result.append(current)
+            current = current.right
+        return result
+
+    def _build_balanced(self, nodes):
+        """由有序节点构建平衡树：中位数为根，左右两半分别递推（显式栈）"""
+        if not nodes:
+            return None
 
-        # 3. 获取平衡因子
-        balance = self.get_balance(node)
-        node.data['balance'] = balance
+        # 多重集模式下子树大小要按计数累加，用前缀和 O(1) 求出
+        prefix = [0, *accumulate(node.count for node in nodes)] if self.multiset else None
+
+        root = None
+        stack = [(0, len(nodes), None, False)]
+        while stack:
+            lo, hi, parent, is_left = stack.pop()
+            mid = (lo + hi) // 2
+            node = nodes[mid]
+            left_size = mid - lo
+            right_size = hi - mid - 1
+
+            # 中位数划分下，大小为 n 的子树高度恰为 n 的二进制位数
+            node.height = (hi - lo).bit_length()
+            node.size = hi - lo if prefix is None else prefix[hi] - prefix[lo]
+            node.balance = left_size.bit_length() - right_size.bit_length()
+            node.left = node.right = None  # 已有节点会被重新链接
+            node.parent = parent
+            if parent is None:
+                root = node
+            elif is_left:
+                parent.left = node
+            else:
+                parent.right = node
 
-        # 4. 如果不平衡，则有4种情况
+            if left_size:
+                stack.append((lo, mid, node, True))
+            if right_size:
+                stack.append((mid + 1, hi, node, False))
 
-        # 左左情况
-        if balance > 1 and self.get_balance(node.left) >= 0:
-            return self.rotate_right(node)
+        return root
 
-        # 左右情况
-        if balance > 1 and self.get_balance(node.left) < 0:
-            node.left = self.rotate_left(node.left)
-            return self.rotate_right(node)
+    def min(self):
+        """最小键，空树返回 None"""
+        if self.root is None:
+            return None
+        if self._min is None:
+            self._min = self._find_min(self.root).key
+        return self._min
 
-        # 右右情况
-        if balance < -1 and self.get_balance(node.right) <= 0:
-            return self.rotate_left(node)
+    def max(self):
+        """最大键，空树返回 None"""
+        if self.root is None:
+            return None
+        if self._max is None:
+            current = self.root
+            while current.right is not None:
+                current = current.right
+            self._max = current.key
+        return self._max
+
+    def get_stats(self):
+        """键数、树高和最小/最大键，供界面和布局直接读取"""
+        return {'size': self.size(), 'height': self.get_height(self.root),
+                'min': self.min(), 'max': self.max()}
+
+    def successor(self, value):
+        """大于 value 的最小键，不存在时返回 None"""
+        result = None
+        current = self.root
+        while current is not None:
+            if current.key > value:
+                result = current.key
+                current = current.left
+            else:
+                current = current.right
+        return result
+
+    def predecessor(self, value):
+        """小于 value 的最大键，不存在时返回 None"""
+        result = None
+        current = self.root
+        while current is not None:
+            if current.key < value:
+                result = current.key
+                current = current.right
+            else:
+                current = current.left
+        return result
+
+    def iter_range(self, lo, hi):
+        """按升序惰性产出闭区间 [lo, hi] 内的键，O(log n + k) 时间、O(树高) 额外空间"""
+        stack = []
+        current = self.root
+        while stack or current is not None:
+            while current is not None:
+                if current.key < lo:
+                    current = current.right  # 当前节点及其左子树都小于 lo
+                else:
+                    stack.append(current)
+                    current = current.left
+            if not stack:
+                return
+            current = stack.pop()
+            if current.key > hi:
+                return
+            yield current.key
+            if current.count > 1:
+                yield from repeat(current.key, current.count - 1)
+            current = current.right
+
+    def rank(self, value):
+        """小于 value 的键的个数，即 value 在有序序列中的位置（O(log n)）"""
+        return self._count_less(value, inclusive=False)
+
+    def _count_less(self, value, inclusive):
+        """统计小于（inclusive 为 True 时小于等于）value 的键的个数"""
+        count = 0
+        current = self.root
+        while current is not None:
+            if current.key < value or (inclusive and current.key == value):
+                # 左子树和当前节点都不大于 value
+                count += self.get_size(current.left) + current.count
+                current = current.right
+            else:
+                current = current.left
+        return count
+
+    def select(self, k):
+        """返回第 k 小的键（k 从 0 开始）"""
+        if not 0 <= k < self.size():
+            raise IndexError("序号超出范围")
+
+        current = self.root
+        while True:
+            left_size = self.get_size(current.left)
+            if k < left_size:
+                current = current.left
+            elif k < left_size + current.count:
+                return current.key
+            else:
+                k -= left_size + current.count
+                current = current.right
 
-        # 右左情况
-        if balance < -1 and self.get_balance(node.right) > 0:
-            node.right = self.rotate_right(node.right)
-            return self.rotate_left(node)
+    def count_between(self, lo, hi):
+        """闭区间 [lo, hi] 内的键的个数"""
+        if hi < lo:
+            return 0
+        return self._count_less(hi, inclusive=True) - self._count_less(lo, inclusive=False)
 
-        return node
+    def median(self):
+        """中位数（偶数个键时取下中位数），空树返回 None"""
+        if self.root is None:
+            return None
+        return self.select((self.size() - 1) // 2)
 
     def _find_min(self, node):
         """找到子树中的最小节点"""
@@ -216,20 +678,29 @@ class AVLTree:
             return None
 
         def build_structure(node):
-            if node is None:
-                return None
-
             return {
-                'data': f"{node.data['value']}({node.data['balance']})",  # 显示值和平衡因子
-                'id': node.data['id'],
-                'balance': node.data['balance'],
-                'left': build_structure(node.left),
-                'right': build_structure(node.right)
+                'data': f"{node.label}({node.balance})",  # 显示值（重复键附带次数）和平衡因子
+                'id': node.uid,
+                'count': node.count,
+                'balance': node.balance,
+                'left': None,
+                'right': None
             }
 
-        return build_structure(self.root)
+        # 显式栈自上而下填充孩子，不受递归深度限制
+        structure = build_structure(self.root)
+        stack = [(self.root, structure)]
+        while stack:
+            node, parent_structure = stack.pop()
+            for side, child in (('left', node.left), ('right', node.right)):
+                if child is not None:
+                    parent_structure[side] = build_structure(child)
+                    stack.append((child, parent_structure[side]))
+        return structure
 
     def clear(self):
         """清空树"""
         self.root = None
-        self.node_counter = 0
\ No newline at end of file
+        self.node_counter = 0
+        self._min = self._max = None
+        self.reset_counters()
\ No newline at end of file
@@ -0,0 +1,230 @@
+import mmap
+import struct
+from bisect import bisect_left, bisect_right
+
+from .b_tree import BTree
+
+
+class BPlusPageFile:
+    """页式存储的只读 B+树文件
+
+    文件按固定大小的页组织：第 0 页为文件头，之后依次是叶子页和各层内部页。
+    构建时流式写出，只在内存中保留每片叶子的页号和最小键；读取时用 mmap 按需访问页面，
+    因此键的总量可以超过内存。键为 64 位有符号整数。
+    """
+
+    MAGIC = b'BPT1'
+    FILE_HEADER = struct.Struct('<4sIIqqqq')  # 魔数, 页大小, 最小度数, 根页, 首叶页, 树高, 键数
+    NODE_HEADER = struct.Struct('<BxHq')  # 是否叶子, 键数, 下一叶子页（0 表示没有）
+    SLOT = 8
+    CACHED_PAGES = 4096  # 最多缓存多少个已解码的内部页（上层节点被每次查找访问）
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            header = self._file.read(self.FILE_HEADER.size)
+            if len(header) < self.FILE_HEADER.size:
+                raise ValueError("不是有效的B+树页文件")
+            (magic, self.page_size, self.min_degree, self.root_page,
+             self.first_leaf_page, self.height, self.count) = self.FILE_HEADER.unpack(header)
+            if magic != self.MAGIC:
+                raise ValueError("不是有效的B+树页文件")
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._internal_cache = {}
+        except Exception:
+            self._file.close()
+            raise
+
+    @classmethod
+    def degree_for_page(cls, page_size):
+        """一页能容纳的最小度数：页头 + (2t-1) 个键 + 2t 个孩子页号"""
+        return (page_size - cls.NODE_HEADER.size + cls.SLOT) // (4 * cls.SLOT)
+
+    @classmethod
+    def build(cls, path, keys, page_size=4096):
+        """由严格递增的整数键流构建页文件，叶子页写满后立即落盘"""
+        t = cls.degree_for_page(page_size)
+        if t < 2:
+            raise ValueError("页太小，至少要容纳3个键")
+        max_keys = 2 * t - 1
+
+        with open(path, 'wb') as out:
+            out.write(bytes(page_size))  # 文件头占位，最后回填
+            writer = _PageWriter(out, page_size, max_keys)
+
+            # 每片叶子写满再落盘；始终压住上一片，以便最后一片过瘦时与它重新均分
+            count = 0
+            last_key = None
+            pending, current = None, []
+            for key in keys:
+                if last_key is not None and key <= last_key:
+                    raise ValueError("键必须严格递增")
+                last_key = key
+                count += 1
+                current.append(key)
+                if len(current) == max_keys:
+                    if pending is not None:
+                        writer.write_leaf(pending, has_next=True)
+                    pending, current = current, []
+
+            if pending is not None and current and len(current) < t - 1:
+                merged = pending + current
+                half = len(merged) // 2
+                pending, current = merged[:half], merged[half:]
+            if pending is not None:
+                writer.write_leaf(pending, has_next=bool(current))
+            if current:
+                writer.write_leaf(current, has_next=False)
+
+            # 内部层在内存中逐层构建：每层只有 (页号, 子树最小键)，数量约为下一层的 1/t
+            level = writer.leaves
+            height = 1 if level else 0
+            while len(level) > 1:
+                group_count = -(-len(level) // (2 * t))
+                parents = []
+                start = 0
+                for size in BTree._even_sizes(len(level), group_count):
+                    group = level[start:start + size]
+                    page = writer.write_internal([low for _, low in group[1:]],
+                                                 [page for page, _ in group])
+                    parents.append((page, group[0][1]))
+                    start += size
+                level = parents
+                height += 1
+
+            root_page = level[0][0] if level else 0
+            first_leaf_page = 1 if level else 0
+            out.seek(0)
+            out.write(cls.FILE_HEADER.pack(cls.MAGIC, page_size, t, root_page,
+                                           first_leaf_page, height, count))
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def size(self):
+        return self.count
+
+    def get_height(self):
+        return self.height
+
+    def is_empty(self):
+        return self.count == 0
+
+    def read_page(self, page):
+        """读取一页，返回 (是否叶子, 键元组, 孩子页号元组, 下一叶子页)"""
+        cached = self._internal_cache.get(page)
+        if cached is not None:
+            return cached
+
+        offset = page * self.page_size
+        is_leaf, key_count, next_page = self.NODE_HEADER.unpack_from(self._map, offset)
+        offset += self.NODE_HEADER.size
+        keys = struct.unpack_from(f'<{key_count}q', self._map, offset)
+        if is_leaf:
+            return True, keys, (), next_page
+        offset += self.SLOT * (2 * self.min_degree - 1)
+        children = struct.unpack_from(f'<{key_count + 1}q', self._map, offset)
+        result = False, keys, children, 0
+        if len(self._internal_cache) < self.CACHED_PAGES:
+            self._internal_cache[page] = result
+        return result
+
+    def _find_leaf(self, key):
+        page = self.root_page
+        is_leaf, keys, children, next_page = self.read_page(page)
+        while not is_leaf:
+            page = children[bisect_right(keys, key)]
+            is_leaf, keys, children, next_page = self.read_page(page)
+        return keys, next_page
+
+    def search(self, key):
+        """键是否存在，只读取从根到叶子的一条路径上的页"""
+        if self.count == 0:
+            return False
+        keys, _ = self._find_leaf(key)
+        i = bisect_left(keys, key)
+        return i < len(keys) and keys[i] == key
+
+    def __contains__(self, key):
+        return self.search(key)
+
+    def iter_range(self, lo, hi):
+        """按升序产出 [lo, hi] 内的键，沿叶子页链表顺序读取"""
+        if self.count == 0:
+            return
+        keys, next_page = self._find_leaf(lo)
+        i = bisect_left(keys, lo)
+        while True:
+            for key in keys[i:]:
+                if key > hi:
+                    return
+                yield key
+            if not next_page:
+                return
+            _, keys, _, next_page = self.read_page(next_page)
+            i = 0
+
+    def get_tree_structure(self, max_depth=3):
+        """获取前 max_depth 层的结构信息，用于可视化；更深的层只记录省略的孩子数"""
+        if self.count == 0:
+            return None
+
+        def build_structure(page, depth):
+            is_leaf, keys, children, next_page = self.read_page(page)
+            structure = {
+                'keys': list(keys),
+                'data': " | ".join(map(str, keys)),
+                'id': f"page_{page}",
+                'leaf': is_leaf,
+                'children': []
+            }
+            if next_page:
+                structure['next'] = f"page_{next_page}"
+            if children and depth + 1 < max_depth:
+                structure['children'] = [build_structure(child, depth + 1) for child in children]
+            elif children:
+                structure['hidden'] = len(children)
+            return structure
+
+        return build_structure(self.root_page, 0)
+
+
+class _PageWriter:
+    """按页号顺序追加写出节点页"""
+
+    def __init__(self, out, page_size, max_keys):
+        self.out = out
+        self.page_size = page_size
+        self.max_keys = max_keys
+        self.next_page = 1
+        self.leaves = []  # (页号, 最小键)
+
+    def _write(self, is_leaf, keys, children, next_page):
+        slot = BPlusPageFile.SLOT
+        page = bytearray(self.page_size)
+        BPlusPageFile.NODE_HEADER.pack_into(page, 0, is_leaf, len(keys), next_page)
+        offset = BPlusPageFile.NODE_HEADER.size
+        struct.pack_into(f'<{len(keys)}q', page, offset, *keys)
+        if children:
+            offset += slot * self.max_keys
+            struct.pack_into(f'<{len(children)}q', page, offset, *children)
+        self.out.write(page)
+        self.next_page += 1
+        return self.next_page - 1
+
+    def write_leaf(self, keys, has_next):
+        # 叶子页连续分配，后继叶子就是下一页
+        page = self._write(True, keys, (), self.next_page + 1 if has_next else 0)
+        self.leaves.append((page, keys[0]))
+        return page
+
+    def write_internal(self, keys, children):
+        return self._write(False, keys, children, 0)
\ No newline at end of file
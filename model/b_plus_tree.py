@@ -0,0 +1,135 @@
+from bisect import bisect_left, bisect_right
+
+from .b_tree import BTree
+
+
+class BPlusTree(BTree):
+    """B+树实现（键唯一）
+
+    所有键都存放在叶子中，内部节点只保存分隔键：keys[i] 左侧子树的键都小于它，
+    右侧子树的键都不小于它。叶子按键序用 next 串成链表，区间扫描定位到起点后顺链读取。
+    """
+
+    def _first_leaf(self):
+        node = self.root
+        while node is not None and not node.leaf:
+            node = node.children[0]
+        return node
+
+    def _find_leaf(self, key):
+        """下降到可能包含 key 的叶子"""
+        node = self.root
+        while node is not None and not node.leaf:
+            node = node.children[bisect_right(node.keys, key)]
+        return node
+
+    def search(self, key):
+        """搜索键，返回包含该键的叶子，未找到返回 None"""
+        leaf = self._find_leaf(key)
+        if leaf is not None:
+            i = bisect_left(leaf.keys, key)
+            if i < len(leaf.keys) and leaf.keys[i] == key:
+                return leaf
+        return None
+
+    def _split_child(self, parent, i):
+        """拆分已满的孩子；叶子拆分时右半第一个键复制到父节点并接入叶子链表"""
+        child = parent.children[i]
+        if not child.leaf:
+            super()._split_child(parent, i)
+            return
+
+        t = self.min_degree
+        sibling = self._create_node(child.keys[t - 1:])
+        del child.keys[t - 1:]
+        sibling.next = child.next
+        child.next = sibling
+        parent.keys.insert(i, sibling.keys[0])
+        parent.children.insert(i + 1, sibling)
+
+    def _borrow_from_left(self, parent, i):
+        child = parent.children[i]
+        if not child.leaf:
+            super()._borrow_from_left(parent, i)
+            return
+        child.keys.insert(0, parent.children[i - 1].keys.pop())
+        parent.keys[i - 1] = child.keys[0]
+
+    def _borrow_from_right(self, parent, i):
+        child, right = parent.children[i], parent.children[i + 1]
+        if not child.leaf:
+            super()._borrow_from_right(parent, i)
+            return
+        child.keys.append(right.keys.pop(0))
+        parent.keys[i] = right.keys[0]
+
+    def _merge_children(self, parent, i):
+        left = parent.children[i]
+        if not left.leaf:
+            super()._merge_children(parent, i)
+            return
+        # 叶子合并时分隔键直接丢弃，并从链表中摘除右叶子
+        right = parent.children.pop(i + 1)
+        del parent.keys[i]
+        left.keys.extend(right.keys)
+        left.next = right.next
+
+    def delete(self, key):
+        """删除键，键不存在时返回 False；内部节点中残留的分隔键仍能正确导航"""
+        if key not in self:
+            return False
+
+        node = self.root
+        while not node.leaf:
+            i = self._ensure_child(node, bisect_right(node.keys, key))
+            node = node.children[i]
+        node.keys.remove(key)
+
+        if not self.root.keys:
+            self.root = None
+        self.count -= 1
+        return True
+
+    def min(self):
+        leaf = self._first_leaf()
+        return None if leaf is None else leaf.keys[0]
+
+    def iter_range(self, lo, hi):
+        """按升序产出 [lo, hi] 内的键：定位起始叶子后沿叶子链表顺序读取"""
+        leaf = self._find_leaf(lo)
+        if leaf is None:
+            return
+        i = bisect_left(leaf.keys, lo)
+        while leaf is not None:
+            for key in leaf.keys[i:]:
+                if key > hi:
+                    return
+                yield key
+            leaf = leaf.next
+            i = 0
+
+    def iter_leaves(self):
+        """沿叶子链表从左到右产出叶子"""
+        leaf = self._first_leaf()
+        while leaf is not None:
+            yield leaf
+            leaf = leaf.next
+
+    def _build_leaves(self, keys):
+        """把有序键装满叶子并串成链表，分隔键取每片叶子（第一片除外）的最小键"""
+        leaf_count = -(-len(keys) // self.max_keys)
+        leaves = []
+        start = 0
+        for size in self._even_sizes(len(keys), leaf_count):
+            leaf = self._create_node(keys[start:start + size])
+            if leaves:
+                leaves[-1].next = leaf
+            leaves.append(leaf)
+            start += size
+        return leaves, [leaf.keys[0] for leaf in leaves[1:]]
+
+    def _node_structure(self, node):
+        structure = super()._node_structure(node)
+        if node.next is not None:
+            structure['next'] = node.next.uid
+        return structure
\ No newline at end of file
@@ -0,0 +1,289 @@
+from bisect import bisect_left, bisect_right, insort
+
+from .b_tree_node import BTreeNode
+
+
+class BTree:
+    """B树实现（键唯一）
+
+    每个节点最多 2t-1 个键、2t 个孩子，非根节点至少 t-1 个键，t 为最小度数。
+    插入和删除都自顶向下一趟完成：下降前先拆分满节点或补足过瘦的孩子，不需要回溯。
+    """
+
+    def __init__(self, min_degree=2):
+        if min_degree < 2:
+            raise ValueError("最小度数至少为2")
+        self.min_degree = min_degree
+        self.root = None
+        self.node_counter = 0
+        self.count = 0
+
+    @property
+    def max_keys(self):
+        return 2 * self.min_degree - 1
+
+    def _create_node(self, keys=None, children=None):
+        self.node_counter += 1
+        return BTreeNode(self.node_counter, keys, children)
+
+    def is_empty(self):
+        return self.root is None
+
+    def size(self):
+        return self.count
+
+    def get_height(self):
+        """树高（所有叶子同深度，沿最左路径计数即可）"""
+        height = 0
+        node = self.root
+        while node is not None:
+            height += 1
+            node = None if node.leaf else node.children[0]
+        return height
+
+    def search(self, key):
+        """搜索键，返回包含该键的节点，未找到返回 None"""
+        node = self.root
+        while node is not None:
+            i = bisect_left(node.keys, key)
+            if i < len(node.keys) and node.keys[i] == key:
+                return node
+            node = None if node.leaf else node.children[i]
+        return None
+
+    def __contains__(self, key):
+        return self.search(key) is not None
+
+    def _split_child(self, parent, i):
+        """拆分 parent 的第 i 个（已满的）孩子，中间键上移到 parent"""
+        t = self.min_degree
+        child = parent.children[i]
+        sibling = self._create_node(child.keys[t:], child.children[t:])
+        parent.keys.insert(i, child.keys[t - 1])
+        parent.children.insert(i + 1, sibling)
+        del child.keys[t - 1:]
+        del child.children[t:]
+
+    def insert(self, key):
+        """插入键，键已存在时返回 False"""
+        if self.root is None:
+            self.root = self._create_node([key])
+            self.count = 1
+            return True
+        if key in self:
+            return False
+
+        if len(self.root.keys) == self.max_keys:
+            self.root = self._create_node(children=[self.root])
+            self._split_child(self.root, 0)
+
+        node = self.root
+        while not node.leaf:
+            i = bisect_right(node.keys, key)
+            if len(node.children[i].keys) == self.max_keys:
+                self._split_child(node, i)
+                if key >= node.keys[i]:
+                    i += 1
+            node = node.children[i]
+        insort(node.keys, key)
+        self.count += 1
+        return True
+
+    def _borrow_from_left(self, parent, i):
+        """孩子 i 从左兄弟借一个键（经由父节点的分隔键旋转）"""
+        child, left = parent.children[i], parent.children[i - 1]
+        child.keys.insert(0, parent.keys[i - 1])
+        parent.keys[i - 1] = left.keys.pop()
+        if not left.leaf:
+            child.children.insert(0, left.children.pop())
+
+    def _borrow_from_right(self, parent, i):
+        """孩子 i 从右兄弟借一个键（经由父节点的分隔键旋转）"""
+        child, right = parent.children[i], parent.children[i + 1]
+        child.keys.append(parent.keys[i])
+        parent.keys[i] = right.keys.pop(0)
+        if not right.leaf:
+            child.children.append(right.children.pop(0))
+
+    def _merge_children(self, parent, i):
+        """把孩子 i+1 和两者之间的分隔键并入孩子 i"""
+        left = parent.children[i]
+        right = parent.children.pop(i + 1)
+        separator = parent.keys.pop(i)
+        left.keys.append(separator)
+        left.keys.extend(right.keys)
+        left.children.extend(right.children)
+
+    def _ensure_child(self, parent, i):
+        """保证即将下降的孩子至少有 t 个键，返回调整后该区间所在孩子的下标"""
+        t = self.min_degree
+        children = parent.children
+        if len(children[i].keys) >= t:
+            return i
+        if i > 0 and len(children[i - 1].keys) >= t:
+            self._borrow_from_left(parent, i)
+        elif i + 1 < len(children) and len(children[i + 1].keys) >= t:
+            self._borrow_from_right(parent, i)
+        else:
+            if i + 1 == len(children):
+                i -= 1
+            self._merge_children(parent, i)
+            if parent is self.root and not parent.keys:
+                self.root = parent.children[0]  # 根被合并空，树高减一
+        return i
+
+    def delete(self, key):
+        """删除键，键不存在时返回 False"""
+        if key not in self:
+            return False
+
+        t = self.min_degree
+        node = self.root
+        while True:
+            i = bisect_left(node.keys, key)
+            if i < len(node.keys) and node.keys[i] == key:
+                if node.leaf:
+                    del node.keys[i]
+                    break
+                left, right = node.children[i], node.children[i + 1]
+                if len(left.keys) >= t:
+                    # 用前驱替换后转去左子树删除前驱
+                    key = node.keys[i] = self._subtree_max(left)
+                    node = left
+                elif len(right.keys) >= t:
+                    key = node.keys[i] = self._subtree_min(right)
+                    node = right
+                else:
+                    self._merge_children(node, i)
+                    if node is self.root and not node.keys:
+                        self.root = left
+                    node = left
+            else:
+                node = node.children[self._ensure_child(node, i)]
+
+        if not self.root.keys:
+            self.root = None
+        self.count -= 1
+        return True
+
+    @staticmethod
+    def _subtree_min(node):
+        while not node.leaf:
+            node = node.children[0]
+        return node.keys[0]
+
+    @staticmethod
+    def _subtree_max(node):
+        while not node.leaf:
+            node = node.children[-1]
+        return node.keys[-1]
+
+    def min(self):
+        """最小键，空树返回 None"""
+        return None if self.root is None else self._subtree_min(self.root)
+
+    def max(self):
+        """最大键，空树返回 None"""
+        return None if self.root is None else self._subtree_max(self.root)
+
+    def iter_range(self, lo, hi):
+        """按升序产出 [lo, hi] 内的键，只访问与区间相交的节点"""
+        stack = []
+        node = self.root
+        while node is not None:
+            i = bisect_left(node.keys, lo)
+            stack.append((node, i))
+            node = None if node.leaf else node.children[i]
+
+        # 栈中 (节点, i) 表示该节点下一个待输出的键是 keys[i]
+        while stack:
+            node, i = stack.pop()
+            if node.leaf:
+                for key in node.keys[i:]:
+                    if key > hi:
+                        return
+                    yield key
+                continue
+            if i == len(node.keys):
+                continue
+            key = node.keys[i]
+            if key > hi:
+                return
+            yield key
+            stack.append((node, i + 1))
+            child = node.children[i + 1]
+            while child is not None:
+                stack.append((child, 0))
+                child = None if child.leaf else child.children[0]
+
+    def inorder_traversal(self):
+        """升序返回所有键"""
+        if self.root is None:
+            return []
+        return list(self.iter_range(self.min(), self.max()))
+
+    def _build_leaves(self, keys):
+        """把有序键分成若干叶子，返回 (叶子列表, 叶子之间的分隔键)"""
+        # B树中相邻叶子之间的键上移作分隔键，每片叶子连同其后的分隔键最多占 2t 个
+        leaf_count = -(-(len(keys) + 1) // (2 * self.min_degree))
+        sizes = self._even_sizes(len(keys) - leaf_count + 1, leaf_count)
+        leaves, separators = [], []
+        start = 0
+        for size in sizes:
+            if leaves:
+                separators.append(keys[start])
+                start += 1
+            leaves.append(self._create_node(keys[start:start + size]))
+            start += size
+        return leaves, separators
+
+    @staticmethod
+    def _even_sizes(total, parts):
+        """把 total 尽量均匀地分成 parts 份"""
+        base, extra = divmod(total, parts)
+        return [base + 1] * extra + [base] * (parts - extra)
+
+    def bulk_load(self, values):
+        """批量装载：与现有键合并去重后自底向上逐层构建，所有节点尽量装满"""
+        keys = sorted(set(self.inorder_traversal()).union(values))
+        self.root = None
+        self.count = len(keys)
+        if not keys:
+            return
+
+        level, separators = self._build_leaves(keys)
+        max_children = 2 * self.min_degree
+        while len(level) > 1:
+            # 每个父节点收 t..2t 个孩子，组内分隔键成为父节点的键，组间分隔键继续上移
+            group_count = -(-len(level) // max_children)
+            parents, upper = [], []
+            start = 0
+            for size in self._even_sizes(len(level), group_count):
+                if parents:
+                    upper.append(separators[start - 1])
+                parents.append(self._create_node(separators[start:start + size - 1],
+                                                 level[start:start + size]))
+                start += size
+            level, separators = parents, upper
+        self.root = level[0]
+
+    def clear(self):
+        """清空树"""
+        self.root = None
+        self.node_counter = 0
+        self.count = 0
+
+    def _node_structure(self, node):
+        return {
+            'keys': list(node.keys),
+            'data': str(node),
+            'id': node.uid,
+            'leaf': node.leaf,
+            'children': [self._node_structure(child) for child in node.children]
+        }
+
+    def get_tree_structure(self):
+        """获取树结构信息，用于可视化（多键节点，children 为孩子列表）"""
+        if self.root is None:
+            return None
+        return self._node_structure(self.root)
\ No newline at end of file
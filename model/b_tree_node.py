@@ -0,0 +1,24 @@
+class BTreeNode:
+    """B树/B+树节点：keys 有序存放，children 为空表示叶子"""
+
+    __slots__ = ('keys', 'children', 'next', 'id')
+
+    ID_PREFIX = "btree"  # 可视化标识前缀
+
+    def __init__(self, node_id, keys=None, children=None):
+        self.keys = keys if keys is not None else []
+        self.children = children if children is not None else []
+        self.next = None  # B+树中指向右侧相邻叶子，B树不使用
+        self.id = node_id
+
+    @property
+    def leaf(self):
+        return not self.children
+
+    @property
+    def uid(self):
+        """可视化使用的字符串标识，如 btree_3"""
+        return f"{self.ID_PREFIX}_{self.id}"
+
+    def __str__(self):
+        return " | ".join(map(str, self.keys))
\ No newline at end of file
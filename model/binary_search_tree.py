@@ -1,89 +1,366 @@
-from .binary_tree_node import BinaryTreeNode
-import uuid
+from .search_tree_node import SearchTreeNode
+from itertools import repeat
+from operator import attrgetter
 
 class BinarySearchTree:
-    """二叉搜索树实现"""
+    """二叉搜索树实现
 
-    def __init__(self):
+    multiset 为 True 时每个键只占一个节点，重复插入只增加节点上的计数，
+    否则重复值作为新节点插入右子树。
+    键数、树高和最小/最大键随修改增量维护，读取为 O(1)；删除可能降低树高或移走最值时
+    只把对应缓存标记为失效，下次读取时再重新计算。
+    """
+
+    def __init__(self, multiset=False):
         self.root = None
         self.node_counter = 0  # 节点计数器，用于生成唯一ID
+        self.multiset = multiset
+        self._reset_stats()
 
-    def insert(self, data):
-        """插入节点"""
-        # 为每个节点创建唯一标识符
-        self.node_counter += 1
-        node_data = {
-            'value': data,
-            'id': f"bst_{self.node_counter}"  # 唯一标识符
-        }
+    def _reset_stats(self):
+        """空树的统计量；_height、_min、_max 为 None 表示缓存失效"""
+        self.count = 0  # 键的总数（多重集模式下重复键按次数计）
+        self._height = 0
+        self._min = self._max = None
 
-        print(f"插入节点: {data}, ID: bst_{self.node_counter}")  # 调试输出
+    def _note_key(self, key):
+        """插入键后更新最小/最大键缓存"""
+        if self._min is not None and key < self._min:
+            self._min = key
+        if self._max is not None and key > self._max:
+            self._max = key
 
+    def insert(self, data):
+        """插入节点（迭代实现，退化成链也不会触及递归深度限制）"""
         if self.root is None:
-            self.root = BinaryTreeNode(node_data)
+            self.node_counter += 1
+            self.root = SearchTreeNode(data, self.node_counter)
+            self.count = self._height = 1
+            self._min = self._max = data
             return True
-        else:
-            return self._insert_recursive(self.root, node_data)
-
-    def _insert_recursive(self, node, data):
-        """递归插入辅助方法"""
-        if data['value'] < node.data['value']:
-            if node.left is None:
-                node.left = BinaryTreeNode(data)
-                node.left.parent = node
-                return True
-            else:
-                return self._insert_recursive(node.left, data)
-        else:  # 允许重复值，插入到右子树
-            if node.right is None:
-                node.right = BinaryTreeNode(data)
-                node.right.parent = node
+
+        self.count += 1
+        self._note_key(data)
+        current = self.root
+        depth = 2  # 新节点挂在 current 下方时所在的层数
+        while True:
+            if data < current.key:
+                if current.left is None:
+                    break
+                current = current.left
+            elif self.multiset and data == current.key:
+                current.count += 1  # 已有的键只计数，不分配节点
                 return True
-            else:
-                return self._insert_recursive(node.right, data)
+            else:  # 允许重复值，插入到右子树
+                if current.right is None:
+                    break
+                current = current.right
+            depth += 1
+
+        # 为每个节点分配唯一编号
+        self.node_counter += 1
+        new_node = SearchTreeNode(data, self.node_counter)
+        if data < current.key:
+            current.left = new_node
+        else:
+            current.right = new_node
+        new_node.parent = current
+        if self._height is not None and depth > self._height:
+            self._height = depth
+        return True
 
     def search(self, data):
         """搜索节点"""
-        return self._search_recursive(self.root, data)
+        current = self.root
+        while current is not None:
+            value = current.key
+            if data == value:
+                return current
+            current = current.left if data < value else current.right
+        return None
 
-    def _search_recursive(self, node, data):
-        """递归搜索辅助方法"""
+    def delete(self, data):
+        """删除节点"""
+        node = self.search(data)
         if node is None:
-            return None
+            return
 
-        if data == node.data['value']:
-            return node
-        elif data < node.data['value']:
-            return self._search_recursive(node.left, data)
+        self.count -= 1
+        if node.count > 1:
+            node.count -= 1
+            return
+
+        if data == self._min:
+            self._min = None
+        if data == self._max:
+            self._max = None
+
+        if node.left is not None and node.right is not None:
+            # 有两个子节点，用右子树的最小节点替换后删除该最小节点
+            successor = self._find_min(node.right)
+            node.key, node.id, node.count = successor.key, successor.id, successor.count
+            node = successor
+
+        if self._height is not None and not (node.left is None and node.right is None
+                                             and self._depth(node) < self._height):
+            self._height = None  # 只有摘除比最深层浅的叶子时树高才确定不变
+        self._splice(node)
+
+    @staticmethod
+    def _depth(node):
+        """节点所在的层数（根为第 1 层）"""
+        depth = 0
+        while node is not None:
+            depth += 1
+            node = node.parent
+        return depth
+
+    def _splice(self, node):
+        """摘除至多只有一个子节点的节点，返回其父节点"""
+        child = node.left if node.left is not None else node.right
+        parent = node.parent
+
+        if child is not None:
+            child.parent = parent
+        if parent is None:
+            self.root = child
+        elif parent.left is node:
+            parent.left = child
         else:
-            return self._search_recursive(node.right, data)
+            parent.right = child
 
-    def delete(self, data):
-        """删除节点"""
-        self.root = self._delete_recursive(self.root, data)
+        node.parent = node.left = node.right = None
+        return parent
 
-    def _delete_recursive(self, node, data):
-        """递归删除辅助方法"""
-        if node is None:
+    def bulk_load(self, values):
+        """批量装载：与已有节点合并后一次排序，按中位数构建高度平衡的BST
+
+        Timsort 对已排序输入（以及"已有节点 + 新值"两段有序序列）为线性时间。
+        """
+        start = self.node_counter + 1
+        new_nodes = [SearchTreeNode(value, node_id) for node_id, value in enumerate(values, start)]
+        self.node_counter += len(new_nodes)
+        new_nodes.sort(key=attrgetter('key'))
+
+        nodes = self._inorder_nodes()
+        if nodes:
+            nodes.extend(new_nodes)
+            nodes.sort(key=attrgetter('key'))  # 稳定排序：重复值中已有节点在前
+        else:
+            nodes = new_nodes
+
+        if self.multiset:
+            nodes = self._merge_duplicates(nodes)
+        self.root = self._build_balanced(nodes)
+        self.count = sum(node.count for node in nodes)
+        # 中位数构建的树高恰为节点数的二进制位数
+        self._height = len(nodes).bit_length()
+        self._min = nodes[0].key if nodes else None
+        self._max = nodes[-1].key if nodes else None
+
+    @staticmethod
+    def _merge_duplicates(nodes):
+        """有序节点序列中相同的键合并到第一个节点上，累加计数"""
+        merged = []
+        for node in nodes:
+            if merged and merged[-1].key == node.key:
+                merged[-1].count += node.count
+            else:
+                merged.append(node)
+        return merged
+
+    def _inorder_nodes(self):
+        """按中序收集所有节点（迭代实现）"""
+        return self._inorder_nodes_of(self.root)
+
+    def _inorder_nodes_of(self, root):
+        """按中序收集子树中的所有节点"""
+        result = []
+        stack = []
+        current = root
+        while stack or current is not None:
+            while current is not None:
+                stack.append(current)
+                current = current.left
+            current = stack.pop()
+            result.append(current)
+            current = current.right
+        return result
+
+    def _build_balanced(self, nodes):
+        """由有序节点构建平衡树：中位数为根，左右两半分别递推（显式栈）"""
+        if not nodes:
             return None
 
-        if data < node.data['value']:
-            node.left = self._delete_recursive(node.left, data)
-        elif data > node.data['value']:
-            node.right = self._delete_recursive(node.right, data)
+        root = None
+        stack = [(0, len(nodes), None, False)]
+        while stack:
+            lo, hi, parent, is_left = stack.pop()
+            mid = (lo + hi) // 2
+            node = nodes[mid]
+            node.left = node.right = None  # 已有节点会被重新链接
+            node.parent = parent
+            if parent is None:
+                root = node
+            elif is_left:
+                parent.left = node
+            else:
+                parent.right = node
+
+            if mid > lo:
+                stack.append((lo, mid, node, True))
+            if hi > mid + 1:
+                stack.append((mid + 1, hi, node, False))
+
+        return root
+
+    def size(self):
+        return self.count
+
+    def get_height(self):
+        """树高，缓存失效时逐层遍历重新计算"""
+        if self._height is None:
+            levels = 0
+            level = [self.root] if self.root is not None else []
+            while level:
+                levels += 1
+                level = [child for node in level
+                         for child in (node.left, node.right) if child is not None]
+            self._height = levels
+        return self._height
+
+    def min(self):
+        """最小键，空树返回 None"""
+        if self.root is None:
+            return None
+        if self._min is None:
+            self._min = self._find_min(self.root).key
+        return self._min
+
+    def max(self):
+        """最大键，空树返回 None"""
+        if self.root is None:
+            return None
+        if self._max is None:
+            current = self.root
+            while current.right is not None:
+                current = current.right
+            self._max = current.key
+        return self._max
+
+    def get_stats(self):
+        """键数、树高和最小/最大键，供界面和布局直接读取"""
+        return {'size': self.count, 'height': self.get_height(),
+                'min': self.min(), 'max': self.max()}
+
+    def rebuild_stats(self):
+        """直接替换根节点（如反序列化）后重新统计"""
+        self._reset_stats()
+        self.count = sum(node.count for node in self._inorder_nodes())
+        self._height = None
+
+    def successor(self, value):
+        """大于 value 的最小键，不存在时返回 None"""
+        result = None
+        current = self.root
+        while current is not None:
+            if current.key > value:
+                result = current.key
+                current = current.left
+            else:
+                current = current.right
+        return result
+
+    def predecessor(self, value):
+        """小于 value 的最大键，不存在时返回 None"""
+        result = None
+        current = self.root
+        while current is not None:
+            if current.key < value:
+                result = current.key
+                current = current.right
+            else:
+                current = current.left
+        return result
+
+    def iter_range(self, lo, hi):
+        """按升序惰性产出闭区间 [lo, hi] 内的键，O(log n + k) 时间、O(树高) 额外空间"""
+        stack = []
+        current = self.root
+        while stack or current is not None:
+            while current is not None:
+                if current.key < lo:
+                    current = current.right  # 当前节点及其左子树都小于 lo
+                else:
+                    stack.append(current)
+                    current = current.left
+            if not stack:
+                return
+            current = stack.pop()
+            if current.key > hi:
+                return
+            yield current.key
+            if current.count > 1:
+                yield from repeat(current.key, current.count - 1)
+            current = current.right
+
+    def delete_range(self, lo, hi):
+        """删除闭区间 [lo, hi] 内的所有键，返回删除个数
+
+        按区间两端把树拆成三段再把两侧接回，只沿两条路径改指针，
+        不像逐个 delete 那样每次都从根查找。
+        """
+        if self.root is None or hi < lo:
+            return 0
+
+        left, rest = self._split(self.root, lo, inclusive=False)
+        middle, right = self._split(rest, hi, inclusive=True)
+        removed = sum(node.count for node in self._inorder_nodes_of(middle))
+        self.count -= removed
+        self._height = None  # 右段挂到左段下方后树形改变
+        if removed:
+            self._min = self._max = None
+
+        if left is None:
+            self.root = right
         else:
-            # 找到要删除的节点
-            if node.left is None:
-                return node.right
-            elif node.right is None:
-                return node.left
+            self.root = left
+            if right is not None:
+                # 右段整体挂到左段最大节点的右侧
+                tail = left
+                while tail.right is not None:
+                    tail = tail.right
+                tail.right = right
+                right.parent = tail
+        return removed
+
+    def _split(self, root, key, inclusive):
+        """把子树拆成两棵：左边的键小于 key（inclusive 时小于等于），其余在右边"""
+        path = []
+        current = root
+        while current is not None:
+            path.append(current)
+            goes_left = current.key < key or (inclusive and current.key == key)
+            current = current.right if goes_left else current.left
+
+        # 自底向上：归入左侧的节点保留左子树、右孩子接上更深处拆出的左段，右侧对称
+        left = right = None
+        for node in reversed(path):
+            if node.key < key or (inclusive and node.key == key):
+                node.right = left
+                if left is not None:
+                    left.parent = node
+                left = node
             else:
-                # 有两个子节点，找到右子树的最小节点
-                min_node = self._find_min(node.right)
-                node.data = min_node.data
-                node.right = self._delete_recursive(node.right, min_node.data['value'])
+                node.left = right
+                if right is not None:
+                    right.parent = node
+                right = node
 
-        return node
+        for part in (left, right):
+            if part is not None:
+                part.parent = None
+        return left, right
 
     def _find_min(self, node):
         """找到子树中的最小节点"""
@@ -98,19 +375,27 @@ class BinarySearchTree:
             return None
 
         def build_structure(node):
-            if node is None:
-                return None
-
             return {
-                'data': node.data['value'],  # 只显示值
-                'id': node.data['id'],  # 唯一标识符
-                'left': build_structure(node.left),
-                'right': build_structure(node.right)
+                'data': node.key if node.count == 1 else node.label,  # 只显示值（重复键附带次数）
+                'id': node.uid,  # 唯一标识符
+                'count': node.count,
+                'left': None,
+                'right': None
             }
 
-        return build_structure(self.root)
+        # 显式栈自上而下填充孩子，退化成长链时也不会超出递归深度
+        structure = build_structure(self.root)
+        stack = [(self.root, structure)]
+        while stack:
+            node, parent_structure = stack.pop()
+            for side, child in (('left', node.left), ('right', node.right)):
+                if child is not None:
+                    parent_structure[side] = build_structure(child)
+                    stack.append((child, parent_structure[side]))
+        return structure
 
     def clear(self):
         """清空树"""
         self.root = None
-        self.node_counter = 0
\ No newline at end of file
+        self.node_counter = 0
+        self._reset_stats()
\ No newline at end of file
@@ -3,51 +3,139 @@ from collections import deque
 import uuid
 
 class BinaryTree:
-    """二叉树实现"""
+    """二叉树实现
+
+    节点数、树高和最小/最大值随插入增量维护（二叉树只增不删），读取为 O(1)。
+    """
 
     def __init__(self):
         self.root = None
         self.node_counter = 0  # 确保这里初始化了node_counter
+        # 完全二叉树的层次顺序数组：下标 i 的子节点为 2i+1 和 2i+2
+        # 树不再是完全二叉树时置为 None，退化为层次遍历
+        self._slots = []
+        # 节点索引：id -> 节点，值 -> 最早插入的同值节点
+        self._id_index = {}
+        self._value_index = {}
+        self._reset_stats()
+
+    def _reset_stats(self):
+        self.count = 0
+        self._height = 0
+        self._min = self._max = None
+
+    def _note_node(self, node, depth):
+        """登记新节点对统计量的影响，depth 为节点所在层数（根为第 1 层）"""
+        self.count += 1
+        if depth > self._height:
+            self._height = depth
+        value = node.data.get('value') if isinstance(node.data, dict) else node.data
+        if self._min is None or value < self._min:
+            self._min = value
+        if self._max is None or value > self._max:
+            self._max = value
 
     def is_empty(self):
         return self.root is None
 
-    def insert_level_order(self, data):
-        """按层次顺序插入单个节点"""
-        # 为每个节点创建唯一标识符
+    def _make_node(self, data):
+        """创建带唯一标识符的节点"""
         self.node_counter += 1
         node_data = {
             'value': data,
             'id': f"bt_{self.node_counter}"  # 唯一标识符
         }
+        node = BinaryTreeNode(node_data)
+        self._register(node)
+        return node
+
+    def _register(self, node):
+        """把节点登记到 id 索引和值索引"""
+        if isinstance(node.data, dict):
+            self._id_index[node.data.get('id')] = node
+            self._value_index.setdefault(node.data.get('value'), node)
+        else:
+            self._value_index.setdefault(node.data, node)
+
+    def rebuild_index(self):
+        """从根节点重建节点索引和层次顺序数组，树不是完全二叉树时数组失效"""
+        self._slots = []
+        self._id_index = {}
+        self._value_index = {}
+        self._reset_stats()
+        if self.root is None:
+            return
 
-        new_node = BinaryTreeNode(node_data)
+        slots = []
+        queue = deque([(self.root, 1)])
+        seen_gap = False
+        is_complete = True
+        while queue:
+            node, depth = queue.popleft()
+            self._register(node)
+            self._note_node(node, depth)
+            slots.append(node)
+            for child in (node.left, node.right):
+                if child is None:
+                    seen_gap = True
+                else:
+                    if seen_gap:
+                        is_complete = False
+                    child.parent = node
+                    queue.append((child, depth + 1))
+
+        self._slots = slots if is_complete else None
+        self.node_counter = max(self.node_counter, len(slots))
+
+    def insert_level_order(self, data):
+        """按层次顺序插入单个节点"""
+        new_node = self._make_node(data)
+
+        if self._slots is not None:
+            # 完全二叉树：下一个空位就是数组末尾，O(1) 找到父节点
+            index = len(self._slots)
+            if index == 0:
+                self.root = new_node
+            else:
+                parent = self._slots[(index - 1) // 2]
+                if index % 2 == 1:
+                    parent.left = new_node
+                else:
+                    parent.right = new_node
+                new_node.parent = parent
+            self._slots.append(new_node)
+            self._note_node(new_node, (index + 1).bit_length())  # 下标 i 位于第 (i+1) 的二进制位数层
+            return True
 
         if self.root is None:
             self.root = new_node
+            self._slots = [new_node]
+            self._note_node(new_node, 1)
             return True
 
-        # 使用队列进行层次遍历，找到第一个可以插入的位置
-        queue = [self.root]
+        # 非完全二叉树：使用队列进行层次遍历，找到第一个可以插入的位置
+        queue = deque([(self.root, 1)])
 
         while queue:
-            current = queue.pop(0)
+            current, depth = queue.popleft()
 
             # 如果左子节点为空，插入到左子节点
             if current.left is None:
                 current.left = new_node
                 new_node.parent = current
+                self._note_node(new_node, depth + 1)
                 return True
             else:
-                queue.append(current.left)
+                queue.append((current.left, depth + 1))
 
             # 如果右子节点为空，插入到右子节点
             if current.right is None:
                 current.right = new_node
                 new_node.parent = current
+                self._note_node(new_node, depth + 1)
                 return True
             else:
-                queue.append(current.right)
+                queue.append((current.right, depth + 1))
 
         return False
 
@@ -62,52 +150,89 @@ class BinaryTree:
             return
 
         # 清空当前树
-        self.root = None
+        self.clear()
         self.node_counter = 0
 
-        # 批量插入
-        for data in data_list:
-            self.insert_level_order(data)
+        # 一次线性遍历：按下标直接链接父子节点
+        slots = [self._make_node(data) for data in data_list]
+        for index in range(1, len(slots)):
+            parent = slots[(index - 1) // 2]
+            if index % 2 == 1:
+                parent.left = slots[index]
+            else:
+                parent.right = slots[index]
+            slots[index].parent = parent
+
+        self.root = slots[0]
+        self._slots = slots
+        for index, node in enumerate(slots):
+            self._note_node(node, (index + 1).bit_length())
+
+    def _new_child(self, data):
+        """为定点插入创建节点：节点数据字典原样使用，其余按值创建"""
+        if isinstance(data, dict):
+            node = BinaryTreeNode(data)
+            self._register(node)
+            return node
+        return self._make_node(data)
+
+    @staticmethod
+    def _depth(node):
+        """节点所在层数，沿父指针向上计数"""
+        depth = 0
+        while node is not None:
+            depth += 1
+            node = node.parent
+        return depth
 
     def insert_left(self, parent_data, data):
         """在指定父节点的左侧插入节点"""
-        parent = self._find_node(self.root, parent_data)
+        parent = self.find_node(parent_data)
         if parent:
             if parent.left is None:
-                parent.left = BinaryTreeNode(data)
+                parent.left = self._new_child(data)
                 parent.left.parent = parent
+                self._slots = None  # 手动插入可能破坏完全二叉树结构
+                self._note_node(parent.left, self._depth(parent) + 1)
                 return True
         return False
 
     def insert_right(self, parent_data, data):
         """在指定父节点的右侧插入节点"""
-        parent = self._find_node(self.root, parent_data)
+        parent = self.find_node(parent_data)
         if parent:
             if parent.right is None:
-                parent.right = BinaryTreeNode(data)
+                parent.right = self._new_child(data)
                 parent.right.parent = parent
+                self._slots = None  # 手动插入可能破坏完全二叉树结构
+                self._note_node(parent.right, self._depth(parent) + 1)
                 return True
         return False
 
-    def _find_node(self, node, data):
-        """查找包含指定数据的节点"""
-        if node is None:
-            return None
-
-        if node.data == data:
-            return node
+    def find_node(self, data):
+        """通过索引查找节点，O(1)
 
-        left_result = self._find_node(node.left, data)
-        if left_result:
-            return left_result
+        data 可以是节点数据字典、节点 id 或节点值；按值查找时返回最早插入的同值节点。
+        """
+        if isinstance(data, dict):
+            node = self._id_index.get(data.get('id'))
+            if node is not None and node.data == data:
+                return node
+            return None
 
-        return self._find_node(node.right, data)
+        node = self._id_index.get(data)
+        if node is None:
+            node = self._value_index.get(data)
+        return node
 
     def get_level_order(self):
         """获取层次遍历结果"""
         if self.root is None:
             return []
 
+        if self._slots is not None:
+            return [node.data for node in self._slots]
+
         result = []
         queue = deque([self.root])
 
@@ -122,9 +247,32 @@ class BinaryTree:
 
         return result
 
+    def size(self):
+        return self.count
+
+    def get_height(self):
+        return self._height
+
+    def min(self):
+        """最小值，空树返回 None"""
+        return self._min
+
+    def max(self):
+        """最大值，空树返回 None"""
+        return self._max
+
+    def get_stats(self):
+        """节点数、树高和最小/最大值，供界面和布局直接读取"""
+        return {'size': self.count, 'height': self._height,
+                'min': self._min, 'max': self._max}
+
     def clear(self):
         """清空树"""
         self.root = None
+        self._slots = []
+        self._id_index = {}
+        self._value_index = {}
+        self._reset_stats()
 
     def get_tree_structure(self):
         """获取树结构信息，用于可视化"""
@@ -132,14 +280,20 @@ class BinaryTree:
             return None
 
         def build_structure(node):
-            if node is None:
-                return None
-
             return {
                 'data': node.data['value'],  # 只显示值
                 'id': node.data['id'],  # 唯一标识符
-                'left': build_structure(node.left),
-                'right': build_structure(node.right)
+                'left': None,
+                'right': None
             }
 
-        return build_structure(self.root)
\ No newline at end of file
+        # 定点插入可以连成任意深的长链，用显式栈自上而下填充孩子
+        structure = build_structure(self.root)
+        stack = [(self.root, structure)]
+        while stack:
+            node, parent_structure = stack.pop()
+            for side, child in (('left', node.left), ('right', node.right)):
+                if child is not None:
+                    parent_structure[side] = build_structure(child)
+                    stack.append((child, parent_structure[side]))
+        return structure
\ No newline at end of file
@@ -1,6 +1,8 @@
 class BinaryTreeNode:
     """二叉树节点"""
 
+    __slots__ = ('data', 'left', 'right', 'parent')
+
     def __init__(self, data):
         self.data = data
         self.left = None
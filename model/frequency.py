@@ -0,0 +1,37 @@
+from collections import Counter
+
+try:
+    import numpy as np
+except ImportError:  # NumPy 为可选依赖，没有时退回 Counter 计数
+    np = None
+
+CHUNK_SIZE = 1 << 20  # bincount 会把 uint8 转成 intp，分段计数以限制临时数组大小
+
+
+def count_bytes(data):
+    """统计每个字节值的出现次数，返回 {字节值: 次数}
+
+    data 可以是 bytes、bytearray、mmap 等支持缓冲区协议的对象，不复制数据。
+    有 NumPy 时在 frombuffer 视图上分段 bincount，否则用 Counter 遍历 memoryview。
+    """
+    if len(data) == 0:
+        return {}
+
+    if np is not None:
+        view = np.frombuffer(data, dtype=np.uint8)
+        totals = np.zeros(256, dtype=np.int64)
+        for start in range(0, len(view), CHUNK_SIZE):
+            totals += np.bincount(view[start:start + CHUNK_SIZE], minlength=256)
+        del view  # 释放对缓冲区的引用，调用方随后才能关闭 mmap
+        return {byte: int(count) for byte, count in enumerate(totals.tolist()) if count}
+
+    with memoryview(data) as view:
+        return dict(Counter(view.cast('B')))
+
+
+def count_text(text):
+    """统计字符串中每个字符的出现次数；有 NumPy 时纯 ASCII 文本按字节计数，其余用 Counter"""
+    if np is not None and text.isascii():
+        # isascii 对 CPython 的紧凑字符串是 O(1)，编码为一次内存复制
+        return {chr(byte): count for byte, count in count_bytes(text.encode('ascii')).items()}
+    return dict(Counter(text))
\ No newline at end of file
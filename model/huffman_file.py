@@ -0,0 +1,93 @@
+import mmap
+import os
+import struct
+
+from .huffman_tree import HuffmanTree
+
+
+class HuffmanFile:
+    """哈夫曼压缩文件的流式压缩与解压
+
+    文件头之后是按 (码长, 字节值) 排序的码长表，其后是按位打包的编码数据。
+    输入按字节处理，字节 b 在哈夫曼树中用字符 chr(b) 表示（与 latin-1 一一对应）。
+    压缩分两趟读取 mmap 映射的输入：第一趟直接在映射上统计字节频率，第二趟分块编码写出；
+    解压同样分块进行，内存占用只与块大小有关，与文件大小无关。
+    """
+
+    MAGIC = b'HUF1'
+    HEADER = struct.Struct('<4sQHB')  # 魔数, 原始字节数, 码长表项数, 末字节补零位数
+    ENTRY = struct.Struct('<BB')  # 字节值, 码长
+    CHUNK_SIZE = 1 << 20  # 每块读取的字节数
+
+    @classmethod
+    def _iter_chunks(cls, data, start=0):
+        for offset in range(start, len(data), cls.CHUNK_SIZE):
+            yield data[offset:offset + cls.CHUNK_SIZE]
+
+    @classmethod
+    def compress(cls, source, target):
+        """压缩文件 source 到 target，返回所用的哈夫曼树"""
+        tree = HuffmanTree()
+        with open(source, 'rb') as src, open(target, 'wb') as out:
+            size = os.fstat(src.fileno()).st_size
+            if size == 0:
+                out.write(cls.HEADER.pack(cls.MAGIC, 0, 0, 0))
+                return tree
+
+            with mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                tree.build_from_bytes(data)
+                code_lengths = tree.get_code_lengths()
+                out.write(cls.HEADER.pack(cls.MAGIC, size, len(code_lengths), 0))
+                for char, length in code_lengths:
+                    out.write(cls.ENTRY.pack(ord(char), length))
+
+                chunks = (chunk.decode('latin-1') for chunk in cls._iter_chunks(data))
+                padding = tree.encode_stream(chunks, out)
+
+            # 补零位数要等全部编码完才知道，最后回填文件头
+            out.seek(0)
+            out.write(cls.HEADER.pack(cls.MAGIC, size, len(code_lengths), padding))
+        return tree
+
+    @classmethod
+    def _read_header(cls, data):
+        """解析文件头和码长表，返回 (哈夫曼树, 原始字节数, 补零位数, 编码数据起始偏移)"""
+        if len(data) < cls.HEADER.size:
+            raise ValueError("不是有效的哈夫曼压缩文件")
+        magic, size, entry_count, padding = cls.HEADER.unpack_from(data, 0)
+        if magic != cls.MAGIC:
+            raise ValueError("不是有效的哈夫曼压缩文件")
+
+        lengths = {}
+        offset = cls.HEADER.size
+        for _ in range(entry_count):
+            byte, length = cls.ENTRY.unpack_from(data, offset)
+            lengths[chr(byte)] = length
+            offset += cls.ENTRY.size
+
+        tree = HuffmanTree()
+        tree.build_from_code_lengths(lengths)
+        return tree, size, padding, offset
+
+    @classmethod
+    def read_tree(cls, path):
+        """只读取文件头，恢复压缩所用的哈夫曼树（不带频率）"""
+        with open(path, 'rb') as src:
+            header = src.read(cls.HEADER.size)
+            if len(header) == cls.HEADER.size:
+                header += src.read(cls.ENTRY.size * cls.HEADER.unpack(header)[2])
+        return cls._read_header(header)[0]
+
+    @classmethod
+    def decompress(cls, source, target):
+        """解压文件 source 到 target，返回所用的哈夫曼树"""
+        with open(source, 'rb') as src, open(target, 'wb') as out:
+            with mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                tree, size, padding, offset = cls._read_header(data)
+                written = 0
+                for text in tree.decode_stream(cls._iter_chunks(data, offset), padding):
+                    out.write(text.encode('latin-1'))
+                    written += len(text)
+        if written != size:
+            raise ValueError("压缩数据不完整")
+        return tree
\ No newline at end of file
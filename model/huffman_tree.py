@@ -1,103 +1,407 @@
 import heapq
+import io
 from .binary_tree_node import BinaryTreeNode
+from .frequency import count_bytes, count_text
 
 
 class HuffmanTree:
-    """哈夫曼树实现"""
+    """哈夫曼树实现
+
+    建树时只用频率算出每个字符的码长，再按码长分配范式哈夫曼编码（canonical code）：
+    码长相同的字符按字符顺序取连续的码字。编码因此只由 (字符, 码长) 表决定，
+    保存和恢复都不需要整棵树。节点数、树高和最小/最大频率在建树时一并得出，读取为 O(1)。
+    """
+
+    CHUNK_SIZE = 1 << 16  # 分块编码/解码时每块的字符数或字节数
+    DECODE_TABLE_BITS = 12  # 查表解码每步最多读取的位数，根表 4096 项
+    DECODE_TABLE_LIMIT = 1 << 16  # 各级表项总数的上限，超出时改为沿树逐位解码
 
     def __init__(self):
         self.root = None
         self.codes = {}  # 存储字符的哈夫曼编码
+        self._decoder = None  # 由编码表惰性构建的查表解码器
+        self._reset_stats()
+
+    def _reset_stats(self):
+        self.count = 0  # 节点总数
+        self._height = 0
+        self._min = self._max = None  # 叶子的最小/最大频率
 
     def build_from_text(self, text):
         """从文本构建哈夫曼树"""
         if not text:
             return
 
-        # 计算字符频率
-        frequency = {}
-        for char in text:
-            frequency[char] = frequency.get(char, 0) + 1
+        # 计算字符频率（向量化计数，见 frequency 模块）
+        frequency = count_text(text)
 
         # 构建哈夫曼树
         self.build_from_frequency(frequency)
 
+    def build_from_bytes(self, data):
+        """从字节数据构建哈夫曼树，字节 b 用字符 chr(b) 表示"""
+        frequency = {chr(byte): count for byte, count in count_bytes(data).items()}
+        self.build_from_frequency(frequency)
+
     def build_from_frequency(self, frequency):
         """从频率字典构建哈夫曼树"""
         if not frequency:
             return
+        self.build_from_code_lengths(self.code_lengths(frequency), frequency)
 
-        # 创建优先队列（最小堆）
-        heap = []
-        for char, freq in frequency.items():
-            node = BinaryTreeNode({'char': char, 'freq': freq, 'is_leaf': True})
-            heapq.heappush(heap, (freq, id(node), node))
+    @staticmethod
+    def code_lengths(frequency):
+        """按哈夫曼算法求每个字符的码长
 
-        # 构建哈夫曼树
+        堆中每项是一棵子树的 (频率, 序号, 字符列表)，两棵最小的子树合并时其中所有字符的码长加一。
+        序号按创建顺序递增，同频率时合并顺序确定。只有一种字符时码长记为 1。
+        """
+        lengths = dict.fromkeys(frequency, 0)
+        heap = [(freq, order, [char]) for order, (char, freq) in enumerate(frequency.items())]
+        heapq.heapify(heap)
+        order = len(heap)
         while len(heap) > 1:
-            # 取出两个最小频率的节点
-            freq1, _, node1 = heapq.heappop(heap)
-            freq2, _, node2 = heapq.heappop(heap)
-
-            # 创建新节点，频率为两个子节点频率之和
-            merged_freq = freq1 + freq2
-            merged_node = BinaryTreeNode({
-                'char': None,
-                'freq': merged_freq,
-                'is_leaf': False
-            })
-            merged_node.left = node1
-            merged_node.right = node2
-            node1.parent = merged_node
-            node2.parent = merged_node
-
-            heapq.heappush(heap, (merged_freq, id(merged_node), merged_node))
-
-        # 堆中最后一个节点就是根节点
-        if heap:
-            _, _, self.root = heapq.heappop(heap)
-
-        # 生成哈夫曼编码
-        self._generate_codes(self.root, "")
-
-    def _generate_codes(self, node, code):
-        """生成哈夫曼编码"""
-        if node is None:
-            return
+            freq1, _, chars1 = heapq.heappop(heap)
+            freq2, _, chars2 = heapq.heappop(heap)
+            for char in chars1:
+                lengths[char] += 1
+            for char in chars2:
+                lengths[char] += 1
+            # 把较短的列表接到较长的后面，每个字符最多被拷贝 O(log k) 次
+            if len(chars1) < len(chars2):
+                chars1, chars2 = chars2, chars1
+            chars1.extend(chars2)
+            heapq.heappush(heap, (freq1 + freq2, order, chars1))
+            order += 1
+        if len(lengths) == 1:
+            lengths[next(iter(lengths))] = 1
+        return lengths
+
+    @staticmethod
+    def canonical_codes(lengths):
+        """由码长分配范式编码：按 (码长, 字符) 排序，依次取上一码字加一，码长增加时左移补零"""
+        codes = {}
+        code, previous = 0, 0
+        for char, length in sorted(lengths.items(), key=lambda item: (item[1], item[0])):
+            code <<= length - previous
+            codes[char] = format(code, f'0{length}b')
+            code += 1
+            previous = length
+        return codes
+
+    def build_from_code_lengths(self, lengths, frequency=None):
+        """由 (字符 -> 码长) 表重建树和范式编码，O(码长总和)
 
-        if node.data['is_leaf']:
-            self.codes[node.data['char']] = code
+        frequency 只用于节点上显示的频率，缺省时节点不带频率。
+        """
+        if not lengths:
             return
+        self.codes = self.canonical_codes(lengths)
+        self._decoder = None
+        self._reset_stats()
+
+        # 按码字逐位在树中开路，叶子挂在路径末端
+        self.root = self._new_internal_node(frequency)
+        for char, code in self.codes.items():
+            node = self.root
+            for bit in code:
+                child = node.left if bit == '0' else node.right
+                if child is None:
+                    child = self._new_internal_node(frequency)
+                    child.parent = node
+                    if bit == '0':
+                        node.left = child
+                    else:
+                        node.right = child
+                node = child
+            node.data = {'char': char, 'freq': frequency[char] if frequency else None, 'is_leaf': True}
+
+        if frequency:
+            self._sum_frequencies(self.root)
+            self._min = min(frequency[char] for char in lengths)
+            self._max = max(frequency[char] for char in lengths)
+        self._height = 1 + max(lengths.values())
+
+    def _new_internal_node(self, frequency):
+        self.count += 1
+        return BinaryTreeNode({'char': None, 'freq': 0 if frequency else None, 'is_leaf': False})
 
-        self._generate_codes(node.left, code + "0")
-        self._generate_codes(node.right, code + "1")
+    def _sum_frequencies(self, root):
+        """自底向上把叶子频率累加到内部节点"""
+        order = []
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            stack.extend(child for child in (node.left, node.right) if child is not None)
+        for node in reversed(order):
+            if not node.data['is_leaf']:
+                node.data['freq'] = sum(child.data['freq'] for child in (node.left, node.right)
+                                        if child is not None)
+
+    def get_code_lengths(self):
+        """按 (码长, 字符) 排序的 [(字符, 码长)] 表，足以重建范式编码和整棵树"""
+        return sorted(((char, len(code)) for char, code in self.codes.items()),
+                      key=lambda item: (item[1], item[0]))
+
+    def rebuild_stats(self):
+        """直接替换根节点（如反序列化）后遍历一次重新统计"""
+        self._reset_stats()
+        level = [self.root] if self.root is not None else []
+        leaf_freqs = []
+        while level:
+            self._height += 1
+            self.count += len(level)
+            leaf_freqs.extend(node.data['freq'] for node in level
+                              if node.data['is_leaf'] and node.data['freq'] is not None)
+            level = [child for node in level
+                     for child in (node.left, node.right) if child is not None]
+        if leaf_freqs:
+            self._min, self._max = min(leaf_freqs), max(leaf_freqs)
+
+    def _check_symbols(self, text):
+        """确认文本中的字符都有编码"""
+        missing = set(text).difference(self.codes)
+        if missing:
+            char = next(char for char in text if char in missing)
+            raise ValueError(f"字符 '{char}' 不在哈夫曼树中")
+
+    def _encode_chunks(self, text):
+        """逐块把文本翻译成 '0'/'1' 串，str.translate 在 C 层完成查表拼接"""
+        table = str.maketrans(self.codes)
+        for start in range(0, len(text), self.CHUNK_SIZE):
+            chunk = text[start:start + self.CHUNK_SIZE]
+            self._check_symbols(chunk)
+            yield chunk.translate(table)
 
     def encode(self, text):
-        """编码文本"""
-        encoded = ""
-        for char in text:
-            if char in self.codes:
-                encoded += self.codes[char]
-            else:
-                raise ValueError(f"字符 '{char}' 不在哈夫曼树中")
-        return encoded
+        """编码文本，返回 '0'/'1' 字符串"""
+        return "".join(self._encode_chunks(text))
+
+    def encode_stream(self, chunks, out):
+        """逐块编码文本并按位打包写入 out（有 write 方法的对象），返回末字节补零位数
+
+        每块的位串用 int(..., 2) 一次转成整数，与上一块剩下的不足一字节的位拼接后
+        整字节写出，总耗时与文本长度成线性，内存只与块大小有关。
+        """
+        carry, carry_bits = 0, 0  # 尚未凑满一字节的位
+        for chunk in chunks:
+            for bits in self._encode_chunks(chunk):
+                if not bits:
+                    continue
+                value = (carry << len(bits)) | int(bits, 2)
+                total = carry_bits + len(bits)
+                carry_bits = total % 8
+                out.write((value >> carry_bits).to_bytes(total // 8, 'big'))
+                carry = value & ((1 << carry_bits) - 1)
+
+        padding = (8 - carry_bits) % 8
+        if carry_bits:
+            out.write(bytes([carry << padding]))
+        return padding
+
+    def encode_bytes(self, text):
+        """编码文本并按位打包，返回 (字节串, 末字节补零位数)"""
+        output = io.BytesIO()
+        padding = self.encode_stream([text], output)
+        return output.getvalue(), padding
+
+    def _walk_bits(self, bits, current, out):
+        """沿树逐位下降，遇到叶子输出字符并回到根；返回停下时所在的节点"""
+        root = self.root
+        try:
+            for bit in bits:
+                current = current.left if bit == '0' else current.right
+                data = current.data
+                if data['is_leaf']:
+                    out.append(data['char'])
+                    current = root
+        except AttributeError:
+            raise ValueError("编码数据无效") from None  # 走到了不存在的孩子
+        return current
 
     def decode(self, encoded_text):
-        """解码文本"""
-        decoded = ""
-        current = self.root
+        """解码 '0'/'1' 字符串"""
+        if self.root is None or not encoded_text:
+            return ""
+        out = []
+        self._walk_bits(encoded_text, self.root, out)
+        return "".join(out)
 
-        for bit in encoded_text:
-            if bit == '0':
-                current = current.left
-            else:
-                current = current.right
+    @staticmethod
+    def _build_decode_tables(codes, table_bits, max_entries):
+        """由编码表构建多位查表解码器，返回 (根表, 表 -> 前缀, 码字 -> 字符)
+
+        每张表对应一个码字前缀（根表对应空前缀），以接下来的若干位为下标，表项为
+        (这些位内解出的完整字符串, 消耗的位数, 下一张表, 下一张表的位数, 下一张表的掩码)。
+        能解出字符时只消耗到最后一个完整码字并回到根表；码长超出、一个字符都解不出时消耗全部位，
+        转入以新前缀为起点的子表。不是任何码字前缀的位串对应 None。
+        根表读取 table_bits 位；和 zlib 的 inflate 一样，子表只读取到以该前缀开头的最长码字为止，
+        字符很多时子表也不会膨胀到 2^table_bits 项。各级表项总数超过 max_entries 时根表为 None。
+        """
+        symbols = {code: char for char, code in codes.items()}
+        longest = {}  # 前缀 -> 以它开头的最长码长
+        for code in symbols:
+            for i in range(len(code)):
+                prefix = code[:i]
+                if longest.get(prefix, 0) < len(code):
+                    longest[prefix] = len(code)
+
+        raw_tables = {}
+        pending = {""}
+        total = 0
+        while pending:
+            start = pending.pop()
+            bits = min(table_bits, longest[start] - len(start))
+            total += 1 << bits
+            if total > max_entries:
+                return None, None, symbols
+
+            entries = []
+            for index in range(1 << bits):
+                prefix, decoded, used = start, [], 0
+                for position, bit in enumerate(format(index, f'0{bits}b'), 1):
+                    prefix += bit
+                    if prefix in symbols:
+                        decoded.append(symbols[prefix])
+                        prefix, used = "", position
+                    elif prefix not in longest:
+                        prefix = None
+                        break
+
+                if decoded:
+                    entries.append(("".join(decoded), used, ""))
+                elif prefix is None:
+                    entries.append(None)
+                else:
+                    entries.append(("", bits, prefix))
+                    if prefix not in raw_tables:
+                        pending.add(prefix)
+            raw_tables[start] = entries
+
+        # 表项中的下一张表先以前缀记录，全部建好后再换成表本身及其位数
+        tables = {prefix: [] for prefix in raw_tables}
+        widths = {prefix: len(entries).bit_length() - 1 for prefix, entries in raw_tables.items()}
+        for prefix, entries in raw_tables.items():
+            tables[prefix].extend(
+                None if entry is None
+                else (entry[0], entry[1], tables[entry[2]], widths[entry[2]], (1 << widths[entry[2]]) - 1)
+                for entry in entries)
+        prefix_of = {id(table): prefix for prefix, table in tables.items()}
+        return tables[""], prefix_of, symbols
+
+    def _get_decoder(self):
+        """查表解码器，首次使用时构建，重新建树后失效"""
+        if self._decoder is None:
+            self._decoder = self._build_decode_tables(self.codes, self.DECODE_TABLE_BITS,
+                                                      self.DECODE_TABLE_LIMIT)
+        return self._decoder
+
+    def decode_bytes(self, data, padding=0, table=True):
+        """解码 encode_bytes 的结果，padding 为末字节的补零位数
+
+        默认查表解码，每步读取 DECODE_TABLE_BITS 位、可一次解出多个字符；
+        table 为 False 或查找表超过 DECODE_TABLE_LIMIT 项时沿树逐位解码。
+        """
+        if not table or (self.codes and self._get_decoder()[0] is None):
+            return self._decode_bytes_bitwise(data, padding)
+        return "".join(self.decode_stream([data], padding))
+
+    def decode_stream(self, chunks, padding=0):
+        """逐块查表解码按位打包的数据，每块产出一段解码结果；padding 为最后一块末字节的补零位数
+
+        块之间不必对齐码字：未读完的位缓冲、所在的子表和不足一个字的剩余字节都带入下一块。
+        """
+        if not self.codes:
+            return
+
+        root, prefix_of, symbols = self._get_decoder()
+        if root is None:
+            yield from self._decode_stream_bitwise(chunks, padding)
+            return
 
-            if current.data['is_leaf']:
-                decoded += current.data['char']
-                current = self.root
+        table_bits = self.DECODE_TABLE_BITS
+        bits = len(root).bit_length() - 1  # 当前表的位数，只有一个字符时根表也可能不足 table_bits 位
+        mask = (1 << bits) - 1
+        current = root
+        buffer, buffered = 0, 0  # 位缓冲：低 buffered 位有效
+        rest = b""
+        for chunk in chunks:
+            data = rest + chunk if rest else chunk
+            out = []
+            append = out.append
+            pos = 0
+            last_word = len(data) - 8  # 可能含补零位的末字节不进入查表循环，留给下一块或尾部处理
+            try:
+                while True:
+                    if buffered < table_bits:
+                        if pos >= last_word:
+                            break
+                        buffer = ((buffer & ((1 << buffered) - 1)) << 64) | int.from_bytes(data[pos:pos + 8], 'big')
+                        buffered += 64
+                        pos += 8
+                    text, used, current, bits, mask = current[(buffer >> (buffered - bits)) & mask]
+                    append(text)
+                    buffered -= used
+            except TypeError:
+                raise ValueError("编码数据无效") from None  # 表项为 None
+            rest = bytes(data[pos:])
+            if out:
+                yield "".join(out)
+
+        # 剩余不足一个字的尾部逐位解码
+        tail = format(buffer & ((1 << buffered) - 1), f'0{buffered}b') if buffered else ""
+        tail += format(int.from_bytes(rest, 'big'), f'0{8 * len(rest)}b') if rest else ""
+        prefix = prefix_of[id(current)]
+        out = []
+        for bit in tail[:len(tail) - padding]:
+            prefix += bit
+            char = symbols.get(prefix)
+            if char is not None:
+                out.append(char)
+                prefix = ""
+        if prefix:
+            raise ValueError("编码数据无效")
+        if out:
+            yield "".join(out)
+
+    def _decode_stream_bitwise(self, chunks, padding):
+        """decode_stream 的逐位版本，查找表过大时使用；每块的末字节留到下一块，最后一块去掉补零位"""
+        current = self.root
+        rest = b""
+        for chunk in chunks:
+            data = rest + chunk if rest else chunk
+            if not data:
+                continue
+            out = []
+            if len(data) > 1:
+                bits = format(int.from_bytes(data[:-1], 'big'), f'0{8 * (len(data) - 1)}b')
+                current = self._walk_bits(bits, current, out)
+            rest = bytes(data[-1:])
+            if out:
+                yield "".join(out)
 
-        return decoded
+        out = []
+        if rest:
+            current = self._walk_bits(format(rest[0], '08b')[:8 - padding], current, out)
+        if current is not self.root:
+            raise ValueError("编码数据无效")
+        if out:
+            yield "".join(out)
+
+    def _decode_bytes_bitwise(self, data, padding):
+        if self.root is None or not data:
+            return ""
+        out = []
+        current = self.root
+        total_bits = 8 * len(data) - padding
+        for start in range(0, len(data), self.CHUNK_SIZE):
+            chunk = data[start:start + self.CHUNK_SIZE]
+            bits = format(int.from_bytes(chunk, 'big'), f'0{8 * len(chunk)}b')
+            if start + len(chunk) == len(data):
+                bits = bits[:total_bits - 8 * start]  # 去掉末尾补齐的零位
+            current = self._walk_bits(bits, current, out)
+        return "".join(out)
 
     def get_tree_structure(self):
         """获取树结构信息，用于可视化"""
@@ -108,11 +412,12 @@ class HuffmanTree:
             if node is None:
                 return None
 
-            # 显示字符和频率
+            # 显示字符和频率（由码长表恢复、没有频率时只显示字符）
+            freq = node.data['freq']
             if node.data['is_leaf']:
-                display_text = f"'{node.data['char']}':{node.data['freq']}"
+                display_text = f"'{node.data['char']}'" if freq is None else f"'{node.data['char']}':{freq}"
             else:
-                display_text = f"{node.data['freq']}"
+                display_text = "" if freq is None else f"{freq}"
 
             return {
                 'data': display_text,
@@ -128,7 +433,20 @@ class HuffmanTree:
         """获取哈夫曼编码表"""
         return self.codes
 
+    def size(self):
+        return self.count
+
+    def get_height(self):
+        return self._height
+
+    def get_stats(self):
+        """节点数、树高和叶子的最小/最大频率，供界面和布局直接读取"""
+        return {'size': self.count, 'height': self._height,
+                'min': self._min, 'max': self._max}
+
     def clear(self):
         """清空树"""
         self.root = None
-        self.codes = {}
\ No newline at end of file
+        self.codes = {}
+        self._decoder = None
+        self._reset_stats()
\ No newline at end of file
@@ -1,19 +1,50 @@
 from .node import Node
+from .skip_list_index import SkipListIndex
 
 
 class LinkedList:
     """链表数据结构"""
 
-    def __init__(self):
+    def __init__(self, indexed=False):
         self.head = None
+        self.tail = None  # 尾指针，使末尾插入为O(1)
         self.size = 0
+        self.index = None  # 可选的跳表位置索引
+        if indexed:
+            self.set_indexed(True)
+
+    @property
+    def indexed(self):
+        return self.index is not None
+
+    def set_indexed(self, enabled):
+        """开启或关闭位置索引（关闭时按位置操作退化为线性遍历，便于教学对比）"""
+        if enabled and self.index is None:
+            self.index = SkipListIndex(self)
+            self.index.rebuild()
+        elif not enabled:
+            self.index = None
+
+    def _node_at(self, position):
+        """获取指定位置的节点"""
+        if self.index is not None:
+            return self.index.node_at(position)
+
+        current = self.head
+        for _ in range(position):
+            current = current.next
+        return current
 
     def insert_at_beginning(self, data):
         """在链表开头插入节点"""
         new_node = Node(data)
         new_node.next = self.head
         self.head = new_node
+        if self.tail is None:
+            self.tail = new_node
         self.size += 1
+        if self.index is not None:
+            self.index.insert(0, new_node)
         return new_node
 
     def insert_at_end(self, data):
@@ -23,14 +54,47 @@ class LinkedList:
         if not self.head:
             self.head = new_node
         else:
-            current = self.head
-            while current.next:
-                current = current.next
-            current.next = new_node
+            self.tail.next = new_node
+        self.tail = new_node
 
         self.size += 1
+        if self.index is not None:
+            self.index.insert(self.size - 1, new_node)
         return new_node
 
+    def extend(self, iterable):
+        """批量在链表末尾追加节点，一次遍历完成链接"""
+        first = None
+        last = None
+        count = 0
+        for data in iterable:
+            new_node = Node(data)
+            if first is None:
+                first = new_node
+            else:
+                last.next = new_node
+            last = new_node
+            count += 1
+
+        if first is None:
+            return 0
+
+        if not self.head:
+            self.head = first
+        else:
+            self.tail.next = first
+        self.tail = last
+        self.size += count
+
+        if self.index is not None:
+            position = self.size - count
+            current = first
+            while current:
+                self.index.insert(position, current)
+                position += 1
+                current = current.next
+        return count
+
     def insert_at_position(self, position, data):
         """在指定位置插入节点"""
         if position < 0 or position > self.size:
@@ -38,16 +102,17 @@ class LinkedList:
 
         if position == 0:
             return self.insert_at_beginning(data)
+        if position == self.size:
+            return self.insert_at_end(data)
 
         new_node = Node(data)
-        current = self.head
-
-        for _ in range(position - 1):
-            current = current.next
+        current = self._node_at(position - 1)
 
         new_node.next = current.next
         current.next = new_node
         self.size += 1
+        if self.index is not None:
+            self.index.insert(position, new_node)
         return new_node
 
     def delete_at_position(self, position):
@@ -58,14 +123,19 @@ class LinkedList:
         if position == 0:
             deleted_node = self.head
             self.head = self.head.next
+            if self.head is None:
+                self.tail = None
         else:
-            current = self.head
-            for _ in range(position - 1):
-                current = current.next
+            current = self._node_at(position - 1)
             deleted_node = current.next
             current.next = current.next.next
+            if deleted_node is self.tail:
+                self.tail = current
 
+        deleted_node.next = None
         self.size -= 1
+        if self.index is not None:
+            self.index.delete(position)
         return deleted_node
 
     def to_list(self):
@@ -80,4 +150,7 @@ class LinkedList:
     def clear(self):
         """清空链表"""
         self.head = None
-        self.size = 0
\ No newline at end of file
+        self.tail = None
+        self.size = 0
+        if self.index is not None:
+            self.index.reset()
\ No newline at end of file
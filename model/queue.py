@@ -1,12 +1,18 @@
+from . import typed_storage
+
+
 class Queue:
     """顺序队列实现"""
 
-    def __init__(self, capacity=10):
+    def __init__(self, capacity=10, typecode=None, growable=False):
         self.capacity = capacity
-        self.data = [None] * capacity
+        self.typecode = typecode  # 为 None 时用列表存储，否则用 array(typecode) 紧凑存储数值
+        self.data = typed_storage.allocate(capacity, typecode)
         self.front = 0  # 队头指针
         self.rear = -1  # 队尾指针
         self.count = 0  # 元素个数
+        self.growable = growable  # 队满时是否自动倍增扩容
+        self.last_resize = None  # 最近一次操作引起的容量变化 (旧容量, 新容量)
 
     def is_empty(self):
         return self.count == 0
@@ -14,23 +20,91 @@ class Queue:
     def is_full(self):
         return self.count == self.capacity
 
+    def _head_span(self, count):
+        """从队头起 count 个元素中，位于数组末端（回绕前）的个数"""
+        return min(count, self.capacity - self.front)
+
+    def _ensure_capacity(self, required):
+        """保证容量不小于 required；扩容时按倍增一次性把环形数据摆正到数组开头"""
+        if required <= self.capacity:
+            return
+        if not self.growable:
+            raise Exception("队列已满")
+
+        new_capacity = max(self.capacity, 1)
+        while new_capacity < required:
+            new_capacity *= 2
+
+        new_data = typed_storage.allocate(new_capacity, self.typecode)
+        first = self._head_span(self.count)
+        new_data[:first] = self.data[self.front:self.front + first]
+        new_data[first:self.count] = self.data[:self.count - first]
+
+        self.last_resize = (self.capacity, new_capacity)
+        self.data = new_data
+        self.capacity = new_capacity
+        self.front = 0
+        self.rear = self.count - 1
+
     def enqueue(self, item):
+        self.last_resize = None
         if self.is_full():
-            raise Exception("队列已满")
+            self._ensure_capacity(self.capacity + 1)
         self.rear = (self.rear + 1) % self.capacity
         self.data[self.rear] = item
         self.count += 1
         return item
 
+    def enqueue_many(self, items):
+        """批量入队，最多两次切片复制；容量不足且不可扩容时不做任何修改"""
+        self.last_resize = None
+        items = typed_storage.pack(items, self.typecode)
+        count = len(items)
+        if count == 0:
+            return 0
+
+        self._ensure_capacity(self.count + count)
+        start = (self.rear + 1) % self.capacity
+        first = min(count, self.capacity - start)
+        self.data[start:start + first] = items[:first]
+        if first < count:
+            self.data[:count - first] = items[first:]
+
+        self.rear = (start + count - 1) % self.capacity
+        self.count += count
+        return count
+
     def dequeue(self):
+        self.last_resize = None
         if self.is_empty():
             raise Exception("队列为空")
         item = self.data[self.front]
-        self.data[self.front] = None
+        self.data[self.front] = typed_storage.blank_value(self.typecode)
         self.front = (self.front + 1) % self.capacity
         self.count -= 1
         return item
 
+    def dequeue_many(self, count):
+        """批量出队，按出队顺序返回元素列表，最多两次切片复制"""
+        self.last_resize = None
+        if count < 0:
+            raise ValueError("出队个数不能为负")
+        if count > self.count:
+            raise Exception("队列中元素不足")
+        if count == 0:
+            return []
+
+        first = self._head_span(count)
+        items = typed_storage.to_list(self.data[self.front:self.front + first])
+        self.data[self.front:self.front + first] = typed_storage.allocate(first, self.typecode)
+        if first < count:
+            items.extend(typed_storage.to_list(self.data[:count - first]))
+            self.data[:count - first] = typed_storage.allocate(count - first, self.typecode)
+
+        self.front = (self.front + count) % self.capacity
+        self.count -= count
+        return items
+
     def peek(self):
         if self.is_empty():
             return None
@@ -40,14 +114,38 @@ class Queue:
         return self.count
 
     def get_all_data(self):
-        """获取队列中的所有数据（按顺序）"""
-        result = []
+        """获取队列中的所有数据（按顺序），由至多两段切片拼接而成"""
+        if self.is_empty():
+            return []
+
+        first = self._head_span(self.count)
+        result = typed_storage.to_list(self.data[self.front:self.front + first])
+        if first < self.count:
+            result.extend(typed_storage.to_list(self.data[:self.count - first]))
+        return result
+
+    def get_segments(self):
+        """按队头到队尾的顺序返回至多两段只读视图（环形缓冲区回绕时分为两段）
+
+        类型化存储时为零拷贝 memoryview，渲染端可以直接遍历而无需重建列表。
+        """
         if self.is_empty():
-            return result
+            return []
 
-        current = self.front
-        for _ in range(self.count):
-            result.append(self.data[current])
-            current = (current + 1) % self.capacity
+        first = self._head_span(self.count)
+        segments = [typed_storage.view(self.data, self.front, self.front + first)]
+        if first < self.count:
+            segments.append(typed_storage.view(self.data, 0, self.count - first))
+        return segments
 
-        return result
\ No newline at end of file
+    def convert_storage(self, typecode):
+        """切换存储后端（None 为列表，'q' 等为紧凑数组），元素保持原位置"""
+        if typecode == self.typecode:
+            return
+        new_data = typed_storage.allocate(self.capacity, typecode)
+        first = self._head_span(self.count)
+        new_data[self.front:self.front + first] = typed_storage.pack(
+            self.data[self.front:self.front + first], typecode)
+        new_data[:self.count - first] = typed_storage.pack(self.data[:self.count - first], typecode)
+        self.typecode = typecode
+        self.data = new_data
\ No newline at end of file
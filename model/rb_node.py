@@ -0,0 +1,22 @@
+from .search_tree_node import SearchTreeNode
+
+
+class RBNode(SearchTreeNode):
+    """红黑树节点，在查找树节点上增加颜色"""
+
+    __slots__ = ('red',)
+
+    ID_PREFIX = "rb"
+
+    def __init__(self, key, node_id):
+        super().__init__(key, node_id)
+        self.red = True  # 新节点总是红色
+
+    @property
+    def color(self):
+        return "red" if self.red else "black"
+
+    @property
+    def data(self):
+        """兼容旧接口的数据字典（只读快照，修改不会写回节点）"""
+        return {'value': self.key, 'id': self.uid, 'color': self.color}
\ No newline at end of file
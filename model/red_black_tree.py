@@ -0,0 +1,249 @@
+from .rb_node import RBNode
+
+
+class RedBlackTree:
+    """红黑树实现
+
+    与 AVLTree 接口一致，通过 rotations / recolors 计数器记录再平衡开销，
+    便于在相同的插入/删除序列上与 AVL 树比较。
+    """
+
+    def __init__(self):
+        self.root = None
+        self.node_counter = 0
+        self.rotations = 0  # 累计旋转次数
+        self.recolors = 0  # 累计改色次数
+
+    def is_empty(self):
+        return self.root is None
+
+    def reset_counters(self):
+        """重置再平衡计数器"""
+        self.rotations = 0
+        self.recolors = 0
+
+    @staticmethod
+    def is_red(node):
+        """空节点视为黑色"""
+        return node is not None and node.red
+
+    def _set_red(self, node, red):
+        """设置节点颜色，颜色实际改变时计入改色次数"""
+        if node.red != red:
+            node.red = red
+            self.recolors += 1
+
+    def _replace_child(self, parent, old, new):
+        """用 new 替换 parent 下的子树 old"""
+        if parent is None:
+            self.root = new
+        elif parent.left is old:
+            parent.left = new
+        else:
+            parent.right = new
+
+    def rotate_left(self, x):
+        """左旋转"""
+        y = x.right
+        x.right = y.left
+        if y.left is not None:
+            y.left.parent = x
+        y.parent = x.parent
+        self._replace_child(x.parent, x, y)
+        y.left = x
+        x.parent = y
+        self.rotations += 1
+
+    def rotate_right(self, y):
+        """右旋转"""
+        x = y.left
+        y.left = x.right
+        if x.right is not None:
+            x.right.parent = y
+        x.parent = y.parent
+        self._replace_child(y.parent, y, x)
+        x.right = y
+        y.parent = x
+        self.rotations += 1
+
+    def insert(self, data):
+        """插入节点（重复值插入右子树）"""
+        self.node_counter += 1
+        node = RBNode(data, self.node_counter)
+
+        parent = None
+        current = self.root
+        while current is not None:
+            parent = current
+            current = current.left if data < current.key else current.right
+
+        node.parent = parent
+        if parent is None:
+            self.root = node
+        elif data < parent.key:
+            parent.left = node
+        else:
+            parent.right = node
+
+        self._insert_fixup(node)
+        return True
+
+    def _insert_fixup(self, node):
+        """插入后修复：消除连续的红色节点"""
+        while self.is_red(node.parent):
+            parent = node.parent
+            grandparent = parent.parent  # 父节点为红色，必不是根
+            if parent is grandparent.left:
+                uncle = grandparent.right
+                if self.is_red(uncle):
+                    # 叔节点为红：父、叔变黑，祖父变红，问题上移
+                    self._set_red(parent, False)
+                    self._set_red(uncle, False)
+                    self._set_red(grandparent, True)
+                    node = grandparent
+                    continue
+                if node is parent.right:
+                    # 内侧情况先转为外侧
+                    node = parent
+                    self.rotate_left(node)
+                    parent = node.parent
+                self._set_red(parent, False)
+                self._set_red(grandparent, True)
+                self.rotate_right(grandparent)
+            else:
+                uncle = grandparent.left
+                if self.is_red(uncle):
+                    self._set_red(parent, False)
+                    self._set_red(uncle, False)
+                    self._set_red(grandparent, True)
+                    node = grandparent
+                    continue
+                if node is parent.left:
+                    node = parent
+                    self.rotate_right(node)
+                    parent = node.parent
+                self._set_red(parent, False)
+                self._set_red(grandparent, True)
+                self.rotate_left(grandparent)
+
+        self._set_red(self.root, False)
+
+    def search(self, data):
+        """搜索节点"""
+        current = self.root
+        while current is not None:
+            value = current.key
+            if data == value:
+                return current
+            current = current.left if data < value else current.right
+        return None
+
+    def delete(self, data):
+        """删除节点"""
+        node = self.search(data)
+        if node is None:
+            return
+
+        if node.left is not None and node.right is not None:
+            # 有两个子节点，用右子树的最小节点替换后删除该最小节点
+            successor = self._find_min(node.right)
+            node.key, node.id = successor.key, successor.id
+            node = successor
+
+        child = node.left if node.left is not None else node.right
+        parent = node.parent
+        if child is not None:
+            child.parent = parent
+        self._replace_child(parent, node, child)
+        node.parent = node.left = node.right = None
+
+        if not node.red:
+            if self.is_red(child):
+                self._set_red(child, False)
+            else:
+                self._delete_fixup(child, parent)
+
+    def _delete_fixup(self, node, parent):
+        """删除黑色节点后修复：node 所在一侧少了一个黑色节点（node 可能为空）"""
+        while node is not self.root and not self.is_red(node):
+            if node is parent.left:
+                sibling = parent.right
+                if self.is_red(sibling):
+                    self._set_red(sibling, False)
+                    self._set_red(parent, True)
+                    self.rotate_left(parent)
+                    sibling = parent.right
+                if not self.is_red(sibling.left) and not self.is_red(sibling.right):
+                    self._set_red(sibling, True)
+                    node, parent = parent, parent.parent
+                    continue
+                if not self.is_red(sibling.right):
+                    self._set_red(sibling.left, False)
+                    self._set_red(sibling, True)
+                    self.rotate_right(sibling)
+                    sibling = parent.right
+                self._set_red(sibling, parent.red)
+                self._set_red(parent, False)
+                self._set_red(sibling.right, False)
+                self.rotate_left(parent)
+            else:
+                sibling = parent.left
+                if self.is_red(sibling):
+                    self._set_red(sibling, False)
+                    self._set_red(parent, True)
+                    self.rotate_right(parent)
+                    sibling = parent.left
+                if not self.is_red(sibling.left) and not self.is_red(sibling.right):
+                    self._set_red(sibling, True)
+                    node, parent = parent, parent.parent
+                    continue
+                if not self.is_red(sibling.left):
+                    self._set_red(sibling.right, False)
+                    self._set_red(sibling, True)
+                    self.rotate_left(sibling)
+                    sibling = parent.left
+                self._set_red(sibling, parent.red)
+                self._set_red(parent, False)
+                self._set_red(sibling.left, False)
+                self.rotate_right(parent)
+            node = self.root
+
+        if node is not None:
+            self._set_red(node, False)
+
+    def _find_min(self, node):
+        """找到子树中的最小节点"""
+        current = node
+        while current.left is not None:
+            current = current.left
+        return current
+
+    def get_tree_structure(self):
+        """获取树结构信息，用于可视化"""
+        if self.root is None:
+            return None
+
+        def build_structure(node):
+            return {
+                'data': node.key,
+                'id': node.uid,
+                'color': node.color,  # 'red' 或 'black'
+                'left': None,
+                'right': None
+            }
+
+        structure = build_structure(self.root)
+        stack = [(self.root, structure)]
+        while stack:
+            node, parent_structure = stack.pop()
+            for side, child in (('left', node.left), ('right', node.right)):
+                if child is not None:
+                    parent_structure[side] = build_structure(child)
+                    stack.append((child, parent_structure[side]))
+        return structure
+
+    def clear(self):
+        """清空树"""
+        self.root = None
+        self.node_counter = 0
+        self.reset_counters()
\ No newline at end of file
@@ -0,0 +1,36 @@
+class SearchTreeNode:
+    """查找树节点：键和整数编号为一等字段，用 __slots__ 省去实例字典和 data 字典"""
+
+    __slots__ = ('key', 'id', 'count', 'left', 'right', 'parent')
+
+    ID_PREFIX = "bst"  # 可视化标识前缀
+
+    def __init__(self, key, node_id):
+        self.key = key
+        self.id = node_id  # 树内唯一的整数编号
+        self.count = 1  # 多重集模式下该键出现的次数
+        self.left = None
+        self.right = None
+        self.parent = None
+
+    @property
+    def uid(self):
+        """可视化使用的字符串标识，如 bst_3"""
+        return f"{self.ID_PREFIX}_{self.id}"
+
+    @property
+    def data(self):
+        """兼容旧接口的数据字典（只读快照，修改不会写回节点）"""
+        return {'value': self.key, 'id': self.uid, 'count': self.count}
+
+    @property
+    def label(self):
+        """显示用的标签，重复键显示为 值×次数"""
+        return str(self.key) if self.count == 1 else f"{self.key}×{self.count}"
+
+    def __str__(self):
+        return str(self.key)
+
+    def is_leaf(self):
+        """判断是否为叶子节点"""
+        return self.left is None and self.right is None
\ No newline at end of file
@@ -0,0 +1,125 @@
+import random
+
+
+class _IndexTower:
+    """跳表索引塔，挂在链表节点之上"""
+
+    __slots__ = ('node', 'forward', 'width')
+
+    def __init__(self, node, level):
+        self.node = node
+        self.forward = [None] * level  # 每层的后继索引塔
+        self.width = [0] * level  # 每层到后继索引塔跨越的位置数
+
+
+class SkipListIndex:
+    """可索引跳表，作为链表的位置索引
+
+    第0层直接复用链表的 Node.next 链，只有被提升的节点才拥有索引塔，
+    因此 head/next 语义保持不变，按位置定位的期望复杂度为 O(log n)。
+    """
+
+    MAX_LEVEL = 16
+    PROMOTE_PROBABILITY = 0.25
+
+    def __init__(self, linked_list, seed=None):
+        self.linked_list = linked_list
+        self._random = random.Random(seed)
+        self.reset()
+
+    def reset(self):
+        """清空索引"""
+        self._header = _IndexTower(None, self.MAX_LEVEL)  # 哨兵，位置为 -1
+        self._level = 0  # 当前使用的索引层数
+
+    def rebuild(self):
+        """根据当前链表重建索引"""
+        self.reset()
+        position = 0
+        current = self.linked_list.head
+        while current:
+            self.insert(position, current)
+            position += 1
+            current = current.next
+
+    def _random_level(self):
+        """随机生成索引塔高度，0 表示不建立索引塔"""
+        level = 0
+        while level < self.MAX_LEVEL and self._random.random() < self.PROMOTE_PROBABILITY:
+            level += 1
+        return level
+
+    def _descend(self, position):
+        """从最高层下降，记录每层中位置不超过 position 的最后一个索引塔"""
+        update = [None] * self._level
+        update_pos = [0] * self._level
+        tower = self._header
+        tower_pos = -1
+        for lvl in range(self._level - 1, -1, -1):
+            while tower.forward[lvl] is not None and tower_pos + tower.width[lvl] <= position:
+                tower_pos += tower.width[lvl]
+                tower = tower.forward[lvl]
+            update[lvl] = tower
+            update_pos[lvl] = tower_pos
+        return tower, tower_pos, update, update_pos
+
+    def node_at(self, position):
+        """返回指定位置的节点"""
+        if position < 0 or position >= self.linked_list.size:
+            raise IndexError("位置超出范围")
+
+        tower, tower_pos, _, _ = self._descend(position)
+        if tower.node is None:
+            current = self.linked_list.head
+            tower_pos = 0
+        else:
+            current = tower.node
+
+        # 第0层沿 next 链前进，期望步数为常数
+        for _ in range(position - tower_pos):
+            current = current.next
+        return current
+
+    def insert(self, position, node):
+        """节点已链接到 position 处后调用，更新索引"""
+        _, _, update, update_pos = self._descend(position - 1)
+        level = self._random_level()
+
+        if level > self._level:
+            for _ in range(self._level, level):
+                update.append(self._header)
+                update_pos.append(-1)
+            self._level = level
+
+        tower = _IndexTower(node, level) if level else None
+        for lvl in range(self._level):
+            prev = update[lvl]
+            if lvl < level:
+                # 拆分 prev 的跨度
+                if prev.forward[lvl] is not None:
+                    tower.forward[lvl] = prev.forward[lvl]
+                    tower.width[lvl] = update_pos[lvl] + prev.width[lvl] + 1 - position
+                prev.forward[lvl] = tower
+                prev.width[lvl] = position - update_pos[lvl]
+            elif prev.forward[lvl] is not None:
+                prev.width[lvl] += 1
+
+    def delete(self, position):
+        """节点从 position 处摘除后调用，更新索引"""
+        _, _, update, update_pos = self._descend(position - 1)
+
+        for lvl in range(self._level):
+            prev = update[lvl]
+            succ = prev.forward[lvl]
+            if succ is None:
+                continue
+            if update_pos[lvl] + prev.width[lvl] == position:
+                # 被删除节点在本层拥有索引塔
+                prev.forward[lvl] = succ.forward[lvl]
+                if succ.forward[lvl] is not None:
+                    prev.width[lvl] += succ.width[lvl] - 1
+            else:
+                prev.width[lvl] -= 1
+
+        while self._level > 0 and self._header.forward[self._level - 1] is None:
+            self._level -= 1
\ No newline at end of file
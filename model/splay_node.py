@@ -0,0 +1,9 @@
+from .search_tree_node import SearchTreeNode
+
+
+class SplayNode(SearchTreeNode):
+    """伸展树节点（自顶向下伸展不使用父指针）"""
+
+    __slots__ = ()
+
+    ID_PREFIX = "splay"
\ No newline at end of file
@@ -0,0 +1,162 @@
+from .splay_node import SplayNode
+
+
+class _MaxKey:
+    """比任何键都大的哨兵，用于把子树最大节点伸展到根"""
+
+    def __lt__(self, other):
+        return False
+
+    def __gt__(self, other):
+        return True
+
+
+_MAX_KEY = _MaxKey()
+
+
+class SplayTree:
+    """伸展树实现（自顶向下伸展）
+
+    每次访问都把被访问的键伸展到根，频繁访问的键始终靠近根，
+    对倾斜（如 Zipf 分布）的访问序列均摊代价远低于 O(log n)。
+    """
+
+    def __init__(self):
+        self.root = None
+        self.node_counter = 0
+        self.rotations = 0  # 累计旋转次数
+
+    def is_empty(self):
+        return self.root is None
+
+    def reset_counters(self):
+        """重置旋转计数器"""
+        self.rotations = 0
+
+    def _splay(self, root, key):
+        """自顶向下伸展：把子树中最接近 key 的节点移到根并返回新根
+
+        沿查找路径下降时把路径拆成左右两棵树（分别保存小于和大于 key 的部分），
+        之字形一次旋转，最后与剩下的中间节点重新组装。
+        """
+        if root is None:
+            return None
+
+        header = SplayNode(None, 0)  # 临时头节点：right 挂左树，left 挂右树
+        left_max = right_min = header
+        current = root
+        while True:
+            if key < current.key:
+                if current.left is None:
+                    break
+                if key < current.left.key:
+                    # 一字形：先右旋
+                    child = current.left
+                    current.left = child.right
+                    child.right = current
+                    current = child
+                    self.rotations += 1
+                    if current.left is None:
+                        break
+                # 当前节点及其右子树都大于 key，挂到右树的最左端
+                right_min.left = current
+                right_min = current
+                current = current.left
+            elif key > current.key:
+                if current.right is None:
+                    break
+                if key > current.right.key:
+                    child = current.right
+                    current.right = child.left
+                    child.left = current
+                    current = child
+                    self.rotations += 1
+                    if current.right is None:
+                        break
+                left_max.right = current
+                left_max = current
+                current = current.right
+            else:
+                break
+
+        # 组装：中间节点的左右子树分别接到左树最右端、右树最左端
+        left_max.right = current.left
+        right_min.left = current.right
+        current.left = header.right
+        current.right = header.left
+        return current
+
+    def insert(self, data):
+        """插入节点：先按 data 伸展，再把新节点作为根（重复值放在已有节点之后）"""
+        self.node_counter += 1
+        node = SplayNode(data, self.node_counter)
+
+        if self.root is None:
+            self.root = node
+            return True
+
+        root = self._splay(self.root, data)
+        if data < root.key:
+            node.left = root.left
+            node.right = root
+            root.left = None
+        else:
+            node.right = root.right
+            node.left = root
+            root.right = None
+        self.root = node
+        return True
+
+    def search(self, data):
+        """搜索节点，并把找到的节点（未找到时为路径上最后一个节点）伸展到根"""
+        if self.root is None:
+            return None
+
+        self.root = self._splay(self.root, data)
+        if self.root.key == data:
+            return self.root
+        return None
+
+    def delete(self, data):
+        """删除节点：伸展到根后，用左子树的最大节点连接左右子树"""
+        if self.search(data) is None:
+            return
+
+        root = self.root
+        if root.left is None:
+            self.root = root.right
+        else:
+            new_root = self._splay(root.left, _MAX_KEY)  # 左子树最大节点没有右孩子
+            new_root.right = root.right
+            self.root = new_root
+        root.left = root.right = None
+
+    def get_tree_structure(self):
+        """获取树结构信息，用于可视化"""
+        if self.root is None:
+            return None
+
+        def build_structure(node):
+            return {
+                'data': node.key,
+                'id': node.uid,
+                'left': None,
+                'right': None
+            }
+
+        # 按升序访问后树会退化成长链，用显式栈自上而下填充孩子
+        structure = build_structure(self.root)
+        stack = [(self.root, structure)]
+        while stack:
+            node, parent_structure = stack.pop()
+            for side, child in (('left', node.left), ('right', node.right)):
+                if child is not None:
+                    parent_structure[side] = build_structure(child)
+                    stack.append((child, parent_structure[side]))
+        return structure
+
+    def clear(self):
+        """清空树"""
+        self.root = None
+        self.node_counter = 0
+        self.reset_counters()
\ No newline at end of file
@@ -1,10 +1,18 @@
+from . import typed_storage
+
+
 class Stack:
     """顺序栈实现"""
 
-    def __init__(self, capacity=10):
+    def __init__(self, capacity=10, growable=False, shrinkable=False, typecode=None):
         self.capacity = capacity
-        self.data = [None] * capacity
+        self.typecode = typecode  # 为 None 时用列表存储，否则用 array(typecode) 紧凑存储数值
+        self.data = typed_storage.allocate(capacity, typecode)
         self.top = -1  # 栈顶指针
+        self.growable = growable  # 栈满时是否自动倍增扩容
+        self.shrinkable = shrinkable  # 元素过少时是否自动缩容
+        self.min_capacity = capacity  # 缩容不低于初始容量
+        self.last_resize = None  # 最近一次操作引起的容量变化 (旧容量, 新容量)
 
     def is_empty(self):
         return self.top == -1
@@ -12,21 +20,85 @@ class Stack:
     def is_full(self):
         return self.top == self.capacity - 1
 
+    def _resize(self, new_capacity):
+        """调整底层数组容量"""
+        old_capacity = self.capacity
+        self.data = typed_storage.resize(self.data, new_capacity, self.typecode)
+        self.capacity = new_capacity
+        self.last_resize = (old_capacity, new_capacity)
+
+    def _ensure_capacity(self, required):
+        """保证容量不小于 required，按倍增策略扩容（均摊 O(1)）"""
+        if required <= self.capacity:
+            return
+        if not self.growable:
+            raise Exception("栈已满")
+
+        new_capacity = max(self.capacity, 1)
+        while new_capacity < required:
+            new_capacity *= 2
+        self._resize(new_capacity)
+
+    def _shrink_if_sparse(self):
+        """元素不足容量四分之一时减半，避免扩缩容抖动"""
+        if not self.shrinkable:
+            return
+
+        new_capacity = self.capacity
+        while new_capacity // 2 >= self.min_capacity and self.top + 1 <= new_capacity // 4:
+            new_capacity //= 2
+        if new_capacity != self.capacity:
+            self._resize(new_capacity)
+
     def push(self, item):
+        self.last_resize = None
         if self.is_full():
-            raise Exception("栈已满")
+            self._ensure_capacity(self.capacity + 1)
         self.top += 1
         self.data[self.top] = item
         return item
 
+    def push_many(self, items):
+        """批量入栈，整段切片赋值；容量不足且不可扩容时不做任何修改"""
+        self.last_resize = None
+        items = typed_storage.pack(items, self.typecode)
+        count = len(items)
+        if count == 0:
+            return 0
+
+        self._ensure_capacity(self.top + 1 + count)
+        self.data[self.top + 1:self.top + 1 + count] = items
+        self.top += count
+        return count
+
     def pop(self):
+        self.last_resize = None
         if self.is_empty():
             raise Exception("栈为空")
         item = self.data[self.top]
-        self.data[self.top] = None
+        self.data[self.top] = typed_storage.blank_value(self.typecode)
         self.top -= 1
+        self._shrink_if_sparse()
         return item
 
+    def pop_many(self, count):
+        """批量出栈，按出栈顺序（栈顶在前）返回元素列表"""
+        self.last_resize = None
+        if count < 0:
+            raise ValueError("出栈个数不能为负")
+        if count > self.top + 1:
+            raise Exception("栈中元素不足")
+        if count == 0:
+            return []
+
+        start = self.top + 1 - count
+        items = typed_storage.to_list(self.data[start:self.top + 1])
+        self.data[start:self.top + 1] = typed_storage.allocate(count, self.typecode)
+        self.top = start - 1
+        self._shrink_if_sparse()
+        items.reverse()
+        return items
+
     def peek(self):
         if self.is_empty():
             return None
@@ -36,4 +108,19 @@ class Stack:
         return self.top + 1
 
     def get_all_data(self):
-        return self.data[:self.top + 1]
\ No newline at end of file
+        return typed_storage.to_list(self.data[:self.top + 1])
+
+    def view(self):
+        """栈底到栈顶的只读视图，类型化存储时不复制数据"""
+        return typed_storage.view(self.data, 0, self.top + 1)
+
+    def convert_storage(self, typecode):
+        """切换存储后端（None 为列表，'q' 等为紧凑数组）"""
+        if typecode == self.typecode:
+            return
+        items = self.get_all_data()
+        # 先打包到新缓冲区，取值不合法时抛出异常，原存储保持不变
+        new_data = typed_storage.allocate(self.capacity, typecode)
+        new_data[:len(items)] = typed_storage.pack(items, typecode)
+        self.typecode = typecode
+        self.data = new_data
\ No newline at end of file
@@ -0,0 +1,56 @@
+from array import array
+
+
+def allocate(capacity, typecode=None):
+    """分配容量为 capacity 的顺序存储；typecode 为 None 时使用 Python 列表"""
+    if typecode is None:
+        return [None] * capacity
+    return array(typecode, bytes(capacity * array(typecode).itemsize))
+
+
+def blank_value(typecode=None):
+    """空槽位的填充值"""
+    return None if typecode is None else 0
+
+
+def resize(data, new_capacity, typecode=None):
+    """调整存储容量并返回新存储
+
+    类型化存储总是复制到新数组，不原地扩展，避免与渲染端持有的视图冲突。
+    """
+    if typecode is None:
+        if new_capacity > len(data):
+            data.extend([None] * (new_capacity - len(data)))
+        else:
+            del data[new_capacity:]
+        return data
+
+    new_data = allocate(new_capacity, typecode)
+    keep = min(len(data), new_capacity)
+    new_data[:keep] = data[:keep]
+    return new_data
+
+
+def pack(items, typecode=None):
+    """把元素转换成可以整段切片赋值到存储中的序列"""
+    if typecode is None:
+        return items if isinstance(items, list) else list(items)
+    if isinstance(items, array) and items.typecode == typecode:
+        return items
+    return array(typecode, items)
+
+
+def to_list(segment):
+    """把存储切片转换为 Python 列表（列表切片本身已是副本，直接返回）"""
+    if isinstance(segment, (array, memoryview)):
+        return segment.tolist()
+    if isinstance(segment, list):
+        return segment
+    return list(segment)
+
+
+def view(data, start, stop):
+    """获取 [start, stop) 的只读视图：类型化存储为零拷贝 memoryview，列表退化为切片"""
+    if isinstance(data, array):
+        return memoryview(data)[start:stop].toreadonly()
+    return data[start:stop]
\ No newline at end of file
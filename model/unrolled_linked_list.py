@@ -0,0 +1,171 @@
+from .node import Node
+
+
+class _Chunk:
+    """分块链表的数据块，每块最多保存 capacity 个元素"""
+
+    __slots__ = ('items', 'next')
+
+    def __init__(self, items=None):
+        self.items = items if items is not None else []
+        self.next = None
+
+
+class UnrolledLinkedList:
+    """分块链表（Unrolled Linked List）
+
+    元素按顺序存放在固定容量的数组块中，块与块之间用 next 链接。
+    接口与 LinkedList 保持一致，按位置定位只需逐块跳跃。
+    """
+
+    DEFAULT_CHUNK_CAPACITY = 64
+
+    def __init__(self, chunk_capacity=DEFAULT_CHUNK_CAPACITY):
+        if chunk_capacity < 2:
+            raise ValueError("块容量至少为2")
+        self.chunk_capacity = chunk_capacity
+        self.head = None  # 第一个数据块
+        self.tail = None  # 最后一个数据块
+        self.size = 0
+
+    def _locate(self, position):
+        """定位 position 所在的块，返回 (前驱块, 块, 块内偏移)"""
+        prev = None
+        chunk = self.head
+        while position >= len(chunk.items) and chunk.next is not None:
+            position -= len(chunk.items)
+            prev = chunk
+            chunk = chunk.next
+        return prev, chunk, position
+
+    def _split(self, chunk):
+        """将满块对半拆分，新块链接在其后"""
+        half = len(chunk.items) // 2
+        new_chunk = _Chunk(chunk.items[half:])
+        del chunk.items[half:]
+        new_chunk.next = chunk.next
+        chunk.next = new_chunk
+        if chunk is self.tail:
+            self.tail = new_chunk
+        return new_chunk
+
+    def _insert(self, position, data):
+        if self.head is None:
+            self.head = self.tail = _Chunk([data])
+            self.size = 1
+            return
+
+        if position == self.size:
+            chunk, offset = self.tail, len(self.tail.items)
+        else:
+            _, chunk, offset = self._locate(position)
+
+        if len(chunk.items) >= self.chunk_capacity:
+            new_chunk = self._split(chunk)
+            if offset > len(chunk.items):
+                offset -= len(chunk.items)
+                chunk = new_chunk
+
+        chunk.items.insert(offset, data)
+        self.size += 1
+
+    def insert_at_beginning(self, data):
+        """在链表开头插入元素"""
+        self._insert(0, data)
+        return Node(data)
+
+    def insert_at_end(self, data):
+        """在链表末尾插入元素"""
+        self._insert(self.size, data)
+        return Node(data)
+
+    def insert_at_position(self, position, data):
+        """在指定位置插入元素"""
+        if position < 0 or position > self.size:
+            raise IndexError("位置超出范围")
+
+        self._insert(position, data)
+        return Node(data)
+
+    def extend(self, iterable):
+        """批量在末尾追加元素，按块整段复制"""
+        values = list(iterable)
+        if not values:
+            return 0
+
+        start = 0
+        if self.tail is not None:
+            room = self.chunk_capacity - len(self.tail.items)
+            if room > 0:
+                self.tail.items.extend(values[:room])
+                start = room
+
+        # 新块只填充一半，为后续插入预留空间
+        step = max(self.chunk_capacity // 2, 1)
+        for i in range(start, len(values), step):
+            chunk = _Chunk(values[i:i + step])
+            if self.tail is None:
+                self.head = chunk
+            else:
+                self.tail.next = chunk
+            self.tail = chunk
+
+        self.size += len(values)
+        return len(values)
+
+    def delete_at_position(self, position):
+        """删除指定位置的元素，返回包含该值的独立节点"""
+        if position < 0 or position >= self.size:
+            raise IndexError("位置超出范围")
+
+        prev, chunk, offset = self._locate(position)
+        data = chunk.items.pop(offset)
+        self.size -= 1
+
+        if not chunk.items:
+            # 块已空，从链中摘除
+            if prev is None:
+                self.head = chunk.next
+            else:
+                prev.next = chunk.next
+            if chunk is self.tail:
+                self.tail = prev
+        elif chunk.next is not None and len(chunk.items) < self.chunk_capacity // 2:
+            following = chunk.next
+            if len(chunk.items) + len(following.items) <= self.chunk_capacity:
+                # 与后继块合并
+                chunk.items.extend(following.items)
+                chunk.next = following.next
+                if following is self.tail:
+                    self.tail = chunk
+            else:
+                # 从后继块借元素，使两块大致均衡
+                borrow = (len(following.items) - len(chunk.items)) // 2
+                chunk.items.extend(following.items[:borrow])
+                del following.items[:borrow]
+
+        return Node(data)
+
+    def get_chunks(self):
+        """获取所有数据块的元素列表，用于可视化"""
+        result = []
+        chunk = self.head
+        while chunk:
+            result.append(chunk.items)
+            chunk = chunk.next
+        return result
+
+    def to_list(self):
+        """将链表转换为Python列表"""
+        result = []
+        chunk = self.head
+        while chunk:
+            result.extend(chunk.items)
+            chunk = chunk.next
+        return result
+
+    def clear(self):
+        """清空链表"""
+        self.head = None
+        self.tail = None
+        self.size = 0
\ No newline at end of file
@@ -1,6 +1,9 @@
 import json
 import pickle
+from collections import deque
 from datetime import datetime
+from operator import attrgetter
+from model.binary_tree_node import BinaryTreeNode
 
 
 class DataStructureSerializer:
@@ -9,6 +12,16 @@ class DataStructureSerializer:
     @staticmethod
     def serialize_linked_list(linked_list):
         """序列化链表"""
+        from model.unrolled_linked_list import UnrolledLinkedList
+
+        if isinstance(linked_list, UnrolledLinkedList):
+            return {
+                "type": "LinkedList",
+                "engine": "unrolled",
+                "chunk_capacity": linked_list.chunk_capacity,
+                "data": linked_list.to_list()
+            }
+
         if linked_list.head is None:
             return {"type": "LinkedList", "data": []}
 
@@ -21,13 +34,16 @@ class DataStructureSerializer:
         return {"type": "LinkedList", "data": data}
 
     @staticmethod
-    def deserialize_linked_list(data):
-        """反序列化链表"""
+    def deserialize_linked_list(data, engine="node", chunk_capacity=None):
+        """反序列化链表，engine 为 'node'（节点链表）或 'unrolled'（分块链表）"""
         from model.linked_list import LinkedList
+        from model.unrolled_linked_list import UnrolledLinkedList
 
-        linked_list = LinkedList()
-        for item in data:
-            linked_list.insert_at_end(item)
+        if engine == "unrolled":
+            linked_list = UnrolledLinkedList(chunk_capacity or UnrolledLinkedList.DEFAULT_CHUNK_CAPACITY)
+        else:
+            linked_list = LinkedList()
+        linked_list.extend(data)
 
         return linked_list
 
@@ -37,7 +53,10 @@ class DataStructureSerializer:
         return {
             "type": "Stack",
             "data": stack.get_all_data(),
-            "capacity": stack.capacity
+            "capacity": stack.capacity,
+            "growable": stack.growable,
+            "shrinkable": stack.shrinkable,
+            "typecode": stack.typecode
         }
 
     @staticmethod
@@ -45,11 +64,15 @@ class DataStructureSerializer:
         """反序列化栈"""
         from model.stack import Stack
 
-        stack = Stack(data.get("capacity", 10))
-        # 重新构建栈
-        for item in reversed(data["data"]):
-            if item is not None:
-                stack.push(item)
+        items = [item for item in data["data"] if item is not None]
+        # 容量至少能容纳保存的全部元素，避免大存档加载失败
+        capacity = max(data.get("capacity", 10), len(items))
+        stack = Stack(capacity,
+                      growable=data.get("growable", False),
+                      shrinkable=data.get("shrinkable", False),
+                      typecode=data.get("typecode"))
+        # 存档按栈底到栈顶的顺序保存，整段入栈即可还原
+        stack.push_many(items)
 
         return stack
 
@@ -59,7 +82,9 @@ class DataStructureSerializer:
         return {
             "type": "Queue",
             "data": queue.get_all_data(),
-            "capacity": queue.capacity
+            "capacity": queue.capacity,
+            "typecode": queue.typecode,
+            "growable": queue.growable
         }
 
     @staticmethod
@@ -67,28 +92,22 @@ class DataStructureSerializer:
         """反序列化队列"""
         from model.queue import Queue
 
-        queue = Queue(data.get("capacity", 10))
-        for item in data["data"]:
-            queue.enqueue(item)
+        items = data["data"]
+        # 容量至少能容纳保存的全部元素
+        capacity = max(data.get("capacity", 10), len(items))
+        queue = Queue(capacity,
+                      typecode=data.get("typecode"),
+                      growable=data.get("growable", False))
+        queue.enqueue_many(items)
 
         return queue
 
     @staticmethod
     def serialize_binary_tree(tree):
         """序列化二叉树"""
-
-        def serialize_node(node):
-            if node is None:
-                return None
-            return {
-                "data": node.data,
-                "left": serialize_node(node.left),
-                "right": serialize_node(node.right)
-            }
-
         return {
             "type": "BinaryTree",
-            "data": serialize_node(tree.root)
+            "nodes": DataStructureSerializer._to_level_order(tree.root, lambda node: {"data": node.data})
         }
 
     @staticmethod
@@ -96,82 +115,130 @@ class DataStructureSerializer:
         """反序列化二叉树"""
         from model.binary_tree import BinaryTree
 
-        def deserialize_node(node_data):
-            if node_data is None:
-                return None
+        nodes = DataStructureSerializer._load_level_order(
+            data, lambda node_data: BinaryTreeNode(node_data["data"]))
+        tree = BinaryTree()
+        tree.root = nodes[0] if nodes else None
+        tree.rebuild_index()
+        return tree
 
-            # 创建节点
-            node = BinaryTreeNode(node_data["data"])
-            node.left = deserialize_node(node_data.get("left"))
-            node.right = deserialize_node(node_data.get("right"))
+    @staticmethod
+    def _parse_node_id(node_data, default):
+        """从保存的 'bst_3' / 'avl_3' 形式标识中解析整数编号"""
+        suffix = str(node_data.get("id", "")).rsplit("_", 1)[-1]
+        return int(suffix) if suffix.isdigit() else default
 
-            return node
+    @staticmethod
+    def _to_level_order(root, serialize_node, children=attrgetter("left", "right")):
+        """按层序把二叉树展平成列表：根之后，每个非空项依次对应其左右孩子，空孩子记为 None
+
+        嵌套字典在树退化成长链时会超出递归深度（json 读写也是递归的），展平后与树高无关。
+        """
+        if root is None:
+            return []
+        nodes = [serialize_node(root)]
+        queue = deque([root])
+        while queue:
+            for child in children(queue.popleft()):
+                nodes.append(None if child is None else serialize_node(child))
+                if child is not None:
+                    queue.append(child)
+        while nodes[-1] is None:
+            nodes.pop()
+        return nodes
 
-        tree = BinaryTree()
-        tree.root = deserialize_node(data["data"])
-        return tree
+    @staticmethod
+    def _load_level_order(data, make_node, link_parent=True):
+        """由层序列表重建节点并连接左右孩子，返回按层序排列的节点列表（首项为根）
+
+        兼容旧格式：data 中没有 "nodes" 时，先把嵌套的 "data" 字典逐层展平。
+        """
+        if "nodes" in data:
+            items = data["nodes"]
+        else:
+            items = DataStructureSerializer._to_level_order(
+                data.get("data"), lambda node_data: node_data,
+                lambda node_data: (node_data.get("left"), node_data.get("right")))
+        if not items:
+            return []
+
+        nodes = [make_node(items[0])]
+        index = 1
+        for parent in nodes:  # 遍历过程中追加的孩子也会被依次处理
+            for side in ("left", "right"):
+                if index < len(items) and items[index] is not None:
+                    child = make_node(items[index])
+                    setattr(parent, side, child)
+                    if link_parent:
+                        child.parent = parent
+                    nodes.append(child)
+                index += 1
+        return nodes
 
     @staticmethod
     def serialize_bst(bst):
         """序列化二叉搜索树"""
-
-        def serialize_node(node):
-            if node is None:
-                return None
-            return {
-                "data": node.data,
-                "left": serialize_node(node.left),
-                "right": serialize_node(node.right)
-            }
-
         return {
             "type": "BinarySearchTree",
-            "data": serialize_node(bst.root)
+            "multiset": bst.multiset,
+            "nodes": DataStructureSerializer._to_level_order(bst.root, lambda node: {"data": node.data})
         }
 
     @staticmethod
     def deserialize_bst(data):
         """反序列化二叉搜索树"""
         from model.binary_search_tree import BinarySearchTree
+        from model.search_tree_node import SearchTreeNode
 
-        def deserialize_node(node_data):
-            if node_data is None:
-                return None
-
-            node = BinaryTreeNode(node_data["data"])
-            node.left = deserialize_node(node_data.get("left"))
-            node.right = deserialize_node(node_data.get("right"))
+        bst = BinarySearchTree(multiset=data.get("multiset", False))
 
+        def deserialize_node(node_data):
+            value_data = node_data["data"]
+            node_id = DataStructureSerializer._parse_node_id(value_data, bst.node_counter + 1)
+            bst.node_counter = max(bst.node_counter, node_id)
+            node = SearchTreeNode(value_data["value"], node_id)
+            node.count = value_data.get("count", 1)
             return node
 
-        bst = BinarySearchTree()
-        bst.root = deserialize_node(data["data"])
+        # 迭代删除依赖父指针，重建时一并连接
+        nodes = DataStructureSerializer._load_level_order(data, deserialize_node)
+        bst.root = nodes[0] if nodes else None
+        bst.rebuild_stats()
         return bst
 
     @staticmethod
     def serialize_huffman(huffman_tree):
-        """序列化哈夫曼树"""
-
-        def serialize_node(node):
-            if node is None:
-                return None
-            return {
-                "data": node.data,
-                "left": serialize_node(node.left),
-                "right": serialize_node(node.right)
-            }
-
+        """序列化哈夫曼树：只保存按 (码长, 字符) 排序的码长表和叶子频率，树和范式编码加载时重建"""
+        frequency = {}
+        stack = [huffman_tree.root] if huffman_tree.root is not None else []
+        while stack:
+            node = stack.pop()
+            if node.data['is_leaf']:
+                frequency[node.data['char']] = node.data['freq']
+            stack.extend(child for child in (node.left, node.right) if child is not None)
+
+        code_lengths = huffman_tree.get_code_lengths()
         return {
             "type": "HuffmanTree",
-            "data": serialize_node(huffman_tree.root),
-            "codes": huffman_tree.get_codes()
+            "code_lengths": [[char, length] for char, length in code_lengths],
+            "frequencies": [frequency.get(char) for char, _ in code_lengths]
         }
 
     @staticmethod
     def deserialize_huffman(data):
-        """反序列化哈夫曼树"""
+        """反序列化哈夫曼树，O(字母表大小)；兼容旧格式保存的完整节点树"""
         from model.huffman_tree import HuffmanTree
 
+        if "code_lengths" in data:
+            huffman_tree = HuffmanTree()
+            lengths = {char: length for char, length in data["code_lengths"]}
+            frequencies = data.get("frequencies")
+            frequency = None
+            if frequencies and None not in frequencies:
+                frequency = {char: freq for (char, _), freq in zip(data["code_lengths"], frequencies)}
+            huffman_tree.build_from_code_lengths(lengths, frequency)
+            return huffman_tree
+
         def deserialize_node(node_data):
             if node_data is None:
                 return None
@@ -185,25 +252,24 @@ class DataStructureSerializer:
         huffman_tree = HuffmanTree()
         huffman_tree.root = deserialize_node(data["data"])
         huffman_tree.codes = data.get("codes", {})
+        root = huffman_tree.root
+        if root is not None and root.data['is_leaf']:
+            # 旧格式只有一个字符时根就是叶子，改成与范式编码一致的 根 -> 左叶子，码字为 '0'
+            huffman_tree.root = BinaryTreeNode({'char': None, 'freq': root.data['freq'], 'is_leaf': False})
+            huffman_tree.root.left = root
+            root.parent = huffman_tree.root
+            huffman_tree.codes = {root.data['char']: '0'}
+        huffman_tree.rebuild_stats()
         return huffman_tree
 
     @staticmethod
     def serialize_avl(avl_tree):
         """序列化AVL树"""
-
-        def serialize_node(node):
-            if node is None:
-                return None
-            return {
-                "data": node.data,
-                "height": node.height,
-                "left": serialize_node(node.left),
-                "right": serialize_node(node.right)
-            }
-
         return {
             "type": "AVLTree",
-            "data": serialize_node(avl_tree.root)
+            "multiset": avl_tree.multiset,
+            "nodes": DataStructureSerializer._to_level_order(
+                avl_tree.root, lambda node: {"data": node.data, "height": node.height})
         }
 
     @staticmethod
@@ -211,25 +277,162 @@ class DataStructureSerializer:
         """反序列化AVL树"""
         from model.avl_tree import AVLTree, AVLNode
 
-        def deserialize_node(node_data):
-            if node_data is None:
-                return None
+        avl_tree = AVLTree(multiset=data.get("multiset", False))
 
-            node = AVLNode(node_data["data"])
+        def deserialize_node(node_data):
+            value_data = node_data["data"]
+            node_id = DataStructureSerializer._parse_node_id(value_data, avl_tree.node_counter + 1)
+            avl_tree.node_counter = max(avl_tree.node_counter, node_id)
+            node = AVLNode(value_data["value"], node_id)
+            node.count = value_data.get("count", 1)
             node.height = node_data.get("height", 1)
-            node.left = deserialize_node(node_data.get("left"))
-            node.right = deserialize_node(node_data.get("right"))
+            node.balance = value_data.get("balance", 0)
+            return node
+
+        nodes = DataStructureSerializer._load_level_order(data, deserialize_node)
+        # 层序倒过来时孩子总在父节点之前，子树大小自底向上累加
+        for node in reversed(nodes):
+            node.size = node.count + avl_tree.get_size(node.left) + avl_tree.get_size(node.right)
+        avl_tree.root = nodes[0] if nodes else None
+        return avl_tree
 
-            if node.left:
-                node.left.parent = node
-            if node.right:
-                node.right.parent = node
+    @staticmethod
+    def serialize_red_black_tree(rb_tree):
+        """序列化红黑树"""
+        return {
+            "type": "RedBlackTree",
+            "nodes": DataStructureSerializer._to_level_order(rb_tree.root, lambda node: {"data": node.data})
+        }
 
+    @staticmethod
+    def deserialize_red_black_tree(data):
+        """反序列化红黑树"""
+        from model.red_black_tree import RedBlackTree
+        from model.rb_node import RBNode
+
+        rb_tree = RedBlackTree()
+
+        def deserialize_node(node_data):
+            value_data = node_data["data"]
+            node_id = DataStructureSerializer._parse_node_id(value_data, rb_tree.node_counter + 1)
+            rb_tree.node_counter = max(rb_tree.node_counter, node_id)
+            node = RBNode(value_data["value"], node_id)
+            node.red = value_data.get("color") == "red"
             return node
 
-        avl_tree = AVLTree()
-        avl_tree.root = deserialize_node(data["data"])
-        return avl_tree
+        nodes = DataStructureSerializer._load_level_order(data, deserialize_node)
+        rb_tree.root = nodes[0] if nodes else None
+        return rb_tree
+
+    @staticmethod
+    def serialize_splay_tree(splay_tree):
+        """序列化伸展树（保存当前形状，加载后访问局部性得以保留）"""
+        return {
+            "type": "SplayTree",
+            "nodes": DataStructureSerializer._to_level_order(splay_tree.root, lambda node: {"data": node.data})
+        }
+
+    @staticmethod
+    def deserialize_splay_tree(data):
+        """反序列化伸展树"""
+        from model.splay_tree import SplayTree
+        from model.splay_node import SplayNode
+
+        splay_tree = SplayTree()
+
+        def deserialize_node(node_data):
+            value_data = node_data["data"]
+            node_id = DataStructureSerializer._parse_node_id(value_data, splay_tree.node_counter + 1)
+            splay_tree.node_counter = max(splay_tree.node_counter, node_id)
+            return SplayNode(value_data["value"], node_id)
+
+        # 自顶向下伸展不使用父指针
+        nodes = DataStructureSerializer._load_level_order(data, deserialize_node, link_parent=False)
+        splay_tree.root = nodes[0] if nodes else None
+        return splay_tree
+
+    @staticmethod
+    def serialize_b_tree(b_tree):
+        """序列化B树/B+树（保存节点划分，加载后形状不变）"""
+        from model.b_plus_tree import BPlusTree
+
+        def serialize_node(node):
+            return {
+                "id": node.uid,
+                "keys": list(node.keys),
+                "children": [serialize_node(child) for child in node.children]
+            }
+
+        return {
+            "type": "BTree",
+            "plus": isinstance(b_tree, BPlusTree),
+            "min_degree": b_tree.min_degree,
+            "data": serialize_node(b_tree.root) if b_tree.root is not None else None
+        }
+
+    @staticmethod
+    def deserialize_b_tree(data):
+        """反序列化B树/B+树，B+树的叶子链表按中序重新串联"""
+        from model.b_tree import BTree
+        from model.b_plus_tree import BPlusTree
+        from model.b_tree_node import BTreeNode
+
+        plus = data.get("plus", False)
+        b_tree = (BPlusTree if plus else BTree)(data.get("min_degree", 2))
+        leaves = []
+
+        def deserialize_node(node_data):
+            node_id = DataStructureSerializer._parse_node_id(node_data, b_tree.node_counter + 1)
+            b_tree.node_counter = max(b_tree.node_counter, node_id)
+            node = BTreeNode(node_id, list(node_data["keys"]),
+                             [deserialize_node(child) for child in node_data.get("children", [])])
+            if node.leaf:
+                leaves.append(node)
+            if not plus or node.leaf:
+                b_tree.count += len(node.keys)
+            return node
+
+        if data.get("data") is not None:
+            b_tree.root = deserialize_node(data["data"])
+        if plus:
+            for leaf, next_leaf in zip(leaves, leaves[1:]):
+                leaf.next = next_leaf
+        return b_tree
+
+    @staticmethod
+    def serialize_arena_tree(arena_tree):
+        """序列化数组化查找树：并行数组直接转为列表，无需逐节点遍历"""
+        return {
+            "type": "ArenaTree",
+            "balanced": arena_tree.balanced,
+            "typecode": arena_tree.typecode,
+            "root": arena_tree.root,
+            "free": arena_tree.free,
+            "count": arena_tree.count,
+            "keys": list(arena_tree.keys),
+            "left": arena_tree.left.tolist(),
+            "right": arena_tree.right.tolist(),
+            "parent": arena_tree.parent.tolist(),
+            "height": arena_tree.height.tolist()
+        }
+
+    @staticmethod
+    def deserialize_arena_tree(data):
+        """反序列化数组化查找树"""
+        from array import array
+        from model.arena_tree import ArenaTree
+        from model import typed_storage
+
+        arena_tree = ArenaTree(balanced=data.get("balanced", True), typecode=data.get("typecode", 'q'))
+        arena_tree.keys = typed_storage.pack(data["keys"], arena_tree.typecode)
+        arena_tree.left = array(ArenaTree.INDEX_TYPECODE, data["left"])
+        arena_tree.right = array(ArenaTree.INDEX_TYPECODE, data["right"])
+        arena_tree.parent = array(ArenaTree.INDEX_TYPECODE, data["parent"])
+        arena_tree.height = array('b', data["height"])
+        arena_tree.root = data["root"]
+        arena_tree.free = data["free"]
+        arena_tree.count = data["count"]
+        return arena_tree
 
     @staticmethod
     def save_to_file(data, filename):
@@ -1,5 +1,6 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGroupBox,
-                             QPushButton, QSpinBox, QLabel, QLineEdit, QComboBox)
+                             QPushButton, QSpinBox, QLabel, QLineEdit, QComboBox,
+                             QCheckBox)
 from PyQt5.QtCore import Qt
 
 
@@ -28,7 +29,7 @@ class ControlsPanel(QWidget):
         ds_group = QGroupBox("数据结构选择")
         ds_layout = QHBoxLayout()
         self.ds_combo = QComboBox()
-        self.ds_combo.addItems(["链表", "栈", "队列", "二叉树", "二叉搜索树", "哈夫曼树", "AVL树"])
+        self.ds_combo.addItems(["链表", "栈", "队列", "二叉树", "二叉搜索树", "哈夫曼树", "AVL树", "红黑树", "伸展树", "B树"])
         ds_layout.addWidget(QLabel("选择数据结构:"))
         ds_layout.addWidget(self.ds_combo)
         ds_layout.addStretch()
@@ -56,6 +57,25 @@ class ControlsPanel(QWidget):
         position_layout.addWidget(self.position_spin)
         position_layout.addStretch()
 
+        # 位置索引开关（关闭时保留线性遍历，便于教学对比）
+        self.ll_index_check = QCheckBox("启用跳表位置索引")
+        self.ll_index_check.setChecked(False)
+        position_layout.addWidget(self.ll_index_check)
+
+        # 存储引擎选择
+        engine_layout = QHBoxLayout()
+        engine_layout.addWidget(QLabel("存储引擎:"))
+        self.ll_engine_combo = QComboBox()
+        self.ll_engine_combo.addItems(["节点链表", "分块链表"])
+        engine_layout.addWidget(self.ll_engine_combo)
+        engine_layout.addWidget(QLabel("块容量:"))
+        self.ll_chunk_spin = QSpinBox()
+        self.ll_chunk_spin.setRange(2, 1024)
+        self.ll_chunk_spin.setValue(4)
+        self.ll_chunk_spin.setEnabled(False)
+        engine_layout.addWidget(self.ll_chunk_spin)
+        engine_layout.addStretch()
+
         # 操作按钮
         button_layout = QHBoxLayout()
         self.insert_begin_btn = QPushButton("在开头插入")
@@ -72,6 +92,7 @@ class ControlsPanel(QWidget):
 
         ll_layout.addLayout(value_layout)
         ll_layout.addLayout(position_layout)
+        ll_layout.addLayout(engine_layout)
         ll_layout.addLayout(button_layout)
         self.ll_group.setLayout(ll_layout)
 
@@ -98,8 +119,34 @@ class ControlsPanel(QWidget):
         stack_button_layout.addWidget(self.pop_btn)
         stack_button_layout.addWidget(self.clear_stack_btn)
 
+        # 动态扩容开关
+        self.stack_growable_check = QCheckBox("动态扩容（满时倍增，稀疏时减半）")
+        self.stack_growable_check.setChecked(False)
+
+        # 紧凑整数存储开关
+        self.stack_typed_check = QCheckBox("紧凑整数存储 (array('q'))")
+        self.stack_typed_check.setChecked(False)
+
+        # 批量入栈/出栈
+        stack_batch_layout = QHBoxLayout()
+        self.stack_batch_input = QLineEdit()
+        self.stack_batch_input.setPlaceholderText("输入多个值，用逗号分隔，如: 1,2,3")
+        self.stack_push_many_btn = QPushButton("批量入栈")
+        self.stack_pop_many_spin = QSpinBox()
+        self.stack_pop_many_spin.setRange(1, 9999)
+        self.stack_pop_many_spin.setValue(2)
+        self.stack_pop_many_btn = QPushButton("批量出栈")
+
+        stack_batch_layout.addWidget(self.stack_batch_input)
+        stack_batch_layout.addWidget(self.stack_push_many_btn)
+        stack_batch_layout.addWidget(self.stack_pop_many_spin)
+        stack_batch_layout.addWidget(self.stack_pop_many_btn)
+
         stack_layout.addLayout(stack_value_layout)
         stack_layout.addLayout(stack_button_layout)
+        stack_layout.addWidget(self.stack_growable_check)
+        stack_layout.addWidget(self.stack_typed_check)
+        stack_layout.addLayout(stack_batch_layout)
         self.stack_group.setLayout(stack_layout)
         self.stack_group.setVisible(False)
 
@@ -126,8 +173,34 @@ class ControlsPanel(QWidget):
         queue_button_layout.addWidget(self.dequeue_btn)
         queue_button_layout.addWidget(self.clear_queue_btn)
 
+        # 紧凑整数存储开关
+        self.queue_typed_check = QCheckBox("紧凑整数存储 (array('q'))")
+        self.queue_typed_check.setChecked(False)
+
+        # 动态扩容开关
+        self.queue_growable_check = QCheckBox("动态扩容（满时倍增并摆正环形缓冲区）")
+        self.queue_growable_check.setChecked(False)
+
+        # 批量入队/出队
+        queue_batch_layout = QHBoxLayout()
+        self.queue_batch_input = QLineEdit()
+        self.queue_batch_input.setPlaceholderText("输入多个值，用逗号分隔，如: 1,2,3")
+        self.queue_enqueue_many_btn = QPushButton("批量入队")
+        self.queue_dequeue_many_spin = QSpinBox()
+        self.queue_dequeue_many_spin.setRange(1, 9999)
+        self.queue_dequeue_many_spin.setValue(2)
+        self.queue_dequeue_many_btn = QPushButton("批量出队")
+
+        queue_batch_layout.addWidget(self.queue_batch_input)
+        queue_batch_layout.addWidget(self.queue_enqueue_many_btn)
+        queue_batch_layout.addWidget(self.queue_dequeue_many_spin)
+        queue_batch_layout.addWidget(self.queue_dequeue_many_btn)
+
         queue_layout.addLayout(queue_value_layout)
         queue_layout.addLayout(queue_button_layout)
+        queue_layout.addWidget(self.queue_typed_check)
+        queue_layout.addWidget(self.queue_growable_check)
+        queue_layout.addLayout(queue_batch_layout)
         self.queue_group.setLayout(queue_layout)
         self.queue_group.setVisible(False)
 
@@ -178,6 +251,8 @@ class ControlsPanel(QWidget):
         self.bst_value_spin.setRange(-999, 999)
         self.bst_value_spin.setValue(10)
         bst_value_layout.addWidget(self.bst_value_spin)
+        self.bst_multiset_check = QCheckBox("重复键计数（多重集）")
+        bst_value_layout.addWidget(self.bst_multiset_check)
         bst_value_layout.addStretch()
 
         # BST操作按钮
@@ -256,6 +331,8 @@ class ControlsPanel(QWidget):
         self.avl_value_spin.setRange(-999, 999)
         self.avl_value_spin.setValue(10)
         avl_value_layout.addWidget(self.avl_value_spin)
+        self.avl_multiset_check = QCheckBox("重复键计数（多重集）")
+        avl_value_layout.addWidget(self.avl_multiset_check)
         avl_value_layout.addStretch()
 
         # AVL操作按钮
@@ -285,6 +362,145 @@ class ControlsPanel(QWidget):
         self.avl_group.setLayout(avl_layout)
         self.avl_group.setVisible(False)
 
+        # 红黑树操作组
+        self.rb_group = QGroupBox("红黑树操作")
+        rb_layout = QVBoxLayout()
+
+        rb_value_layout = QHBoxLayout()
+        rb_value_layout.addWidget(QLabel("值:"))
+        self.rb_value_spin = QSpinBox()
+        self.rb_value_spin.setRange(-999, 999)
+        self.rb_value_spin.setValue(10)
+        rb_value_layout.addWidget(self.rb_value_spin)
+        rb_value_layout.addStretch()
+
+        rb_button_layout = QHBoxLayout()
+        self.rb_insert_btn = QPushButton("插入")
+        self.rb_search_btn = QPushButton("查找")
+        self.rb_delete_btn = QPushButton("删除")
+        self.rb_clear_btn = QPushButton("清空红黑树")
+
+        rb_button_layout.addWidget(self.rb_insert_btn)
+        rb_button_layout.addWidget(self.rb_search_btn)
+        rb_button_layout.addWidget(self.rb_delete_btn)
+        rb_button_layout.addWidget(self.rb_clear_btn)
+
+        rb_batch_layout = QHBoxLayout()
+        self.rb_batch_input = QLineEdit()
+        self.rb_batch_input.setPlaceholderText("输入多个值，用逗号分隔，如: 10,20,5,15,25")
+        self.rb_batch_insert_btn = QPushButton("批量插入")
+
+        rb_batch_layout.addWidget(self.rb_batch_input)
+        rb_batch_layout.addWidget(self.rb_batch_insert_btn)
+
+        rb_layout.addLayout(rb_value_layout)
+        rb_layout.addLayout(rb_button_layout)
+        rb_layout.addLayout(rb_batch_layout)
+        self.rb_group.setLayout(rb_layout)
+        self.rb_group.setVisible(False)
+
+        # 伸展树操作组
+        self.splay_group = QGroupBox("伸展树操作")
+        splay_layout = QVBoxLayout()
+
+        splay_value_layout = QHBoxLayout()
+        splay_value_layout.addWidget(QLabel("值:"))
+        self.splay_value_spin = QSpinBox()
+        self.splay_value_spin.setRange(-999, 999)
+        self.splay_value_spin.setValue(10)
+        splay_value_layout.addWidget(self.splay_value_spin)
+        splay_value_layout.addStretch()
+
+        splay_button_layout = QHBoxLayout()
+        self.splay_insert_btn = QPushButton("插入")
+        self.splay_search_btn = QPushButton("查找")
+        self.splay_delete_btn = QPushButton("删除")
+        self.splay_clear_btn = QPushButton("清空伸展树")
+
+        splay_button_layout.addWidget(self.splay_insert_btn)
+        splay_button_layout.addWidget(self.splay_search_btn)
+        splay_button_layout.addWidget(self.splay_delete_btn)
+        splay_button_layout.addWidget(self.splay_clear_btn)
+
+        splay_batch_layout = QHBoxLayout()
+        self.splay_batch_input = QLineEdit()
+        self.splay_batch_input.setPlaceholderText("输入多个值，用逗号分隔，如: 10,20,5,15,25")
+        self.splay_batch_insert_btn = QPushButton("批量插入")
+
+        splay_batch_layout.addWidget(self.splay_batch_input)
+        splay_batch_layout.addWidget(self.splay_batch_insert_btn)
+
+        splay_layout.addLayout(splay_value_layout)
+        splay_layout.addLayout(splay_button_layout)
+        splay_layout.addLayout(splay_batch_layout)
+        self.splay_group.setLayout(splay_layout)
+        self.splay_group.setVisible(False)
+
+        # B树操作组
+        self.btree_group = QGroupBox("B树 / B+树操作")
+        btree_layout = QVBoxLayout()
+
+        btree_variant_layout = QHBoxLayout()
+        btree_variant_layout.addWidget(QLabel("类型:"))
+        self.btree_variant_combo = QComboBox()
+        self.btree_variant_combo.addItems(["B树", "B+树"])
+        btree_variant_layout.addWidget(self.btree_variant_combo)
+        btree_variant_layout.addWidget(QLabel("最小度数 t:"))
+        self.btree_degree_spin = QSpinBox()
+        self.btree_degree_spin.setRange(2, 64)
+        self.btree_degree_spin.setValue(2)
+        btree_variant_layout.addWidget(self.btree_degree_spin)
+        btree_variant_layout.addStretch()
+
+        btree_value_layout = QHBoxLayout()
+        btree_value_layout.addWidget(QLabel("值:"))
+        self.btree_value_spin = QSpinBox()
+        self.btree_value_spin.setRange(-999, 999)
+        self.btree_value_spin.setValue(10)
+        btree_value_layout.addWidget(self.btree_value_spin)
+        btree_value_layout.addStretch()
+
+        btree_button_layout = QHBoxLayout()
+        self.btree_insert_btn = QPushButton("插入")
+        self.btree_search_btn = QPushButton("查找")
+        self.btree_delete_btn = QPushButton("删除")
+        self.btree_clear_btn = QPushButton("清空B树")
+
+        btree_button_layout.addWidget(self.btree_insert_btn)
+        btree_button_layout.addWidget(self.btree_search_btn)
+        btree_button_layout.addWidget(self.btree_delete_btn)
+        btree_button_layout.addWidget(self.btree_clear_btn)
+
+        btree_range_layout = QHBoxLayout()
+        btree_range_layout.addWidget(QLabel("区间:"))
+        self.btree_lo_spin = QSpinBox()
+        self.btree_lo_spin.setRange(-999, 999)
+        self.btree_lo_spin.setValue(0)
+        self.btree_hi_spin = QSpinBox()
+        self.btree_hi_spin.setRange(-999, 999)
+        self.btree_hi_spin.setValue(50)
+        self.btree_range_btn = QPushButton("区间扫描")
+        btree_range_layout.addWidget(self.btree_lo_spin)
+        btree_range_layout.addWidget(QLabel("~"))
+        btree_range_layout.addWidget(self.btree_hi_spin)
+        btree_range_layout.addWidget(self.btree_range_btn)
+
+        btree_batch_layout = QHBoxLayout()
+        self.btree_batch_input = QLineEdit()
+        self.btree_batch_input.setPlaceholderText("输入多个值，用逗号分隔，如: 10,20,5,15,25")
+        self.btree_batch_load_btn = QPushButton("批量装载")
+
+        btree_batch_layout.addWidget(self.btree_batch_input)
+        btree_batch_layout.addWidget(self.btree_batch_load_btn)
+
+        btree_layout.addLayout(btree_variant_layout)
+        btree_layout.addLayout(btree_value_layout)
+        btree_layout.addLayout(btree_button_layout)
+        btree_layout.addLayout(btree_range_layout)
+        btree_layout.addLayout(btree_batch_layout)
+        self.btree_group.setLayout(btree_layout)
+        self.btree_group.setVisible(False)
+
         # 指令输入
         cmd_group = QGroupBox("指令输入")
         cmd_layout = QVBoxLayout()
@@ -304,6 +520,9 @@ class ControlsPanel(QWidget):
         layout.addWidget(self.bst_group)
         layout.addWidget(self.huffman_group)
         layout.addWidget(self.avl_group)
+        layout.addWidget(self.rb_group)
+        layout.addWidget(self.splay_group)
+        layout.addWidget(self.btree_group)
         layout.addWidget(cmd_group)
         layout.addStretch()
 
@@ -327,26 +546,121 @@ class ControlsPanel(QWidget):
         self.bst_group.setVisible(ds_name == "二叉搜索树")
         self.huffman_group.setVisible(ds_name == "哈夫曼树")
         self.avl_group.setVisible(ds_name == "AVL树")
+        self.rb_group.setVisible(ds_name == "红黑树")
+        self.splay_group.setVisible(ds_name == "伸展树")
+        self.btree_group.setVisible(ds_name == "B树")
 
-    def connect_ll_signals(self, insert_begin, insert_end, insert_pos, delete_pos, clear):
+    def connect_ll_signals(self, insert_begin, insert_end, insert_pos, delete_pos, clear, toggle_index,
+                           change_engine):
         """连接链表操作的信号"""
         self.insert_begin_btn.clicked.connect(insert_begin)
         self.insert_end_btn.clicked.connect(insert_end)
         self.insert_pos_btn.clicked.connect(insert_pos)
         self.delete_pos_btn.clicked.connect(delete_pos)
         self.clear_btn.clicked.connect(clear)
-
-    def connect_stack_signals(self, push, pop, clear):
+        self.ll_index_check.toggled.connect(toggle_index)
+        self.ll_engine_combo.currentTextChanged.connect(self.on_ll_engine_changed)
+        self.ll_engine_combo.currentTextChanged.connect(change_engine)
+        self.ll_chunk_spin.valueChanged.connect(change_engine)
+
+    def on_ll_engine_changed(self, engine_name):
+        """切换链表存储引擎时更新相关控件"""
+        is_unrolled = engine_name == "分块链表"
+        self.ll_chunk_spin.setEnabled(is_unrolled)
+        self.ll_index_check.setEnabled(not is_unrolled)
+
+    def connect_stack_signals(self, push, pop, clear, toggle_growable, push_many, pop_many, toggle_typed):
         """连接栈操作的信号"""
         self.push_btn.clicked.connect(push)
         self.pop_btn.clicked.connect(pop)
         self.clear_stack_btn.clicked.connect(clear)
+        self.stack_growable_check.toggled.connect(toggle_growable)
+        self.stack_push_many_btn.clicked.connect(push_many)
+        self.stack_pop_many_btn.clicked.connect(pop_many)
+        self.stack_typed_check.toggled.connect(toggle_typed)
+
+    def is_stack_growable(self):
+        """栈是否启用动态扩容"""
+        return self.stack_growable_check.isChecked()
+
+    def get_stack_typecode(self):
+        """获取栈的存储类型码，None 表示使用列表"""
+        return 'q' if self.stack_typed_check.isChecked() else None
+
+    def set_stack_options(self, growable, typecode):
+        """根据加载的数据同步栈的动态扩容和紧凑存储开关（不触发切换）"""
+        for check, enabled in ((self.stack_growable_check, growable),
+                               (self.stack_typed_check, typecode is not None)):
+            check.blockSignals(True)
+            check.setChecked(enabled)
+            check.blockSignals(False)
+
+    def get_stack_batch_values(self):
+        """获取批量入栈的值"""
+        text = self.stack_batch_input.text().strip()
+        if not text:
+            return []
+
+        try:
+            values = [int(x.strip()) for x in text.split(',')]
+            return values
+        except ValueError:
+            return []
+
+    def clear_stack_batch_input(self):
+        """清空批量入栈输入框"""
+        self.stack_batch_input.clear()
 
-    def connect_queue_signals(self, enqueue, dequeue, clear):
+    def get_stack_pop_count(self):
+        """获取批量出栈的个数"""
+        return self.stack_pop_many_spin.value()
+
+    def connect_queue_signals(self, enqueue, dequeue, clear, toggle_typed, toggle_growable,
+                              enqueue_many, dequeue_many):
         """连接队列操作的信号"""
         self.enqueue_btn.clicked.connect(enqueue)
         self.dequeue_btn.clicked.connect(dequeue)
         self.clear_queue_btn.clicked.connect(clear)
+        self.queue_typed_check.toggled.connect(toggle_typed)
+        self.queue_growable_check.toggled.connect(toggle_growable)
+        self.queue_enqueue_many_btn.clicked.connect(enqueue_many)
+        self.queue_dequeue_many_btn.clicked.connect(dequeue_many)
+
+    def is_queue_growable(self):
+        """队列是否启用动态扩容"""
+        return self.queue_growable_check.isChecked()
+
+    def get_queue_batch_values(self):
+        """获取批量入队的值"""
+        text = self.queue_batch_input.text().strip()
+        if not text:
+            return []
+
+        try:
+            values = [int(x.strip()) for x in text.split(',')]
+            return values
+        except ValueError:
+            return []
+
+    def clear_queue_batch_input(self):
+        """清空批量入队输入框"""
+        self.queue_batch_input.clear()
+
+    def get_queue_dequeue_count(self):
+        """获取批量出队的个数"""
+        return self.queue_dequeue_many_spin.value()
+
+    def get_queue_typecode(self):
+        """获取队列的存储类型码，None 表示使用列表"""
+        return 'q' if self.queue_typed_check.isChecked() else None
+
+    def set_queue_options(self, growable, typecode):
+        """根据加载的数据同步队列的动态扩容和紧凑存储开关（不触发切换）"""
+        for check, enabled in ((self.queue_growable_check, growable),
+                               (self.queue_typed_check, typecode is not None)):
+            check.blockSignals(True)
+            check.setChecked(enabled)
+            check.blockSignals(False)
 
     def connect_binary_tree_signals(self, insert_level, clear, batch_insert):
         """连接二叉树操作的信号"""
@@ -354,13 +668,47 @@ class ControlsPanel(QWidget):
         self.bt_clear_btn.clicked.connect(clear)
         self.bt_batch_insert_btn.clicked.connect(batch_insert)
 
-    def connect_avl_signals(self, insert, search, delete, clear, batch_insert):
+    def connect_avl_signals(self, insert, search, delete, clear, batch_insert, toggle_multiset):
         """连接AVL树操作的信号"""
         self.avl_insert_btn.clicked.connect(insert)
         self.avl_search_btn.clicked.connect(search)
         self.avl_delete_btn.clicked.connect(delete)
         self.avl_clear_btn.clicked.connect(clear)
         self.avl_batch_insert_btn.clicked.connect(batch_insert)
+        self.avl_multiset_check.toggled.connect(toggle_multiset)
+
+    def set_avl_multiset(self, enabled):
+        """根据加载的数据同步AVL树的重复键计数开关（不触发重建）"""
+        self.avl_multiset_check.blockSignals(True)
+        self.avl_multiset_check.setChecked(enabled)
+        self.avl_multiset_check.blockSignals(False)
+
+    def connect_rb_signals(self, insert, search, delete, clear, batch_insert):
+        """连接红黑树操作的信号"""
+        self.rb_insert_btn.clicked.connect(insert)
+        self.rb_search_btn.clicked.connect(search)
+        self.rb_delete_btn.clicked.connect(delete)
+        self.rb_clear_btn.clicked.connect(clear)
+        self.rb_batch_insert_btn.clicked.connect(batch_insert)
+
+    def connect_splay_signals(self, insert, search, delete, clear, batch_insert):
+        """连接伸展树操作的信号"""
+        self.splay_insert_btn.clicked.connect(insert)
+        self.splay_search_btn.clicked.connect(search)
+        self.splay_delete_btn.clicked.connect(delete)
+        self.splay_clear_btn.clicked.connect(clear)
+        self.splay_batch_insert_btn.clicked.connect(batch_insert)
+
+    def connect_btree_signals(self, insert, search, delete, clear, batch_load, range_scan, change_variant):
+        """连接B树操作的信号"""
+        self.btree_insert_btn.clicked.connect(insert)
+        self.btree_search_btn.clicked.connect(search)
+        self.btree_delete_btn.clicked.connect(delete)
+        self.btree_clear_btn.clicked.connect(clear)
+        self.btree_batch_load_btn.clicked.connect(batch_load)
+        self.btree_range_btn.clicked.connect(range_scan)
+        self.btree_variant_combo.currentTextChanged.connect(change_variant)
+        self.btree_degree_spin.valueChanged.connect(change_variant)
 
     def get_avl_batch_values(self):
         """获取AVL批量插入的值"""
@@ -378,6 +726,75 @@ class ControlsPanel(QWidget):
         """清空AVL批量输入框"""
         self.avl_batch_input.clear()
 
+    def get_rb_batch_values(self):
+        """获取红黑树批量插入的值"""
+        text = self.rb_batch_input.text().strip()
+        if not text:
+            return []
+
+        try:
+            values = [int(x.strip()) for x in text.split(',')]
+            return values
+        except ValueError:
+            return []
+
+    def clear_rb_batch_input(self):
+        """清空红黑树批量输入框"""
+        self.rb_batch_input.clear()
+
+    def get_splay_batch_values(self):
+        """获取伸展树批量插入的值"""
+        text = self.splay_batch_input.text().strip()
+        if not text:
+            return []
+
+        try:
+            values = [int(x.strip()) for x in text.split(',')]
+            return values
+        except ValueError:
+            return []
+
+    def clear_splay_batch_input(self):
+        """清空伸展树批量输入框"""
+        self.splay_batch_input.clear()
+
+    def get_btree_batch_values(self):
+        """获取B树批量装载的值"""
+        text = self.btree_batch_input.text().strip()
+        if not text:
+            return []
+
+        try:
+            values = [int(x.strip()) for x in text.split(',')]
+            return values
+        except ValueError:
+            return []
+
+    def clear_btree_batch_input(self):
+        """清空B树批量输入框"""
+        self.btree_batch_input.clear()
+
+    def is_btree_plus(self):
+        """是否选择了 B+树"""
+        return self.btree_variant_combo.currentText() == "B+树"
+
+    def get_btree_min_degree(self):
+        """获取B树的最小度数"""
+        return self.btree_degree_spin.value()
+
+    def get_btree_range(self):
+        """获取区间扫描的上下界"""
+        return self.btree_lo_spin.value(), self.btree_hi_spin.value()
+
+    def set_btree_variant(self, plus, min_degree):
+        """根据加载的数据同步B树类型控件（不触发重建）"""
+        self.btree_variant_combo.blockSignals(True)
+        self.btree_degree_spin.blockSignals(True)
+        self.btree_variant_combo.setCurrentText("B+树" if plus else "B树")
+        self.btree_degree_spin.setValue(min_degree)
+        self.btree_variant_combo.blockSignals(False)
+        self.btree_degree_spin.blockSignals(False)
+
     def get_binary_tree_batch_values(self):
         """获取批量插入的值"""
         text = self.bt_batch_input.text().strip()
@@ -394,13 +811,20 @@ class ControlsPanel(QWidget):
         """清空批量输入框"""
         self.bt_batch_input.clear()
 
-    def connect_bst_signals(self, insert, search, delete, clear, batch_insert):
+    def connect_bst_signals(self, insert, search, delete, clear, batch_insert, toggle_multiset):
         """连接二叉搜索树操作的信号"""
         self.bst_insert_btn.clicked.connect(insert)
         self.bst_search_btn.clicked.connect(search)
         self.bst_delete_btn.clicked.connect(delete)
         self.bst_clear_btn.clicked.connect(clear)
         self.bst_batch_insert_btn.clicked.connect(batch_insert)
+        self.bst_multiset_check.toggled.connect(toggle_multiset)
+
+    def set_bst_multiset(self, enabled):
+        """根据加载的数据同步二叉搜索树的重复键计数开关（不触发重建）"""
+        self.bst_multiset_check.blockSignals(True)
+        self.bst_multiset_check.setChecked(enabled)
+        self.bst_multiset_check.blockSignals(False)
 
     def get_bst_batch_values(self):
         """获取BST批量插入的值"""
@@ -454,6 +878,29 @@ class ControlsPanel(QWidget):
         """获取输入的位置"""
         return self.position_spin.value()
 
+    def is_ll_indexed(self):
+        """是否启用链表位置索引"""
+        return self.ll_index_check.isChecked()
+
+    def get_ll_engine(self):
+        """获取链表存储引擎: 'node' 或 'unrolled'"""
+        return "unrolled" if self.ll_engine_combo.currentText() == "分块链表" else "node"
+
+    def get_ll_chunk_capacity(self):
+        """获取分块链表的块容量"""
+        return self.ll_chunk_spin.value()
+
+    def set_ll_engine(self, engine, chunk_capacity=None):
+        """根据加载的数据同步存储引擎控件（不触发重建）"""
+        self.ll_engine_combo.blockSignals(True)
+        self.ll_chunk_spin.blockSignals(True)
+        self.ll_engine_combo.setCurrentText("分块链表" if engine == "unrolled" else "节点链表")
+        if chunk_capacity is not None:
+            self.ll_chunk_spin.setValue(chunk_capacity)
+        self.ll_engine_combo.blockSignals(False)
+        self.ll_chunk_spin.blockSignals(False)
+        self.on_ll_engine_changed(self.ll_engine_combo.currentText())
+
     def get_command(self):
         """获取指令"""
         return self.cmd_input.text().strip()
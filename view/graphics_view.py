@@ -3,6 +3,7 @@ from PyQt5.QtWidgets import QGraphicsView, QGraphicsScene
 from PyQt5.QtCore import Qt, QTimer, QPropertyAnimation, pyqtProperty, QPointF
 from PyQt5.QtGui import QPen, QBrush, QColor, QFont, QPainter, QPolygonF
 from PyQt5.QtCore import QRectF
+from itertools import chain
 
 
 class NodeGraphicsItem:
@@ -126,52 +127,58 @@ class GraphicsView(QGraphicsView):
             elif current_ds == "AVL树":
                 if hasattr(main_window, 'avl_tree'):
                     self.draw_avl_tree(main_window.avl_tree)
+            elif current_ds == "红黑树":
+                if hasattr(main_window, 'rb_tree'):
+                    self.draw_red_black_tree(main_window.rb_tree)
+            elif current_ds == "伸展树":
+                if hasattr(main_window, 'splay_tree'):
+                    self.draw_splay_tree(main_window.splay_tree)
+            elif current_ds == "B树":
+                if hasattr(main_window, 'b_tree'):
+                    page_file = getattr(main_window, 'b_page_file', None)
+                    self.draw_b_tree(page_file if page_file is not None else main_window.b_tree)
 
     # 修改绘制方法，在绘制节点时检查高亮状态
-    def _draw_tree_nodes(self, node, positions):
+    def _draw_tree_nodes(self, root, positions):
         """绘制树的节点，支持高亮"""
-        if node is None:
-            return
-
-        pos = positions.get(node['id'])
-        if pos:
-            x, y = pos
-            node_width = 40
-            node_height = 40
-
-            # 检查是否需要高亮
-            highlight_color = self.highlighted_nodes.get(node['id'])
-            if highlight_color:
-                # 使用高亮颜色
-                node_color = highlight_color
-                border_color = Qt.red
-                border_width = 3
-            else:
-                # 默认颜色
-                node_color = QColor(255, 182, 193)  # 浅粉色
-                border_color = Qt.black
-                border_width = 2
-
-            # 绘制节点圆形
-            ellipse = self.scene.addEllipse(x - node_width / 2, y - node_height / 2, node_width, node_height)
-            ellipse.setBrush(QBrush(node_color))
-            ellipse.setPen(QPen(border_color, border_width))
-
-            # 绘制节点数据
-            text = self.scene.addText(str(node['data']))
-            text.setDefaultTextColor(Qt.black)
-            text.setFont(QFont("Arial", 10, QFont.Bold))
-            text_rect = text.boundingRect()
-            text.setPos(x - text_rect.width() / 2, y - text_rect.height() / 2)
-
-        # 递归绘制子节点
-        if node.get('left') is not None:
-            self._draw_tree_nodes(node['left'], positions)
-        if node.get('right') is not None:
-            self._draw_tree_nodes(node['right'], positions)
+        for node in self._iter_tree_structure(root):
+            pos = positions.get(node['id'])
+            if pos:
+                x, y = pos
+                node_width = 40
+                node_height = 40
+
+                # 检查是否需要高亮
+                highlight_color = self.highlighted_nodes.get(node['id'])
+                if highlight_color:
+                    # 使用高亮颜色
+                    node_color = highlight_color
+                    border_color = Qt.red
+                    border_width = 3
+                else:
+                    # 默认颜色
+                    node_color = QColor(255, 182, 193)  # 浅粉色
+                    border_color = Qt.black
+                    border_width = 2
+
+                # 绘制节点圆形
+                ellipse = self.scene.addEllipse(x - node_width / 2, y - node_height / 2, node_width, node_height)
+                ellipse.setBrush(QBrush(node_color))
+                ellipse.setPen(QPen(border_color, border_width))
+
+                # 绘制节点数据
+                text = self.scene.addText(str(node['data']))
+                text.setDefaultTextColor(Qt.black)
+                text.setFont(QFont("Arial", 10, QFont.Bold))
+                text_rect = text.boundingRect()
+                text.setPos(x - text_rect.width() / 2, y - text_rect.height() / 2)
 
     def draw_linked_list(self, linked_list):
         """绘制链表"""
+        if hasattr(linked_list, 'chunk_capacity'):
+            self.draw_unrolled_linked_list(linked_list)
+            return
+
         self.clear_scene()
         self.node_items = []
 
@@ -230,6 +237,60 @@ class GraphicsView(QGraphicsView):
                 self._draw_arrow(x + node_width, y + node_height / 2,
                                  next_x, y + node_height / 2)
 
+    def draw_unrolled_linked_list(self, linked_list):
+        """绘制分块链表：每个数据块画成一排格子，块之间用箭头连接"""
+        self.clear_scene()
+        self.node_items = []
+
+        cell_width = 40
+        cell_height = 50
+        chunk_spacing = 60
+        start_x = 50
+        start_y = 200
+        capacity = linked_list.chunk_capacity
+
+        x = start_x
+        chunk = linked_list.head
+        while chunk:
+            chunk_width = capacity * cell_width
+
+            # 检查是否需要高亮整个数据块
+            highlight_color = self.highlighted_nodes.get(id(chunk))
+            border_color = Qt.red if highlight_color else Qt.black
+            border_width = 3 if highlight_color else 2
+
+            frame = self.scene.addRect(x, start_y, chunk_width, cell_height)
+            frame.setPen(QPen(border_color, border_width))
+
+            for i in range(capacity):
+                cell = self.scene.addRect(x + i * cell_width, start_y, cell_width, cell_height)
+                if i < len(chunk.items):
+                    cell.setBrush(QBrush(highlight_color or QColor(173, 216, 230)))  # 浅蓝色
+                    cell.setPen(QPen(Qt.black, 1))
+
+                    text = self.scene.addText(str(chunk.items[i]))
+                    text.setDefaultTextColor(Qt.black)
+                    text.setFont(QFont("Arial", 10, QFont.Bold))
+                    text_rect = text.boundingRect()
+                    text.setPos(x + i * cell_width + cell_width / 2 - text_rect.width() / 2,
+                                start_y + cell_height / 2 - text_rect.height() / 2)
+                else:
+                    cell.setBrush(QBrush(QColor(240, 240, 240)))  # 空槽 - 浅灰色
+                    cell.setPen(QPen(Qt.gray, 1))
+
+            # 标注块的填充情况
+            fill_label = self.scene.addText(f"{len(chunk.items)}/{capacity}")
+            fill_label.setDefaultTextColor(Qt.darkGray)
+            fill_label.setFont(QFont("Arial", 9))
+            fill_label.setPos(x, start_y + cell_height + 5)
+
+            if chunk.next is not None:
+                self._draw_arrow(x + chunk_width, start_y + cell_height / 2,
+                                 x + chunk_width + chunk_spacing, start_y + cell_height / 2)
+
+            x += chunk_width + chunk_spacing
+            chunk = chunk.next
+
     def _draw_arrow(self, start_x, start_y, end_x, end_y):
         """绘制箭头"""
         # 绘制直线
@@ -283,6 +344,9 @@ class GraphicsView(QGraphicsView):
         # 检查是否需要高亮栈顶
         highlight_top = 'stack_top' in self.highlighted_nodes
 
+        # 只读视图，类型化存储时不复制数据
+        stack_values = stack.view()
+
         # 绘制栈元素（从底部到顶部）
         for i in range(stack.capacity):
             x = start_x
@@ -303,7 +367,7 @@ class GraphicsView(QGraphicsView):
                     rect.setPen(QPen(Qt.black, 2))
 
                 # 绘制数据
-                text = self.scene.addText(str(stack.data[i]))
+                text = self.scene.addText(str(stack_values[i]))
                 text.setDefaultTextColor(Qt.black)
                 text.setFont(QFont("Arial", 12, QFont.Bold))
                 text_rect = text.boundingRect()
@@ -324,6 +388,25 @@ class GraphicsView(QGraphicsView):
         top_label.setPos(start_x + element_width + 50, start_y - 30)
         top_label.setDefaultTextColor(Qt.blue)
 
+        # 显示容量与最近一次扩缩容事件
+        capacity_label = self.scene.addText(f"容量: {stack.size()}/{stack.capacity}")
+        capacity_label.setDefaultTextColor(Qt.darkGray)
+        capacity_label.setFont(QFont("Arial", 10))
+        capacity_label.setPos(start_x - 140, start_y - 30)
+
+        if stack.last_resize is not None:
+            old_capacity, new_capacity = stack.last_resize
+            action = "扩容" if new_capacity > old_capacity else "缩容"
+            resize_label = self.scene.addText(f"{action}: {old_capacity} → {new_capacity}")
+            resize_label.setDefaultTextColor(Qt.red if new_capacity > old_capacity else Qt.darkYellow)
+            resize_label.setFont(QFont("Arial", 12, QFont.Bold))
+            resize_label.setPos(start_x - 140, start_y)
+
+            # 标出新增（或被回收）的槽位边界
+            boundary_y = start_y + (stack.capacity - min(old_capacity, new_capacity)) * (element_height + spacing) - spacing
+            boundary = self.scene.addLine(start_x - 15, boundary_y, start_x + element_width + 15, boundary_y)
+            boundary.setPen(QPen(Qt.red, 2, Qt.DashLine))
+
     def _draw_stack_pointer(self, x, y):
         """绘制栈顶指针"""
         # 绘制指针线
@@ -348,27 +431,28 @@ class GraphicsView(QGraphicsView):
         element_height = 50
         spacing = 5
 
-        # 获取队列数据
-        queue_data = queue.get_all_data()
+        # 获取队列数据的分段视图（不逐元素重建列表）
+        queue_segments = queue.get_segments()
+        queue_size = queue.size()
 
         # 检查是否需要高亮队头或队尾
         highlight_front = 'queue_front' in self.highlighted_nodes
         highlight_rear = 'queue_rear' in self.highlighted_nodes
 
         # 绘制队列框架
-        frame_width = len(queue_data) * (element_width + spacing) if queue_data else element_width
+        frame_width = queue_size * (element_width + spacing) if queue_size else element_width
         frame = self.scene.addRect(start_x - 10, start_y - 10,
                                    frame_width + 20, element_height + 20)
         frame.setPen(QPen(Qt.black, 2))
 
         # 绘制队列元素
-        for i, data in enumerate(queue_data):
+        for i, data in enumerate(chain.from_iterable(queue_segments)):
             x = start_x + i * (element_width + spacing)
             y = start_y
 
             # 检查是否需要高亮
             is_front = (i == 0) and highlight_front
-            is_rear = (i == len(queue_data) - 1) and highlight_rear
+            is_rear = (i == queue_size - 1) and highlight_rear
             
             if is_front:
                 highlight_color = self.highlighted_nodes.get('queue_front')
@@ -406,10 +490,23 @@ class GraphicsView(QGraphicsView):
             self._draw_queue_pointer(front_x, front_y, "队头")
 
             # 队尾指针
-            rear_x = start_x + len(queue_data) * (element_width + spacing) + 10
+            rear_x = start_x + queue_size * (element_width + spacing) + 10
             rear_y = start_y + element_height / 2
             self._draw_queue_pointer(rear_x, rear_y, "队尾")
 
+        # 显示容量与最近一次扩容事件
+        capacity_label = self.scene.addText(f"容量: {queue_size}/{queue.capacity}")
+        capacity_label.setDefaultTextColor(Qt.darkGray)
+        capacity_label.setFont(QFont("Arial", 10))
+        capacity_label.setPos(start_x, start_y + element_height + 20)
+
+        if queue.last_resize is not None:
+            old_capacity, new_capacity = queue.last_resize
+            resize_label = self.scene.addText(f"扩容: {old_capacity} → {new_capacity}（已摆正环形缓冲区）")
+            resize_label.setDefaultTextColor(Qt.red)
+            resize_label.setFont(QFont("Arial", 12, QFont.Bold))
+            resize_label.setPos(start_x, start_y + element_height + 40)
+
         # 添加标签
         if queue.is_empty():
             empty_label = self.scene.addText("队列为空")
@@ -498,30 +595,26 @@ class GraphicsView(QGraphicsView):
         # 绘制节点
         self._draw_bst_nodes(tree_structure, positions)
 
-    def _calculate_tree_layout(self, node, x, y, base_spacing, total_height, positions):
-        """改进的树形布局算法 - 使用唯一标识符"""
-        if node is None:
-            return
-
-        # 使用节点的唯一标识符作为键
-        positions[node['id']] = (x, y)
-
-        # 计算当前节点的深度
-        current_depth = self._calculate_node_depth(node, total_height)
+    def draw_splay_tree(self, splay_tree):
+        """绘制伸展树：节点样式与二叉搜索树相同，并显示累计旋转次数"""
+        self.clear_scene()
 
-        # 动态调整水平间距：上层节点间距大，下层节点间距小
-        horizontal_spacing = base_spacing * (0.7 ** current_depth)
-        vertical_spacing = 80
+        tree_structure = splay_tree.get_tree_structure()
+        if tree_structure is None:
+            empty_label = self.scene.addText("伸展树为空")
+            empty_label.setDefaultTextColor(Qt.red)
+            empty_label.setFont(QFont("Arial", 14, QFont.Bold))
+            empty_label.setPos(350, 200)
+            return
 
-        if node['left'] is not None:
-            left_x = x - horizontal_spacing
-            left_y = y + vertical_spacing
-            self._calculate_tree_layout(node['left'], left_x, left_y, base_spacing, total_height, positions)
+        positions = self.calculate_tree_layout(tree_structure)
+        self._draw_tree_connections(tree_structure, positions)
+        self._draw_bst_nodes(tree_structure, positions)
 
-        if node['right'] is not None:
-            right_x = x + horizontal_spacing
-            right_y = y + vertical_spacing
-            self._calculate_tree_layout(node['right'], right_x, right_y, base_spacing, total_height, positions)
+        info_text = self.scene.addText(f"最近访问的键位于根部，累计旋转: {splay_tree.rotations} 次")
+        info_text.setDefaultTextColor(Qt.darkGreen)
+        info_text.setFont(QFont("Arial", 9))
+        info_text.setPos(650, 50)
 
     def calculate_tree_layout(self, tree_structure):
         """使用改进的树布局算法计算节点位置"""
@@ -537,23 +630,37 @@ class GraphicsView(QGraphicsView):
 
         return positions
 
-    def _layout_tree(self, node, positions, x=0, y=0, depth=0):
-        """递归计算树布局"""
-        if node is None:
-            return 0
-
-        # 计算左子树和右子树的宽度
-        left_width = self._layout_tree(node.get('left'), positions, x, y + 1, depth + 1)
-        right_width = self._layout_tree(node.get('right'), positions, x + left_width + 1, y + 1, depth + 1)
-
-        # 当前节点的x位置是左子树宽度 + 0.5（居中）
-        node_x = x + left_width
-
-        # 存储节点位置
-        positions[node['id']] = (node_x * 80 + 100, y * 100 + 100)  # 调整间距
-
-        # 返回当前子树的宽度
-        return left_width + right_width + 1
+    def _layout_tree(self, root, positions):
+        """计算树布局：横坐标为节点的中序序号（即排在它左侧的节点数），纵坐标为深度
+
+        用显式栈做中序遍历，树退化成长链时也不受递归深度限制。
+        """
+        stack = []
+        node, depth = root, 0
+        node_x = 0
+        while stack or node is not None:
+            while node is not None:
+                stack.append((node, depth))
+                node, depth = node.get('left'), depth + 1
+            node, depth = stack.pop()
+
+            # 存储节点位置
+            positions[node['id']] = (node_x * 80 + 100, depth * 100 + 100)  # 调整间距
+            node_x += 1
+            node, depth = node.get('right'), depth + 1
+
+    @staticmethod
+    def _iter_tree_structure(root):
+        """按先序依次产出 get_tree_structure 结构中的节点（显式栈）"""
+        stack = [root] if root is not None else []
+        while stack:
+            node = stack.pop()
+            yield node
+            # 右孩子先入栈，保证左子树先绘制
+            if node.get('right') is not None:
+                stack.append(node['right'])
+            if node.get('left') is not None:
+                stack.append(node['left'])
 
     def _center_tree(self, positions):
         """将树居中显示"""
@@ -574,142 +681,88 @@ class GraphicsView(QGraphicsView):
             x, y = positions[node_id]
             positions[node_id] = (x + offset_x, y)
 
-    def _calculate_node_depth(self, node, total_height):
-        """计算节点在树中的深度"""
-        if node is None:
-            return 0
-
-        # 通过递归计算节点到根节点的距离
-        def get_depth(current_node, current_depth):
-            if current_node is None:
-                return current_depth
-
-            left_depth = get_depth(current_node.get('left'), current_depth + 1)
-            right_depth = get_depth(current_node.get('right'), current_depth + 1)
-
-            return max(left_depth, right_depth)
-
-        return get_depth(node, 0)
-
-    def _calculate_tree_height(self, node):
-        """计算树的高度"""
-        if node is None:
-            return 0
-
-        left_height = self._calculate_tree_height(node['left'])
-        right_height = self._calculate_tree_height(node['right'])
-
-        return max(left_height, right_height) + 1
-
-    def _draw_tree_connections(self, node, positions):
+    def _draw_tree_connections(self, root, positions):
         """绘制树的连线"""
-        if node is None:
-            return
-
-        current_pos = positions.get(node['id'])
-
-        if current_pos and node.get('left') is not None:
-            left_pos = positions.get(node['left']['id'])
-            if left_pos:
-                # 绘制从父节点到左子节点的连线
-                line = self.scene.addLine(current_pos[0], current_pos[1], left_pos[0], left_pos[1])
-                line.setPen(QPen(Qt.black, 2))
-
-        if current_pos and node.get('right') is not None:
-            right_pos = positions.get(node['right']['id'])
-            if right_pos:
-                # 绘制从父节点到右子节点的连线
-                line = self.scene.addLine(current_pos[0], current_pos[1], right_pos[0], right_pos[1])
-                line.setPen(QPen(Qt.black, 2))
-
-        # 递归绘制子节点的连线
-        if node.get('left') is not None:
-            self._draw_tree_connections(node['left'], positions)
-
-        if node.get('right') is not None:
-            self._draw_tree_connections(node['right'], positions)
-
-    def _draw_tree_nodes(self, node, positions):
+        for node in self._iter_tree_structure(root):
+            current_pos = positions.get(node['id'])
+
+            if current_pos and node.get('left') is not None:
+                left_pos = positions.get(node['left']['id'])
+                if left_pos:
+                    # 绘制从父节点到左子节点的连线
+                    line = self.scene.addLine(current_pos[0], current_pos[1], left_pos[0], left_pos[1])
+                    line.setPen(QPen(Qt.black, 2))
+
+            if current_pos and node.get('right') is not None:
+                right_pos = positions.get(node['right']['id'])
+                if right_pos:
+                    # 绘制从父节点到右子节点的连线
+                    line = self.scene.addLine(current_pos[0], current_pos[1], right_pos[0], right_pos[1])
+                    line.setPen(QPen(Qt.black, 2))
+
+    def _draw_tree_nodes(self, root, positions):
         """绘制树的节点"""
-        if node is None:
-            return
-
-        pos = positions.get(node['id'])
-        if pos:
-            x, y = pos
-            node_width = 40
-            node_height = 40
-
-            # 检查是否需要高亮
-            highlight_color = self.highlighted_nodes.get(node['id'])
-            if highlight_color:
-                node_color = highlight_color
-                border_color = Qt.red
-                border_width = 3
-            else:
-                node_color = QColor(255, 182, 193)  # 浅粉色
-                border_color = Qt.black
-                border_width = 2
-
-            # 绘制节点圆形
-            ellipse = self.scene.addEllipse(x - node_width / 2, y - node_height / 2, node_width, node_height)
-            ellipse.setBrush(QBrush(node_color))
-            ellipse.setPen(QPen(border_color, border_width))
-
-            # 绘制节点数据
-            text = self.scene.addText(str(node['data']))
-            text.setDefaultTextColor(Qt.black)
-            text.setFont(QFont("Arial", 10, QFont.Bold))
-            text_rect = text.boundingRect()
-            text.setPos(x - text_rect.width() / 2, y - text_rect.height() / 2)
+        for node in self._iter_tree_structure(root):
+            pos = positions.get(node['id'])
+            if pos:
+                x, y = pos
+                node_width = 40
+                node_height = 40
+
+                # 检查是否需要高亮
+                highlight_color = self.highlighted_nodes.get(node['id'])
+                if highlight_color:
+                    node_color = highlight_color
+                    border_color = Qt.red
+                    border_width = 3
+                else:
+                    node_color = QColor(255, 182, 193)  # 浅粉色
+                    border_color = Qt.black
+                    border_width = 2
 
-        # 递归绘制子节点
-        if node.get('left') is not None:
-            self._draw_tree_nodes(node['left'], positions)
+                # 绘制节点圆形
+                ellipse = self.scene.addEllipse(x - node_width / 2, y - node_height / 2, node_width, node_height)
+                ellipse.setBrush(QBrush(node_color))
+                ellipse.setPen(QPen(border_color, border_width))
 
-        if node.get('right') is not None:
-            self._draw_tree_nodes(node['right'], positions)
+                # 绘制节点数据
+                text = self.scene.addText(str(node['data']))
+                text.setDefaultTextColor(Qt.black)
+                text.setFont(QFont("Arial", 10, QFont.Bold))
+                text_rect = text.boundingRect()
+                text.setPos(x - text_rect.width() / 2, y - text_rect.height() / 2)
 
-    def _draw_bst_nodes(self, node, positions):
+    def _draw_bst_nodes(self, root, positions):
         """绘制BST的节点（使用不同颜色）"""
-        if node is None:
-            return
-
-        pos = positions.get(node['id'])
-        if pos:
-            x, y = pos
-            node_width = 40
-            node_height = 40
-
-            # 检查是否需要高亮
-            highlight_color = self.highlighted_nodes.get(node['id'])
-            if highlight_color:
-                node_color = highlight_color
-                border_color = Qt.red
-                border_width = 3
-            else:
-                node_color = QColor(152, 251, 152)  # 浅绿色
-                border_color = Qt.black
-                border_width = 2
-
-            # 绘制节点圆形 - 使用不同颜色区分BST
-            ellipse = self.scene.addEllipse(x - node_width / 2, y - node_height / 2, node_width, node_height)
-            ellipse.setBrush(QBrush(node_color))
-            ellipse.setPen(QPen(border_color, border_width))
-
-            # 绘制节点数据
-            text = self.scene.addText(str(node['data']))
-            text.setDefaultTextColor(Qt.black)
-            text.setFont(QFont("Arial", 10, QFont.Bold))
-            text_rect = text.boundingRect()
-            text.setPos(x - text_rect.width() / 2, y - text_rect.height() / 2)
+        for node in self._iter_tree_structure(root):
+            pos = positions.get(node['id'])
+            if pos:
+                x, y = pos
+                node_width = 40
+                node_height = 40
+
+                # 检查是否需要高亮
+                highlight_color = self.highlighted_nodes.get(node['id'])
+                if highlight_color:
+                    node_color = highlight_color
+                    border_color = Qt.red
+                    border_width = 3
+                else:
+                    node_color = QColor(152, 251, 152)  # 浅绿色
+                    border_color = Qt.black
+                    border_width = 2
 
-        # 递归绘制子节点
-        if node.get('left') is not None:
-            self._draw_bst_nodes(node['left'], positions)
+                # 绘制节点圆形 - 使用不同颜色区分BST
+                ellipse = self.scene.addEllipse(x - node_width / 2, y - node_height / 2, node_width, node_height)
+                ellipse.setBrush(QBrush(node_color))
+                ellipse.setPen(QPen(border_color, border_width))
 
-        if node.get('right') is not None:
-            self._draw_bst_nodes(node['right'], positions)
+                # 绘制节点数据
+                text = self.scene.addText(str(node['data']))
+                text.setDefaultTextColor(Qt.black)
+                text.setFont(QFont("Arial", 10, QFont.Bold))
+                text_rect = text.boundingRect()
+                text.setPos(x - text_rect.width() / 2, y - text_rect.height() / 2)
 
     def draw_huffman_tree(self, huffman_tree):
         """绘制哈夫曼树"""
@@ -735,85 +788,67 @@ class GraphicsView(QGraphicsView):
         # 显示编码表
         self._display_huffman_codes(huffman_tree.get_codes())
 
-    def _draw_huffman_connections(self, node, positions):
+    def _draw_huffman_connections(self, root, positions):
         """绘制哈夫曼树的连线，并标注0/1"""
-        if node is None:
-            return
-
-        current_pos = positions.get(node['id'])
-
-        if current_pos and node.get('left') is not None:
-            left_pos = positions.get(node['left']['id'])
-            if left_pos:
-                # 绘制从父节点到左子节点的连线
-                line = self.scene.addLine(current_pos[0], current_pos[1], left_pos[0], left_pos[1])
-                line.setPen(QPen(Qt.black, 2))
-
-                # 在连线中间标注"0"
-                mid_x = (current_pos[0] + left_pos[0]) / 2
-                mid_y = (current_pos[1] + left_pos[1]) / 2
-                zero_text = self.scene.addText("0")
-                zero_text.setDefaultTextColor(Qt.blue)
-                zero_text.setFont(QFont("Arial", 10, QFont.Bold))
-                zero_text.setPos(mid_x, mid_y)
-
-        if current_pos and node.get('right') is not None:
-            right_pos = positions.get(node['right']['id'])
-            if right_pos:
-                # 绘制从父节点到右子节点的连线
-                line = self.scene.addLine(current_pos[0], current_pos[1], right_pos[0], right_pos[1])
-                line.setPen(QPen(Qt.black, 2))
-
-                # 在连线中间标注"1"
-                mid_x = (current_pos[0] + right_pos[0]) / 2
-                mid_y = (current_pos[1] + right_pos[1]) / 2
-                one_text = self.scene.addText("1")
-                one_text.setDefaultTextColor(Qt.blue)
-                one_text.setFont(QFont("Arial", 10, QFont.Bold))
-                one_text.setPos(mid_x, mid_y)
-
-        # 递归绘制子节点的连线
-        if node.get('left') is not None:
-            self._draw_huffman_connections(node['left'], positions)
-
-        if node.get('right') is not None:
-            self._draw_huffman_connections(node['right'], positions)
-
-    def _draw_huffman_nodes(self, node, positions):
+        for node in self._iter_tree_structure(root):
+            current_pos = positions.get(node['id'])
+
+            if current_pos and node.get('left') is not None:
+                left_pos = positions.get(node['left']['id'])
+                if left_pos:
+                    # 绘制从父节点到左子节点的连线
+                    line = self.scene.addLine(current_pos[0], current_pos[1], left_pos[0], left_pos[1])
+                    line.setPen(QPen(Qt.black, 2))
+
+                    # 在连线中间标注"0"
+                    mid_x = (current_pos[0] + left_pos[0]) / 2
+                    mid_y = (current_pos[1] + left_pos[1]) / 2
+                    zero_text = self.scene.addText("0")
+                    zero_text.setDefaultTextColor(Qt.blue)
+                    zero_text.setFont(QFont("Arial", 10, QFont.Bold))
+                    zero_text.setPos(mid_x, mid_y)
+
+            if current_pos and node.get('right') is not None:
+                right_pos = positions.get(node['right']['id'])
+                if right_pos:
+                    # 绘制从父节点到右子节点的连线
+                    line = self.scene.addLine(current_pos[0], current_pos[1], right_pos[0], right_pos[1])
+                    line.setPen(QPen(Qt.black, 2))
+
+                    # 在连线中间标注"1"
+                    mid_x = (current_pos[0] + right_pos[0]) / 2
+                    mid_y = (current_pos[1] + right_pos[1]) / 2
+                    one_text = self.scene.addText("1")
+                    one_text.setDefaultTextColor(Qt.blue)
+                    one_text.setFont(QFont("Arial", 10, QFont.Bold))
+                    one_text.setPos(mid_x, mid_y)
+
+    def _draw_huffman_nodes(self, root, positions):
         """绘制哈夫曼树的节点"""
-        if node is None:
-            return
-
-        pos = positions.get(node['id'])
-        if pos:
-            x, y = pos
-            node_width = 60
-            node_height = 40
-
-            # 根据节点类型选择颜色
-            if node.get('is_leaf', False):
-                color = QColor(255, 200, 150)  # 叶子节点 - 橙色
-            else:
-                color = QColor(200, 200, 255)  # 内部节点 - 淡蓝色
-
-            # 绘制节点矩形
-            rect = self.scene.addRect(x - node_width / 2, y - node_height / 2, node_width, node_height)
-            rect.setBrush(QBrush(color))
-            rect.setPen(QPen(Qt.black, 2))
-
-            # 绘制节点数据
-            text = self.scene.addText(str(node['data']))
-            text.setDefaultTextColor(Qt.black)
-            text.setFont(QFont("Arial", 9, QFont.Bold))
-            text_rect = text.boundingRect()
-            text.setPos(x - text_rect.width() / 2, y - text_rect.height() / 2)
+        for node in self._iter_tree_structure(root):
+            pos = positions.get(node['id'])
+            if pos:
+                x, y = pos
+                node_width = 60
+                node_height = 40
+
+                # 根据节点类型选择颜色
+                if node.get('is_leaf', False):
+                    color = QColor(255, 200, 150)  # 叶子节点 - 橙色
+                else:
+                    color = QColor(200, 200, 255)  # 内部节点 - 淡蓝色
 
-        # 递归绘制子节点
-        if node.get('left') is not None:
-            self._draw_huffman_nodes(node['left'], positions)
+                # 绘制节点矩形
+                rect = self.scene.addRect(x - node_width / 2, y - node_height / 2, node_width, node_height)
+                rect.setBrush(QBrush(color))
+                rect.setPen(QPen(Qt.black, 2))
 
-        if node.get('right') is not None:
-            self._draw_huffman_nodes(node['right'], positions)
+                # 绘制节点数据
+                text = self.scene.addText(str(node['data']))
+                text.setDefaultTextColor(Qt.black)
+                text.setFont(QFont("Arial", 9, QFont.Bold))
+                text_rect = text.boundingRect()
+                text.setPos(x - text_rect.width() / 2, y - text_rect.height() / 2)
 
     def _display_huffman_codes(self, codes):
         """显示哈夫曼编码表"""
@@ -871,53 +906,44 @@ class GraphicsView(QGraphicsView):
         # 显示AVL树说明
         self._display_avl_info()
 
-    def _draw_avl_nodes(self, node, positions):
+    def _draw_avl_nodes(self, root, positions):
         """绘制AVL树的节点，显示平衡因子"""
-        if node is None:
-            return
-
-        pos = positions.get(node['id'])
-        if pos:
-            x, y = pos
-            node_width = 50
-            node_height = 50
-
-            # 检查是否需要高亮
-            highlight_color = self.highlighted_nodes.get(node['id'])
-            if highlight_color:
-                node_color = highlight_color
-                border_color = Qt.red
-                border_width = 3
-            else:
-                # 根据平衡因子选择颜色
-                balance = node.get('balance', 0)
-                if balance == 0:
-                    node_color = QColor(144, 238, 144)  # 平衡 - 浅绿色
-                elif abs(balance) == 1:
-                    node_color = QColor(255, 255, 150)  # 基本平衡 - 浅黄色
+        for node in self._iter_tree_structure(root):
+            pos = positions.get(node['id'])
+            if pos:
+                x, y = pos
+                node_width = 50
+                node_height = 50
+
+                # 检查是否需要高亮
+                highlight_color = self.highlighted_nodes.get(node['id'])
+                if highlight_color:
+                    node_color = highlight_color
+                    border_color = Qt.red
+                    border_width = 3
                 else:
-                    node_color = QColor(255, 150, 150)  # 不平衡 - 浅红色
-                border_color = Qt.black
-                border_width = 2
-
-            # 绘制节点圆形
-            ellipse = self.scene.addEllipse(x - node_width / 2, y - node_height / 2, node_width, node_height)
-            ellipse.setBrush(QBrush(node_color))
-            ellipse.setPen(QPen(border_color, border_width))
-
-            # 绘制节点数据（值和平衡因子）
-            text = self.scene.addText(str(node['data']))
-            text.setDefaultTextColor(Qt.black)
-            text.setFont(QFont("Arial", 9, QFont.Bold))
-            text_rect = text.boundingRect()
-            text.setPos(x - text_rect.width() / 2, y - text_rect.height() / 2)
-
-        # 递归绘制子节点
-        if node.get('left') is not None:
-            self._draw_avl_nodes(node['left'], positions)
-
-        if node.get('right') is not None:
-            self._draw_avl_nodes(node['right'], positions)
+                    # 根据平衡因子选择颜色
+                    balance = node.get('balance', 0)
+                    if balance == 0:
+                        node_color = QColor(144, 238, 144)  # 平衡 - 浅绿色
+                    elif abs(balance) == 1:
+                        node_color = QColor(255, 255, 150)  # 基本平衡 - 浅黄色
+                    else:
+                        node_color = QColor(255, 150, 150)  # 不平衡 - 浅红色
+                    border_color = Qt.black
+                    border_width = 2
+
+                # 绘制节点圆形
+                ellipse = self.scene.addEllipse(x - node_width / 2, y - node_height / 2, node_width, node_height)
+                ellipse.setBrush(QBrush(node_color))
+                ellipse.setPen(QPen(border_color, border_width))
+
+                # 绘制节点数据（值和平衡因子）
+                text = self.scene.addText(str(node['data']))
+                text.setDefaultTextColor(Qt.black)
+                text.setFont(QFont("Arial", 9, QFont.Bold))
+                text_rect = text.boundingRect()
+                text.setPos(x - text_rect.width() / 2, y - text_rect.height() / 2)
 
     def _display_avl_info(self):
         """显示AVL树说明"""
@@ -944,6 +970,233 @@ class GraphicsView(QGraphicsView):
             "- 右左情况: 先右旋后左旋"
         ]
 
+        for line in info_lines:
+            info_text = self.scene.addText(line)
+            info_text.setDefaultTextColor(Qt.darkGreen)
+            info_text.setFont(QFont("Arial", 9))
+            info_text.setPos(x_pos, y_pos)
+            y_pos += 20
+
+    def draw_red_black_tree(self, rb_tree):
+        """绘制红黑树"""
+        self.clear_scene()
+
+        tree_structure = rb_tree.get_tree_structure()
+        if tree_structure is None:
+            empty_label = self.scene.addText("红黑树为空")
+            empty_label.setDefaultTextColor(Qt.red)
+            empty_label.setFont(QFont("Arial", 14, QFont.Bold))
+            empty_label.setPos(350, 200)
+            return
+
+        positions = self.calculate_tree_layout(tree_structure)
+        self._draw_tree_connections(tree_structure, positions)
+        self._draw_rb_nodes(tree_structure, positions)
+        self._display_rb_info(rb_tree)
+
+    def _draw_rb_nodes(self, root, positions):
+        """绘制红黑树的节点，按节点颜色填充"""
+        for node in self._iter_tree_structure(root):
+            pos = positions.get(node['id'])
+            if pos:
+                x, y = pos
+                node_width = 40
+                node_height = 40
+
+                highlight_color = self.highlighted_nodes.get(node['id'])
+                if highlight_color:
+                    node_color = highlight_color
+                    border_color = Qt.red
+                    border_width = 3
+                    text_color = Qt.black
+                else:
+                    if node.get('color') == 'red':
+                        node_color = QColor(220, 50, 50)
+                    else:
+                        node_color = QColor(40, 40, 40)
+                    border_color = Qt.black
+                    border_width = 2
+                    text_color = Qt.white
+
+                ellipse = self.scene.addEllipse(x - node_width / 2, y - node_height / 2, node_width, node_height)
+                ellipse.setBrush(QBrush(node_color))
+                ellipse.setPen(QPen(border_color, border_width))
+
+                text = self.scene.addText(str(node['data']))
+                text.setDefaultTextColor(text_color)
+                text.setFont(QFont("Arial", 10, QFont.Bold))
+                text_rect = text.boundingRect()
+                text.setPos(x - text_rect.width() / 2, y - text_rect.height() / 2)
+
+    def _display_rb_info(self, rb_tree):
+        """显示红黑树说明和再平衡计数"""
+        x_pos = 650
+        y_pos = 50
+
+        title = self.scene.addText("红黑树说明:")
+        title.setDefaultTextColor(Qt.darkBlue)
+        title.setFont(QFont("Arial", 12, QFont.Bold))
+        title.setPos(x_pos, y_pos)
+
+        y_pos += 30
+
+        info_lines = [
+            "1. 节点为红色或黑色，根为黑色",
+            "2. 红色节点的子节点都是黑色",
+            "3. 任一节点到其叶子的路径黑色节点数相同",
+            "",
+            f"累计旋转: {rb_tree.rotations} 次",
+            f"累计改色: {rb_tree.recolors} 次"
+        ]
+
+        for line in info_lines:
+            info_text = self.scene.addText(line)
+            info_text.setDefaultTextColor(Qt.darkGreen)
+            info_text.setFont(QFont("Arial", 9))
+            info_text.setPos(x_pos, y_pos)
+            y_pos += 20
+
+    def draw_b_tree(self, b_tree):
+        """绘制B树/B+树：每个节点画成一排键格子，B+树的相邻叶子之间画出链表指针"""
+        self.clear_scene()
+
+        tree_structure = b_tree.get_tree_structure()
+        if tree_structure is None:
+            empty_label = self.scene.addText("B树为空")
+            empty_label.setDefaultTextColor(Qt.red)
+            empty_label.setFont(QFont("Arial", 14, QFont.Bold))
+            empty_label.setPos(350, 200)
+            return
+
+        positions = {}
+        widths = {}
+        self._layout_b_tree(tree_structure, positions, widths, [0], 0)
+        self._center_tree(positions)
+
+        self._draw_b_tree_edges(tree_structure, positions, widths)
+        self._draw_b_tree_nodes(tree_structure, positions, widths)
+        self._display_b_tree_info(b_tree)
+
+    @staticmethod
+    def _visible_b_keys(keys, max_cells=7):
+        """节点中要画出的键；键太多时只画首尾各三个，中间用省略号"""
+        if len(keys) <= max_cells:
+            return [str(key) for key in keys]
+        return [str(key) for key in keys[:3]] + ["…"] + [str(key) for key in keys[-3:]]
+
+    def _layout_b_tree(self, node, positions, widths, cursor, depth):
+        """叶子从左到右依次排开，内部节点居中于首尾孩子之上；cursor[0] 为下一片叶子的起始横坐标"""
+        cell_width = 36
+        gap = 20
+        width = max(len(self._visible_b_keys(node['keys'])), 1) * cell_width
+        widths[node['id']] = width
+
+        if node['children']:
+            for child in node['children']:
+                self._layout_b_tree(child, positions, widths, cursor, depth + 1)
+            first_x = positions[node['children'][0]['id']][0]
+            last_x = positions[node['children'][-1]['id']][0]
+            x = (first_x + last_x) / 2
+            cursor[0] = max(cursor[0], x + width / 2 + gap)
+        else:
+            x = cursor[0] + width / 2
+            cursor[0] += width + gap
+
+        positions[node['id']] = (x, depth * 90 + 100)
+
+    def _draw_b_tree_edges(self, node, positions, widths):
+        """从分隔键之间的缝隙连线到对应孩子，B+树叶子之间画链表箭头"""
+        cell_height = 30
+        x, y = positions[node['id']]
+        width = widths[node['id']]
+        left = x - width / 2
+
+        key_count = max(len(node['keys']), 1)
+        for i, child in enumerate(node['children']):
+            child_x, child_y = positions[child['id']]
+            line = self.scene.addLine(left + width * i / key_count, y + cell_height / 2,
+                                      child_x, child_y - cell_height / 2)
+            line.setPen(QPen(Qt.black, 1.5))
+            self._draw_b_tree_edges(child, positions, widths)
+
+        next_pos = positions.get(node.get('next'))
+        if next_pos is not None:
+            self._draw_arrow(x + width / 2, y, next_pos[0] - widths[node['next']] / 2, next_pos[1])
+
+    def _draw_b_tree_nodes(self, node, positions, widths):
+        """绘制B树节点（内部节点浅蓝色，叶子浅绿色）"""
+        cell_width = 36
+        cell_height = 30
+        x, y = positions[node['id']]
+        left = x - widths[node['id']] / 2
+
+        highlight_color = self.highlighted_nodes.get(node['id'])
+        if highlight_color:
+            node_color = highlight_color
+            border_color = Qt.red
+            border_width = 3
+        else:
+            node_color = QColor(152, 251, 152) if node['leaf'] else QColor(173, 216, 230)
+            border_color = Qt.black
+            border_width = 2
+
+        visible_keys = self._visible_b_keys(node['keys'])
+        frame = self.scene.addRect(left, y - cell_height / 2, widths[node['id']], cell_height)
+        frame.setBrush(QBrush(node_color))
+        frame.setPen(QPen(border_color, border_width))
+
+        for i, label in enumerate(visible_keys):
+            if i > 0:
+                divider = self.scene.addLine(left + i * cell_width, y - cell_height / 2,
+                                             left + i * cell_width, y + cell_height / 2)
+                divider.setPen(QPen(Qt.gray, 1))
+            text = self.scene.addText(label)
+            text.setDefaultTextColor(Qt.black)
+            text.setFont(QFont("Arial", 9, QFont.Bold))
+            text_rect = text.boundingRect()
+            text.setPos(left + i * cell_width + cell_width / 2 - text_rect.width() / 2,
+                        y - text_rect.height() / 2)
+
+        # 页文件只读取前几层，更深的孩子只标出数量
+        if node.get('hidden'):
+            hidden_label = self.scene.addText(f"{node['hidden']} 个子页未展开")
+            hidden_label.setDefaultTextColor(Qt.darkGray)
+            hidden_label.setFont(QFont("Arial", 8))
+            hidden_label.setPos(left, y + cell_height / 2 + 2)
+
+        for child in node['children']:
+            self._draw_b_tree_nodes(child, positions, widths)
+
+    def _display_b_tree_info(self, b_tree):
+        """显示B树类型、度数和规模"""
+        x_pos = 650
+        y_pos = 50
+
+        page_size = getattr(b_tree, 'page_size', None)
+        if page_size is not None:
+            title_text = "B+树页文件:"
+        elif hasattr(b_tree, 'iter_leaves'):
+            title_text = "B+树:"
+        else:
+            title_text = "B树:"
+
+        title = self.scene.addText(title_text)
+        title.setDefaultTextColor(Qt.darkBlue)
+        title.setFont(QFont("Arial", 12, QFont.Bold))
+        title.setPos(x_pos, y_pos)
+
+        y_pos += 30
+
+        t = b_tree.min_degree
+        info_lines = [
+            f"最小度数 t = {t}",
+            f"每个节点 {t - 1} ~ {2 * t - 1} 个键",
+            f"键数: {b_tree.size()}",
+            f"高度: {b_tree.get_height()}"
+        ]
+        if page_size is not None:
+            info_lines.append(f"页大小: {page_size} 字节")
+
         for line in info_lines:
             info_text = self.scene.addText(line)
             info_text.setDefaultTextColor(Qt.darkGreen)
@@ -1,15 +1,23 @@
+import os
 from PyQt5.QtGui import QColor
 from PyQt5.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QStatusBar, QLineEdit
 from PyQt5.QtCore import Qt, QTimer
 from .graphics_view import GraphicsView
 from .controls import ControlsPanel
 from model.linked_list import LinkedList
+from model.unrolled_linked_list import UnrolledLinkedList
 from model.stack import Stack
 from model.queue import Queue
 from model.binary_tree import BinaryTree
 from model.binary_search_tree import BinarySearchTree
 from model.huffman_tree import HuffmanTree
+from model.huffman_file import HuffmanFile
 from model.avl_tree import AVLTree
+from model.red_black_tree import RedBlackTree
+from model.splay_tree import SplayTree
+from model.b_tree import BTree
+from model.b_plus_tree import BPlusTree
+from model.b_plus_page_file import BPlusPageFile
 from PyQt5.QtWidgets import QMenu, QAction, QMessageBox
 from utils.serializer import DataStructureSerializer
 from view.file_dialog import FileDialog
@@ -35,6 +43,10 @@ class MainWindow(QMainWindow):
         self.bst = BinarySearchTree()
         self.huffman_tree = HuffmanTree()
         self.avl_tree = AVLTree()  # 创建AVL树实例
+        self.rb_tree = RedBlackTree()  # 创建红黑树实例
+        self.splay_tree = SplayTree()  # 创建伸展树实例
+        self.b_tree = BTree()  # 创建B树实例（可切换为B+树）
+        self.b_page_file = None  # 当前打开的只读B+树页文件
         self.current_ds = "链表"
         self.init_ui()
         self.connect_signals()
@@ -107,6 +119,12 @@ class MainWindow(QMainWindow):
                 data = serializer.serialize_huffman(self.huffman_tree)
             elif self.current_ds == "AVL树":
                 data = serializer.serialize_avl(self.avl_tree)
+            elif self.current_ds == "红黑树":
+                data = serializer.serialize_red_black_tree(self.rb_tree)
+            elif self.current_ds == "伸展树":
+                data = serializer.serialize_splay_tree(self.splay_tree)
+            elif self.current_ds == "B树":
+                data = serializer.serialize_b_tree(self.b_tree)
             else:
                 QMessageBox.warning(self, "保存失败", f"不支持保存 {self.current_ds} 类型")
                 return
@@ -142,26 +160,51 @@ class MainWindow(QMainWindow):
                     serializer = DataStructureSerializer()
 
                     if data_type == "LinkedList":
-                        self.linked_list = serializer.deserialize_linked_list(loaded_data["data"])
+                        self.linked_list = serializer.deserialize_linked_list(
+                            loaded_data["data"],
+                            engine=loaded_data.get("engine", "node"),
+                            chunk_capacity=loaded_data.get("chunk_capacity")
+                        )
+                        if isinstance(self.linked_list, UnrolledLinkedList):
+                            self.controls_panel.set_ll_engine("unrolled", self.linked_list.chunk_capacity)
+                        else:
+                            self.controls_panel.set_ll_engine("node")
+                            self.linked_list.set_indexed(self.controls_panel.is_ll_indexed())
                         self.current_ds = "链表"
                     elif data_type == "Stack":
                         self.stack = serializer.deserialize_stack(loaded_data)
+                        self.controls_panel.set_stack_options(self.stack.growable, self.stack.typecode)
                         self.current_ds = "栈"
                     elif data_type == "Queue":
                         self.queue = serializer.deserialize_queue(loaded_data)
+                        self.controls_panel.set_queue_options(self.queue.growable, self.queue.typecode)
                         self.current_ds = "队列"
                     elif data_type == "BinaryTree":
                         self.binary_tree = serializer.deserialize_binary_tree(loaded_data)
                         self.current_ds = "二叉树"
                     elif data_type == "BinarySearchTree":
                         self.bst = serializer.deserialize_bst(loaded_data)
+                        self.controls_panel.set_bst_multiset(self.bst.multiset)
                         self.current_ds = "二叉搜索树"
                     elif data_type == "HuffmanTree":
                         self.huffman_tree = serializer.deserialize_huffman(loaded_data)
                         self.current_ds = "哈夫曼树"
                     elif data_type == "AVLTree":
                         self.avl_tree = serializer.deserialize_avl(loaded_data)
+                        self.controls_panel.set_avl_multiset(self.avl_tree.multiset)
                         self.current_ds = "AVL树"
+                    elif data_type == "RedBlackTree":
+                        self.rb_tree = serializer.deserialize_red_black_tree(loaded_data)
+                        self.current_ds = "红黑树"
+                    elif data_type == "SplayTree":
+                        self.splay_tree = serializer.deserialize_splay_tree(loaded_data)
+                        self.current_ds = "伸展树"
+                    elif data_type == "BTree":
+                        self.close_btree_pages()
+                        self.b_tree = serializer.deserialize_b_tree(loaded_data)
+                        self.controls_panel.set_btree_variant(isinstance(self.b_tree, BPlusTree),
+                                                              self.b_tree.min_degree)
+                        self.current_ds = "B树"
                     else:
                         QMessageBox.warning(self, "加载失败", f"未知的数据结构类型: {data_type}")
                         return
@@ -193,6 +236,9 @@ class MainWindow(QMainWindow):
             <li>二叉搜索树（BST）</li>
             <li>哈夫曼树</li>
             <li>AVL树（平衡二叉搜索树）</li>
+            <li>红黑树</li>
+            <li>伸展树</li>
+            <li>B树 / B+树（可导出为页式文件）</li>
         </ul>
         <p><b>功能特性:</b></p>
         <ul>
@@ -229,6 +275,9 @@ class MainWindow(QMainWindow):
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
         self.status_bar.showMessage("就绪")
+        # 状态栏右侧常驻显示当前树的统计量（由模型增量维护，O(1) 读取）
+        self.stats_label = QLabel()
+        self.status_bar.addPermanentWidget(self.stats_label)
 
         # 初始绘制
         self.update_display()
@@ -247,21 +296,31 @@ class MainWindow(QMainWindow):
             self.insert_end,
             self.insert_at_position,
             self.delete_at_position,
-            self.clear_list
+            self.clear_list,
+            self.toggle_list_index,
+            self.change_list_engine
         )
 
         # 连接栈操作
         self.controls_panel.connect_stack_signals(
             self.push,
             self.pop,
-            self.clear_stack
+            self.clear_stack,
+            self.toggle_stack_growable,
+            self.push_many,
+            self.pop_many,
+            self.toggle_stack_typed
         )
 
         # 连接队列操作
         self.controls_panel.connect_queue_signals(
             self.enqueue,
             self.dequeue,
-            self.clear_queue
+            self.clear_queue,
+            self.toggle_queue_typed,
+            self.toggle_queue_growable,
+            self.enqueue_many,
+            self.dequeue_many
         )
 
         # 连接二叉树操作
@@ -277,7 +336,8 @@ class MainWindow(QMainWindow):
             self.bst_search,
             self.bst_delete,
             self.clear_bst,
-            self.bst_batch_insert
+            self.bst_batch_insert,
+            self.toggle_bst_multiset
         )
 
         # 连接哈夫曼树操作
@@ -295,7 +355,37 @@ class MainWindow(QMainWindow):
             self.avl_search,
             self.avl_delete,
             self.clear_avl,
-            self.avl_batch_insert
+            self.avl_batch_insert,
+            self.toggle_avl_multiset
+        )
+
+        # 连接红黑树操作
+        self.controls_panel.connect_rb_signals(
+            self.rb_insert,
+            self.rb_search,
+            self.rb_delete,
+            self.clear_rb,
+            self.rb_batch_insert
+        )
+
+        # 连接伸展树操作
+        self.controls_panel.connect_splay_signals(
+            self.splay_insert,
+            self.splay_search,
+            self.splay_delete,
+            self.clear_splay,
+            self.splay_batch_insert
+        )
+
+        # 连接B树操作
+        self.controls_panel.connect_btree_signals(
+            self.btree_insert,
+            self.btree_search,
+            self.btree_delete,
+            self.clear_btree,
+            self.btree_batch_load,
+            self.btree_range_scan,
+            self.change_btree_variant
         )
 
         # 连接数据结构选择
@@ -386,6 +476,28 @@ class MainWindow(QMainWindow):
             self.linked_list.clear()
             self.update_display("链表已清空")
 
+    def toggle_list_index(self, enabled):
+        """切换链表的跳表位置索引"""
+        if not isinstance(self.linked_list, LinkedList):
+            return
+        self.linked_list.set_indexed(enabled)
+        if enabled:
+            self.status_bar.showMessage("已启用跳表位置索引：按位置插入/删除为 O(log n)")
+        else:
+            self.status_bar.showMessage("已关闭位置索引：按位置插入/删除为线性遍历")
+
+    def change_list_engine(self, *args):
+        """切换链表存储引擎，保留现有元素"""
+        values = self.linked_list.to_list()
+        if self.controls_panel.get_ll_engine() == "unrolled":
+            self.linked_list = UnrolledLinkedList(self.controls_panel.get_ll_chunk_capacity())
+            message = f"链表引擎: 分块链表（块容量 {self.linked_list.chunk_capacity}）"
+        else:
+            self.linked_list = LinkedList(indexed=self.controls_panel.is_ll_indexed())
+            message = "链表引擎: 节点链表"
+        self.linked_list.extend(values)
+        self.update_display(message)
+
     # 栈操作方法
     def push(self):
         """入栈操作"""
@@ -427,9 +539,55 @@ class MainWindow(QMainWindow):
             )
             self.status_bar.showMessage(f"已添加清空操作，请使用'下一步'按钮单步执行")
         else:
-            self.stack = Stack()
+            self.stack = self.create_stack()
             self.update_display("栈已清空")
 
+    def create_stack(self):
+        """按当前界面设置创建新栈"""
+        growable = self.controls_panel.is_stack_growable()
+        return Stack(growable=growable, shrinkable=growable,
+                     typecode=self.controls_panel.get_stack_typecode())
+
+    def toggle_stack_typed(self, enabled):
+        """切换栈的紧凑整数存储"""
+        try:
+            self.stack.convert_storage('q' if enabled else None)
+            self.update_display("栈使用紧凑整数存储" if enabled else "栈使用列表存储")
+        except (TypeError, OverflowError) as e:
+            self.status_bar.showMessage(f"错误: 栈中存在非整数元素，无法切换: {str(e)}")
+
+    def toggle_stack_growable(self, enabled):
+        """切换栈的动态扩容模式"""
+        self.stack.growable = enabled
+        self.stack.shrinkable = enabled
+        if enabled:
+            self.status_bar.showMessage("栈已启用动态扩容：满时容量倍增，元素不足四分之一时减半")
+        else:
+            self.status_bar.showMessage("栈已关闭动态扩容：容量固定")
+
+    def push_many(self):
+        """批量入栈"""
+        values = self.controls_panel.get_stack_batch_values()
+        if not values:
+            self.status_bar.showMessage("错误: 请输入有效的数值")
+            return
+
+        try:
+            self.stack.push_many(values)
+            self.update_display(f"批量入栈: {', '.join(map(str, values))}")
+            self.controls_panel.clear_stack_batch_input()
+        except Exception as e:
+            self.status_bar.showMessage(f"错误: {str(e)}")
+
+    def pop_many(self):
+        """批量出栈"""
+        count = self.controls_panel.get_stack_pop_count()
+        try:
+            values = self.stack.pop_many(count)
+            self.update_display(f"批量出栈: {', '.join(map(str, values))}")
+        except Exception as e:
+            self.status_bar.showMessage(f"错误: {str(e)}")
+
     # 队列操作方法
     def enqueue(self):
         """入队操作"""
@@ -471,9 +629,53 @@ class MainWindow(QMainWindow):
             )
             self.status_bar.showMessage(f"已添加清空操作，请使用'下一步'按钮单步执行")
         else:
-            self.queue = Queue()
+            self.queue = self.create_queue()
             self.update_display("队列已清空")
 
+    def create_queue(self):
+        """按当前界面设置创建新队列"""
+        return Queue(typecode=self.controls_panel.get_queue_typecode(),
+                     growable=self.controls_panel.is_queue_growable())
+
+    def toggle_queue_growable(self, enabled):
+        """切换队列的动态扩容模式"""
+        self.queue.growable = enabled
+        if enabled:
+            self.status_bar.showMessage("队列已启用动态扩容：满时容量倍增")
+        else:
+            self.status_bar.showMessage("队列已关闭动态扩容：容量固定")
+
+    def enqueue_many(self):
+        """批量入队"""
+        values = self.controls_panel.get_queue_batch_values()
+        if not values:
+            self.status_bar.showMessage("错误: 请输入有效的数值")
+            return
+
+        try:
+            self.queue.enqueue_many(values)
+            self.update_display(f"批量入队: {', '.join(map(str, values))}")
+            self.controls_panel.clear_queue_batch_input()
+        except Exception as e:
+            self.status_bar.showMessage(f"错误: {str(e)}")
+
+    def dequeue_many(self):
+        """批量出队"""
+        count = self.controls_panel.get_queue_dequeue_count()
+        try:
+            values = self.queue.dequeue_many(count)
+            self.update_display(f"批量出队: {', '.join(map(str, values))}")
+        except Exception as e:
+            self.status_bar.showMessage(f"错误: {str(e)}")
+
+    def toggle_queue_typed(self, enabled):
+        """切换队列的紧凑整数存储"""
+        try:
+            self.queue.convert_storage('q' if enabled else None)
+            self.update_display("队列使用紧凑整数存储" if enabled else "队列使用列表存储")
+        except (TypeError, OverflowError) as e:
+            self.status_bar.showMessage(f"错误: 队列中存在非整数元素，无法切换: {str(e)}")
+
     # 二叉树操作方法
 
     def binary_tree_insert_level(self):
@@ -578,8 +780,8 @@ class MainWindow(QMainWindow):
             self.status_bar.showMessage("错误: 请输入有效的数值")
             return
 
-        for value in values:
-            self.bst.insert(value)
+        # 一次排序后按中位数构建平衡树，避免逐个插入的旋转开销和有序输入导致的退化
+        self.bst.bulk_load(values)
 
         self.update_display(f"BST批量插入: {', '.join(map(str, values))}")
         self.controls_panel.clear_bst_batch_input()
@@ -593,9 +795,19 @@ class MainWindow(QMainWindow):
             )
             self.status_bar.showMessage(f"已添加清空操作，请使用'下一步'按钮单步执行")
         else:
-            self.bst = BinarySearchTree()
+            self.bst = BinarySearchTree(multiset=self.bst.multiset)
             self.update_display("二叉搜索树已清空")
 
+    def toggle_bst_multiset(self, enabled):
+        """切换二叉搜索树的重复键计数模式，保留全部键（含重复）并重新装载"""
+        values = list(self.bst.iter_range(self.bst.min(), self.bst.max())) if self.bst.root else []
+        self.bst = BinarySearchTree(multiset=enabled)
+        self.bst.bulk_load(values)
+        if enabled:
+            self.update_display("已启用重复键计数：重复插入只增加节点计数，不再新建节点")
+        else:
+            self.update_display("已关闭重复键计数：重复值作为新节点插入右子树")
+
     # 哈夫曼树操作方法
     def huffman_build_from_text(self):
         """从文本构建哈夫曼树"""
@@ -632,7 +844,9 @@ class MainWindow(QMainWindow):
 
         try:
             encoded = self.huffman_tree.encode(text)
-            self.update_display(f"编码结果: {encoded}")
+            packed, _ = self.huffman_tree.encode_bytes(text)
+            self.update_display(f"编码结果: {encoded}（{len(encoded)} 位，按位打包为 {len(packed)} 字节，"
+                                f"原文 UTF-8 {len(text.encode('utf-8'))} 字节）")
         except Exception as e:
             self.status_bar.showMessage(f"错误: {str(e)}")
 
@@ -716,8 +930,8 @@ class MainWindow(QMainWindow):
             self.status_bar.showMessage("错误: 请输入有效的数值")
             return
 
-        for value in values:
-            self.avl_tree.insert(value)
+        # 一次排序后按中位数构建平衡树，避免逐个插入的旋转开销和有序输入导致的退化
+        self.avl_tree.bulk_load(values)
 
         self.update_display(f"AVL批量插入: {', '.join(map(str, values))}")
         self.controls_panel.clear_avl_batch_input()
@@ -731,9 +945,314 @@ class MainWindow(QMainWindow):
             )
             self.status_bar.showMessage(f"已添加清空操作，请使用'下一步'按钮单步执行")
         else:
-            self.avl_tree = AVLTree()
+            self.avl_tree = AVLTree(multiset=self.avl_tree.multiset)
             self.update_display("AVL树已清空")
 
+    def toggle_avl_multiset(self, enabled):
+        """切换AVL树的重复键计数模式，保留全部键（含重复）并重新装载"""
+        values = list(self.avl_tree.iter_range(self.avl_tree.min(), self.avl_tree.max())) if self.avl_tree.root else []
+        self.avl_tree = AVLTree(multiset=enabled)
+        self.avl_tree.bulk_load(values)
+        if enabled:
+            self.update_display("已启用重复键计数：树高只取决于不同键的个数")
+        else:
+            self.update_display("已关闭重复键计数：重复值作为新节点插入右子树")
+
+    # 红黑树操作方法
+    def rb_insert(self):
+        """红黑树插入"""
+        value = self.controls_panel.rb_value_spin.value()
+        try:
+            if hasattr(self, 'unified_animation_controller'):
+                self.unified_animation_controller.add_operation(
+                    'rb_insert',
+                    {'value': value}
+                )
+                self.status_bar.showMessage(f"已添加插入操作，请使用'下一步'按钮单步执行")
+            else:
+                self.rb_tree.insert(value)
+                self.update_display(f"红黑树插入: {value}")
+        except Exception as e:
+            self.status_bar.showMessage(f"错误: {str(e)}")
+
+    def rb_search(self):
+        """红黑树查找"""
+        value = self.controls_panel.rb_value_spin.value()
+        if hasattr(self, 'unified_animation_controller'):
+            self.unified_animation_controller.add_operation(
+                'rb_search',
+                {'value': value}
+            )
+            self.status_bar.showMessage(f"已添加查找操作，请使用'下一步'按钮单步执行")
+        else:
+            node = self.rb_tree.search(value)
+            if node:
+                self.update_display(f"红黑树查找: 找到 {value}")
+            else:
+                self.update_display(f"红黑树查找: 未找到 {value}")
+
+    def rb_delete(self):
+        """红黑树删除"""
+        value = self.controls_panel.rb_value_spin.value()
+        try:
+            if hasattr(self, 'unified_animation_controller'):
+                self.unified_animation_controller.add_operation(
+                    'rb_delete',
+                    {'value': value}
+                )
+                self.status_bar.showMessage(f"已添加删除操作，请使用'下一步'按钮单步执行")
+            else:
+                self.rb_tree.delete(value)
+                self.update_display(f"红黑树删除: {value}")
+        except Exception as e:
+            self.status_bar.showMessage(f"错误: {str(e)}")
+
+    def rb_batch_insert(self):
+        """红黑树批量插入"""
+        values = self.controls_panel.get_rb_batch_values()
+        if not values:
+            self.status_bar.showMessage("错误: 请输入有效的数值")
+            return
+
+        for value in values:
+            self.rb_tree.insert(value)
+
+        self.update_display(f"红黑树批量插入: {', '.join(map(str, values))}")
+        self.controls_panel.clear_rb_batch_input()
+
+    def clear_rb(self):
+        """清空红黑树"""
+        if hasattr(self, 'unified_animation_controller'):
+            self.unified_animation_controller.add_operation(
+                'rb_clear',
+                {}
+            )
+            self.status_bar.showMessage(f"已添加清空操作，请使用'下一步'按钮单步执行")
+        else:
+            self.rb_tree = RedBlackTree()
+            self.update_display("红黑树已清空")
+
+    # 伸展树操作方法
+    def splay_insert(self):
+        """伸展树插入"""
+        value = self.controls_panel.splay_value_spin.value()
+        try:
+            if hasattr(self, 'unified_animation_controller'):
+                self.unified_animation_controller.add_operation(
+                    'splay_insert',
+                    {'value': value}
+                )
+                self.status_bar.showMessage(f"已添加插入操作，请使用'下一步'按钮单步执行")
+            else:
+                self.splay_tree.insert(value)
+                self.update_display(f"伸展树插入: {value}")
+        except Exception as e:
+            self.status_bar.showMessage(f"错误: {str(e)}")
+
+    def splay_search(self):
+        """伸展树查找（查找会把目标伸展到根）"""
+        value = self.controls_panel.splay_value_spin.value()
+        if hasattr(self, 'unified_animation_controller'):
+            self.unified_animation_controller.add_operation(
+                'splay_search',
+                {'value': value}
+            )
+            self.status_bar.showMessage(f"已添加查找操作，请使用'下一步'按钮单步执行")
+        else:
+            node = self.splay_tree.search(value)
+            if node:
+                self.update_display(f"伸展树查找: 找到 {value}，已伸展到根")
+            else:
+                self.update_display(f"伸展树查找: 未找到 {value}")
+
+    def splay_delete(self):
+        """伸展树删除"""
+        value = self.controls_panel.splay_value_spin.value()
+        try:
+            if hasattr(self, 'unified_animation_controller'):
+                self.unified_animation_controller.add_operation(
+                    'splay_delete',
+                    {'value': value}
+                )
+                self.status_bar.showMessage(f"已添加删除操作，请使用'下一步'按钮单步执行")
+            else:
+                self.splay_tree.delete(value)
+                self.update_display(f"伸展树删除: {value}")
+        except Exception as e:
+            self.status_bar.showMessage(f"错误: {str(e)}")
+
+    def splay_batch_insert(self):
+        """伸展树批量插入"""
+        values = self.controls_panel.get_splay_batch_values()
+        if not values:
+            self.status_bar.showMessage("错误: 请输入有效的数值")
+            return
+
+        for value in values:
+            self.splay_tree.insert(value)
+
+        self.update_display(f"伸展树批量插入: {', '.join(map(str, values))}")
+        self.controls_panel.clear_splay_batch_input()
+
+    def clear_splay(self):
+        """清空伸展树"""
+        if hasattr(self, 'unified_animation_controller'):
+            self.unified_animation_controller.add_operation(
+                'splay_clear',
+                {}
+            )
+            self.status_bar.showMessage(f"已添加清空操作，请使用'下一步'按钮单步执行")
+        else:
+            self.splay_tree = SplayTree()
+            self.update_display("伸展树已清空")
+
+    # B树操作方法
+    def btree_insert(self):
+        """B树插入"""
+        self.close_btree_pages()
+        value = self.controls_panel.btree_value_spin.value()
+        try:
+            if hasattr(self, 'unified_animation_controller'):
+                self.unified_animation_controller.add_operation(
+                    'btree_insert',
+                    {'value': value}
+                )
+                self.status_bar.showMessage(f"已添加插入操作，请使用'下一步'按钮单步执行")
+            else:
+                self.b_tree.insert(value)
+                self.update_display(f"B树插入: {value}")
+        except Exception as e:
+            self.status_bar.showMessage(f"错误: {str(e)}")
+
+    def btree_search(self):
+        """B树查找"""
+        self.close_btree_pages()
+        value = self.controls_panel.btree_value_spin.value()
+        if hasattr(self, 'unified_animation_controller'):
+            self.unified_animation_controller.add_operation(
+                'btree_search',
+                {'value': value}
+            )
+            self.status_bar.showMessage(f"已添加查找操作，请使用'下一步'按钮单步执行")
+        else:
+            node = self.b_tree.search(value)
+            if node:
+                self.update_display(f"B树查找: 找到 {value}")
+            else:
+                self.update_display(f"B树查找: 未找到 {value}")
+
+    def btree_delete(self):
+        """B树删除"""
+        self.close_btree_pages()
+        value = self.controls_panel.btree_value_spin.value()
+        try:
+            if hasattr(self, 'unified_animation_controller'):
+                self.unified_animation_controller.add_operation(
+                    'btree_delete',
+                    {'value': value}
+                )
+                self.status_bar.showMessage(f"已添加删除操作，请使用'下一步'按钮单步执行")
+            else:
+                self.b_tree.delete(value)
+                self.update_display(f"B树删除: {value}")
+        except Exception as e:
+            self.status_bar.showMessage(f"错误: {str(e)}")
+
+    def btree_batch_load(self):
+        """B树批量装载（自底向上构建，节点尽量装满）"""
+        self.close_btree_pages()
+        values = self.controls_panel.get_btree_batch_values()
+        if not values:
+            self.status_bar.showMessage("错误: 请输入有效的数值")
+            return
+
+        self.b_tree.bulk_load(values)
+        self.update_display(f"B树批量装载: {', '.join(map(str, values))}")
+        self.controls_panel.clear_btree_batch_input()
+
+    def btree_range_scan(self):
+        """B树区间扫描"""
+        self.close_btree_pages()
+        lo, hi = self.controls_panel.get_btree_range()
+        keys = list(self.b_tree.iter_range(lo, hi))
+        self.update_display(f"区间 [{lo}, {hi}] 内的键: {', '.join(map(str, keys)) or '无'}")
+
+    def clear_btree(self):
+        """清空B树"""
+        self.close_btree_pages()
+        if hasattr(self, 'unified_animation_controller'):
+            self.unified_animation_controller.add_operation(
+                'btree_clear',
+                {}
+            )
+            self.status_bar.showMessage(f"已添加清空操作，请使用'下一步'按钮单步执行")
+        else:
+            self.b_tree.clear()
+            self.update_display("B树已清空")
+
+    def change_btree_variant(self, *args):
+        """切换 B树/B+树 或最小度数，保留现有键并重新装载"""
+        self.close_btree_pages()
+        keys = self.b_tree.inorder_traversal()
+        plus = self.controls_panel.is_btree_plus()
+        self.b_tree = (BPlusTree if plus else BTree)(self.controls_panel.get_btree_min_degree())
+        self.b_tree.bulk_load(keys)
+        self.update_display(f"{'B+树' if plus else 'B树'}，最小度数 t = {self.b_tree.min_degree}")
+
+    def _btree_page_path(self, name):
+        """saves 目录下的页文件路径"""
+        save_dir = os.path.join(os.getcwd(), "saves")
+        os.makedirs(save_dir, exist_ok=True)
+        if not name.endswith('.bpt'):
+            name += '.bpt'
+        return os.path.join(save_dir, name)
+
+    def export_btree_pages(self, name):
+        """把当前B树的键导出为页式B+树文件"""
+        path = self._btree_page_path(name)
+        BPlusPageFile.build(path, self.b_tree.inorder_traversal())
+        return path
+
+    def open_btree_pages(self, name):
+        """以只读方式打开页式B+树文件并显示其上层结构"""
+        self.close_btree_pages()
+        self.b_page_file = BPlusPageFile(self._btree_page_path(name))
+        return self.b_page_file
+
+    def close_btree_pages(self):
+        """关闭页文件，回到内存中的B树"""
+        if self.b_page_file is not None:
+            self.b_page_file.close()
+            self.b_page_file = None
+
+    def avl_order_statistic(self, operation, args):
+        """AVL顺序统计查询（avl_rank / avl_select / avl_count / avl_median）"""
+        if operation == "avl_rank":
+            data = {'value': args[0]}
+        elif operation == "avl_select":
+            data = {'k': args[0]}
+        elif operation == "avl_count":
+            data = {'lo': args[0], 'hi': args[1]}
+        else:
+            data = {}
+
+        if hasattr(self, 'unified_animation_controller'):
+            # 动画演示沿子树大小下降的路径
+            self.unified_animation_controller.add_operation(operation, data)
+            self.status_bar.showMessage(f"已添加查询操作，请使用'下一步'按钮单步执行")
+            return
+
+        if operation == "avl_rank":
+            result = f"小于 {data['value']} 的键有 {self.avl_tree.rank(data['value'])} 个"
+        elif operation == "avl_select":
+            result = f"第 {data['k']} 小的键: {self.avl_tree.select(data['k'])}"
+        elif operation == "avl_count":
+            count = self.avl_tree.count_between(data['lo'], data['hi'])
+            result = f"区间 [{data['lo']}, {data['hi']}] 内的键有 {count} 个"
+        else:
+            result = f"中位数: {self.avl_tree.median()}"
+        self.update_display(f"AVL查询: {result}")
+
     def update_display(self, message=None):
         """更新显示"""
         if message:
@@ -762,6 +1281,37 @@ class MainWindow(QMainWindow):
             self.graphics_view.draw_huffman_tree(self.huffman_tree)
         elif self.current_ds == "AVL树":
             self.graphics_view.draw_avl_tree(self.avl_tree)
+        elif self.current_ds == "红黑树":
+            self.graphics_view.draw_red_black_tree(self.rb_tree)
+        elif self.current_ds == "伸展树":
+            self.graphics_view.draw_splay_tree(self.splay_tree)
+        elif self.current_ds == "B树":
+            self.graphics_view.draw_b_tree(self.b_page_file if self.b_page_file is not None else self.b_tree)
+
+        self._update_tree_stats()
+
+    def _update_tree_stats(self):
+        """在状态栏显示当前树的规模、树高和最小/最大值"""
+        trees = {
+            "二叉树": self.binary_tree,
+            "二叉搜索树": self.bst,
+            "哈夫曼树": self.huffman_tree,
+            "AVL树": self.avl_tree,
+        }
+        tree = trees.get(self.current_ds)
+        if tree is None:
+            self.stats_label.setText("")
+            return
+
+        stats = tree.get_stats()
+        if stats['size'] == 0:
+            self.stats_label.setText("空树")
+            return
+        text = f"数量: {stats['size']}  高度: {stats['height']}"
+        if stats['min'] is not None:  # 由码长表恢复的哈夫曼树没有频率
+            extreme = "频率" if tree is self.huffman_tree else "值"
+            text += f"  最小{extreme}: {stats['min']}  最大{extreme}: {stats['max']}"
+        self.stats_label.setText(text)
 
     def execute_command(self):
         """执行指令"""
@@ -787,22 +1337,40 @@ class MainWindow(QMainWindow):
                     self.linked_list.insert_at_position(position, value)
                     self.update_display(f"指令执行: {command}")
 
-            # 栈指令
+            # 栈指令（push 1 2 3 批量入栈，pop 3 批量出栈）
+            elif parts[0] == "push" and len(parts) > 2:
+                values = [int(x) for x in parts[1:]]
+                self.stack.push_many(values)
+                self.update_display(f"指令执行: {command}")
+
             elif parts[0] == "push" and len(parts) > 1:
                 value = int(parts[1])
                 self.stack.push(value)
                 self.update_display(f"指令执行: {command}")
 
+            elif parts[0] == "pop" and len(parts) > 1:
+                values = self.stack.pop_many(int(parts[1]))
+                self.update_display(f"指令执行: {command}, 出栈: {', '.join(map(str, values))}")
+
             elif parts[0] == "pop":
                 value = self.stack.pop()
                 self.update_display(f"指令执行: {command}, 出栈: {value}")
 
-            # 队列指令
+            # 队列指令（enqueue 1 2 3 批量入队，dequeue 3 批量出队）
+            elif parts[0] == "enqueue" and len(parts) > 2:
+                values = [int(x) for x in parts[1:]]
+                self.queue.enqueue_many(values)
+                self.update_display(f"指令执行: {command}")
+
             elif parts[0] == "enqueue" and len(parts) > 1:
                 value = int(parts[1])
                 self.queue.enqueue(value)
                 self.update_display(f"指令执行: {command}")
 
+            elif parts[0] == "dequeue" and len(parts) > 1:
+                values = self.queue.dequeue_many(int(parts[1]))
+                self.update_display(f"指令执行: {command}, 出队: {', '.join(map(str, values))}")
+
             elif parts[0] == "dequeue":
                 value = self.queue.dequeue()
                 self.update_display(f"指令执行: {command}, 出队: {value}")
@@ -816,6 +1384,19 @@ class MainWindow(QMainWindow):
                 else:
                     self.status_bar.showMessage(f"指令执行失败: {command}")
 
+            elif parts[0] in ("bt_insert_left", "bt_insert_right") and len(parts) > 2:
+                # bt_insert_left <父节点值或id> <值>
+                parent_key = parts[1] if parts[1].startswith("bt_") else int(parts[1])
+                value = int(parts[2])
+                if parts[0] == "bt_insert_left":
+                    success = self.binary_tree.insert_left(parent_key, value)
+                else:
+                    success = self.binary_tree.insert_right(parent_key, value)
+                if success:
+                    self.update_display(f"指令执行: {command}")
+                else:
+                    self.status_bar.showMessage(f"指令执行失败: 父节点不存在或该侧已有子节点: {command}")
+
             # 二叉搜索树指令
             elif parts[0] == "bst_insert" and len(parts) > 1:
                 value = int(parts[1])
@@ -842,6 +1423,20 @@ class MainWindow(QMainWindow):
                 self.huffman_tree.build_from_text(text)
                 self.update_display(f"指令执行: {command}")
 
+            # 文件压缩指令：huffman_compress 源文件 目标文件，huffman_decompress 源文件 目标文件
+            elif parts[0] in ("huffman_compress", "huffman_decompress") and len(parts) > 2:
+                source, target = command.split()[1:3]  # 路径保留原始大小写
+                if parts[0] == "huffman_compress":
+                    self.huffman_tree = HuffmanFile.compress(source, target)
+                else:
+                    self.huffman_tree = HuffmanFile.decompress(source, target)
+                original, compressed = os.path.getsize(source), os.path.getsize(target)
+                if parts[0] == "huffman_decompress":
+                    original, compressed = compressed, original
+                ratio = f"{compressed / original:.1%}" if original else "-"
+                self.update_display(f"指令执行: {command}，原文件 {original} 字节，"
+                                    f"压缩后 {compressed} 字节（{ratio}）")
+
             # AVL树指令
             elif parts[0] == "avl_insert" and len(parts) > 1:
                 value = int(parts[1])
@@ -861,6 +1456,117 @@ class MainWindow(QMainWindow):
                 self.avl_tree.delete(value)
                 self.update_display(f"指令执行: {command}")
 
+            # 红黑树指令
+            elif parts[0] == "rb_insert" and len(parts) > 1:
+                value = int(parts[1])
+                self.rb_tree.insert(value)
+                self.update_display(f"指令执行: {command}")
+
+            elif parts[0] == "rb_search" and len(parts) > 1:
+                value = int(parts[1])
+                node = self.rb_tree.search(value)
+                if node:
+                    self.update_display(f"指令执行: {command}, 找到 {value}")
+                else:
+                    self.update_display(f"指令执行: {command}, 未找到 {value}")
+
+            elif parts[0] == "rb_delete" and len(parts) > 1:
+                value = int(parts[1])
+                self.rb_tree.delete(value)
+                self.update_display(f"指令执行: {command}")
+
+            # 伸展树指令
+            elif parts[0] == "splay_insert" and len(parts) > 1:
+                value = int(parts[1])
+                self.splay_tree.insert(value)
+                self.update_display(f"指令执行: {command}")
+
+            elif parts[0] == "splay_search" and len(parts) > 1:
+                value = int(parts[1])
+                node = self.splay_tree.search(value)
+                if node:
+                    self.update_display(f"指令执行: {command}, 找到 {value}")
+                else:
+                    self.update_display(f"指令执行: {command}, 未找到 {value}")
+
+            elif parts[0] == "splay_delete" and len(parts) > 1:
+                value = int(parts[1])
+                self.splay_tree.delete(value)
+                self.update_display(f"指令执行: {command}")
+
+            # B树指令
+            elif parts[0] == "btree_insert" and len(parts) > 1:
+                self.close_btree_pages()
+                for value in parts[1:]:
+                    self.b_tree.insert(int(value))
+                self.update_display(f"指令执行: {command}")
+
+            elif parts[0] == "btree_search" and len(parts) > 1:
+                self.close_btree_pages()
+                value = int(parts[1])
+                if self.b_tree.search(value):
+                    self.update_display(f"指令执行: {command}, 找到 {value}")
+                else:
+                    self.update_display(f"指令执行: {command}, 未找到 {value}")
+
+            elif parts[0] == "btree_delete" and len(parts) > 1:
+                self.close_btree_pages()
+                self.b_tree.delete(int(parts[1]))
+                self.update_display(f"指令执行: {command}")
+
+            elif parts[0] == "btree_range" and len(parts) > 2:
+                self.close_btree_pages()
+                keys = list(self.b_tree.iter_range(int(parts[1]), int(parts[2])))
+                self.update_display(f"指令执行: {command}, 区间内的键: {', '.join(map(str, keys)) or '无'}")
+
+            # 页式B+树文件指令：bpt_export/bpt_open 文件名，bpt_search x，bpt_range lo hi，bpt_close
+            elif parts[0] == "bpt_export" and len(parts) > 1:
+                path = self.export_btree_pages(parts[1])
+                self.update_display(f"指令执行: 已导出 {self.b_tree.size()} 个键到 {path}")
+
+            elif parts[0] == "bpt_open" and len(parts) > 1:
+                page_file = self.open_btree_pages(parts[1])
+                self.update_display(f"指令执行: 已打开 {page_file.path}，"
+                                    f"{page_file.size()} 个键，高度 {page_file.get_height()}")
+
+            elif parts[0] in ("bpt_search", "bpt_range", "bpt_close"):
+                if self.b_page_file is None:
+                    self.status_bar.showMessage("请先用 bpt_open 打开页文件")
+                elif parts[0] == "bpt_search" and len(parts) > 1:
+                    value = int(parts[1])
+                    found = "找到" if self.b_page_file.search(value) else "未找到"
+                    self.update_display(f"指令执行: {command}, {found} {value}")
+                elif parts[0] == "bpt_range" and len(parts) > 2:
+                    keys = []
+                    total = 0
+                    for key in self.b_page_file.iter_range(int(parts[1]), int(parts[2])):
+                        total += 1
+                        if total <= 50:
+                            keys.append(key)
+                    shown = ', '.join(map(str, keys)) or '无'
+                    if total > len(keys):
+                        shown += f" ...（共 {total} 个）"
+                    self.update_display(f"指令执行: {command}, 区间内的键: {shown}")
+                elif parts[0] == "bpt_close":
+                    self.close_btree_pages()
+                    self.update_display("指令执行: 已关闭页文件")
+
+            # 区间指令：bst_range/avl_range lo hi 列出区间内的键，*_delete_range lo hi 删除区间
+            elif parts[0] in ("bst_range", "avl_range") and len(parts) > 2:
+                tree = self.bst if parts[0] == "bst_range" else self.avl_tree
+                lo, hi = int(parts[1]), int(parts[2])
+                keys = list(tree.iter_range(lo, hi))
+                self.update_display(f"指令执行: {command}, 区间内的键: {', '.join(map(str, keys)) or '无'}")
+
+            elif parts[0] in ("bst_delete_range", "avl_delete_range") and len(parts) > 2:
+                tree = self.bst if parts[0] == "bst_delete_range" else self.avl_tree
+                removed = tree.delete_range(int(parts[1]), int(parts[2]))
+                self.update_display(f"指令执行: {command}, 删除 {removed} 个键")
+
+            # AVL顺序统计指令：avl_rank x / avl_select k / avl_count lo hi / avl_median
+            elif parts[0] in ("avl_rank", "avl_select", "avl_count", "avl_median"):
+                self.avl_order_statistic(parts[0], [int(p) for p in parts[1:]])
+
             elif len(parts) >= 2 and parts[0] == "delete":
                 if "position" in command and len(parts) > 2:
                     position = int(parts[2])
@@ -872,23 +1578,33 @@ class MainWindow(QMainWindow):
                     self.linked_list.clear()
                     self.update_display("指令执行: 清空链表")
                 elif self.current_ds == "栈":
-                    self.stack = Stack()
+                    self.stack = self.create_stack()
                     self.update_display("指令执行: 清空栈")
                 elif self.current_ds == "队列":
-                    self.queue = Queue()
+                    self.queue = self.create_queue()
                     self.update_display("指令执行: 清空队列")
                 elif self.current_ds == "二叉树":
                     self.binary_tree = BinaryTree()
                     self.update_display("指令执行: 清空二叉树")
                 elif self.current_ds == "二叉搜索树":
-                    self.bst = BinarySearchTree()
+                    self.bst = BinarySearchTree(multiset=self.bst.multiset)
                     self.update_display("指令执行: 清空二叉搜索树")
                 elif self.current_ds == "哈夫曼树":
                     self.huffman_tree = HuffmanTree()
                     self.update_display("指令执行: 清空哈夫曼树")
                 elif self.current_ds == "AVL树":
-                    self.avl_tree = AVLTree()
+                    self.avl_tree = AVLTree(multiset=self.avl_tree.multiset)
                     self.update_display("指令执行: 清空AVL树")
+                elif self.current_ds == "红黑树":
+                    self.rb_tree = RedBlackTree()
+                    self.update_display("指令执行: 清空红黑树")
+                elif self.current_ds == "伸展树":
+                    self.splay_tree = SplayTree()
+                    self.update_display("指令执行: 清空伸展树")
+                elif self.current_ds == "B树":
+                    self.close_btree_pages()
+                    self.b_tree.clear()
+                    self.update_display("指令执行: 清空B树")
 
             else:
                 self.status_bar.showMessage(f"未知指令: {command}")
@@ -1314,7 +2030,7 @@ class MainWindow(QMainWindow):
         """动画步骤1"""
         # 获取树的根节点ID
         if self.bst.root:
-            root_id = self.bst.root.data['id']
+            root_id = self.bst.root.uid
             self.graphics_view.highlight_nodes([root_id], QColor(255, 0, 0), "高亮根节点")
             self.status_bar.showMessage("步骤1: 高亮根节点")
 
@@ -1322,7 +2038,7 @@ class MainWindow(QMainWindow):
         """动画步骤2"""
         # 获取左子树节点ID
         if self.bst.root and self.bst.root.left:
-            left_id = self.bst.root.left.data['id']
+            left_id = self.bst.root.left.uid
             self.graphics_view.highlight_nodes([left_id], QColor(0, 255, 0), "高亮左子节点")
             self.status_bar.showMessage("步骤2: 高亮左子节点")
 
@@ -1330,6 +2046,6 @@ class MainWindow(QMainWindow):
         """动画步骤3"""
         # 获取右子树节点ID
         if self.bst.root and self.bst.root.right:
-            right_id = self.bst.root.right.data['id']
+            right_id = self.bst.root.right.uid
             self.graphics_view.highlight_nodes([right_id], QColor(0, 0, 255), "高亮右子节点")
             self.status_bar.showMessage("步骤3: 高亮右子节点")
\ No newline at end of file